@@ -87,6 +87,9 @@ about_company_good_words = []      # (dynamic multiple search) or leave empty as
 # Avoid applying to these companies if they have these bad words in their 'Job Description' section...  (In development)
 bad_words = ["US Citizen","USA Citizen","No C2C", "No Corp2Corp", ".NET", "Embedded Programming", "PHP", "Ruby", "CNC"]                     # (dynamic multiple search) or leave empty as []. Case Insensitive. Ex: ["word_1", "phrase 1", "word word", "polygraph", "US Citizenship", "Security Clearance"]
 
+# Match `bad_words`, `about_company_bad_words` and `about_company_good_words` only as whole words? (False matches anywhere, Eg: "CNC" also matches "CNCF")
+match_whole_words = False          # True or False, Note: True or False are case-sensitive
+
 # Do you have an active Security Clearance? (True for Yes and False for No)
 security_clearance = False         # True or False, Note: True or False are case-sensitive
 
@@ -62,14 +62,41 @@ Note: Currently "openai", "deepseek", "gemini" and "openai-like" api endpoints a
 Most LLMs are compatible with openai, so keeping it as "openai-like" will work.
 '''
 
-# # Yor local embedding model name or other AI Embedding model name
-# llm_embedding_model = "nomic-embed-text-v1.5"
+# Your local embedding model url and name, used to recognize questions asked in other words (Eg: "How many years have you worked with Python?" and "Python experience (years)?")
+llm_embedding_url = ""                   # Leave empty "" for the built-in matcher that needs no model, or an OpenAI compatible url Eg: "http://localhost:1234/v1/", "http://localhost:11434/v1/"
+llm_embedding_model = "nomic-embed-text-v1.5"   # Examples: "nomic-embed-text-v1.5", "text-embedding-3-small"
 
 # Do you want to stream AI output?
 stream_output = False                    # Examples: True or False. (False is recommended for performance, True is recommended for user experience!)
 '''
 Set `stream_output = True` if you want to stream AI output or `stream_output = False` if not.
 '''
+
+# How many questions of a form page can be sent to the AI at the same time?
+ai_max_concurrent_requests = 4           # Only Positive Integers Eg: 1,2,4,... (1 asks one question at a time, lower it if your AI provider rate limits you)
+ai_request_timeout = 60                  # Seconds to wait for one AI answer before giving up on it. Only Positive Numbers Eg: 30,60,120,... (Local models may need more)
+ai_max_retries = 3                       # How many times to retry an AI request that failed for a temporary reason (Eg: rate limit, server overloaded). Only Non Negative Integers Eg: 0,1,3,...
+ai_circuit_breaker_failures = 5          # After this many failures in a row the AI is not called for a while and questions are answered from rules and cached answers. Only Non Negative Integers Eg: 3,5,... (0 never stops calling the AI)
+ai_circuit_breaker_cooldown = 120        # Seconds to wait before trying a failing AI again. Only Positive Numbers Eg: 60,120,300,...
+
+# Limits of your AI plan, requests wait for room instead of failing with rate limit errors
+ai_requests_per_minute = 0               # Only Non Negative Numbers Eg: 0,60,500,... (0 means no limit)
+ai_tokens_per_minute = 0                 # Only Non Negative Numbers Eg: 0,30000,200000,... (0 means no limit)
+ai_rate_limit_file = ""                  # Leave empty "" for limits of this bot alone, or a file path (Eg: "logs/ai_rate_limit.json") to share the limits with other bots and parallel browsers on this PC
+
+# Price of your AI model in USD per 1 million tokens, used to show what a run and an application cost (0 for free or local models)
+ai_price_per_million_input_tokens = 0.0  # Only Non Negative Numbers Eg: 0.15, 2.5,...
+ai_price_per_million_output_tokens = 0.0 # Only Non Negative Numbers Eg: 0.6, 10,...
+
+# For how many hours should an AI answer be reused when the same question comes up again? Answers to questions about the job itself (Eg: "Why do you want to join us?") are only reused for the same job description.
+ai_response_cache_hours = 24             # Only Non Negative Numbers Eg: 0,12,24,... (0 asks the AI every time)
+ai_response_cache_size = 2000            # Maximum number of AI answers kept in memory. Only Non Negative Integers Eg: 500,2000,...
+
+# How long can the job description sent with a question be? Boilerplate (Eg: benefits, equal opportunity statements) is always removed, then only the parts relevant to the question are kept within this many tokens.
+ai_job_description_tokens = 600          # Only Non Negative Integers Eg: 400,600,1000,... (0 sends the whole description without boilerplate)
+
+# While a job's application form is opened, how many of its likely questions (Eg: "Do you have experience with Kubernetes?" for each required skill) should be answered in advance, in one AI request?
+ai_pre_answer_questions = 6              # Only Non Negative Integers Eg: 0,4,6,10,... (0 only asks the AI when a question shows up, more pre-answered questions cost more tokens)
 ##
 
 
@@ -61,6 +61,11 @@ logs_folder_path = "logs/"
 # Set the maximum amount of time allowed to wait between each click in secs
 click_gap = 1                       # Enter max allowed secs to wait approximately. (Only Non Negative Integers Eg: 0,1,2,3,....)
 
+# Do you want the wait between clicks to adapt to how fast LinkedIn responds? It shrinks while pages respond quickly and grows after failed clicks, never exceeding what click_gap allows for too long.
+adaptive_pacing = True              # True or False, Note: True or False are case-sensitive
+pacing_floor = 0.3                  # Minimum secs to wait between clicks when adaptive_pacing is True. (Non Negative Number Eg: 0, 0.3, 0.5, 1,...)
+pacing_jitter = 0.3                 # Random variation added to each wait as a fraction of it, keeps the clicks human-like. (Number from 0 to 1 Eg: 0.2, 0.3,...)
+
 # If you want to see Chrome running then set run_in_background as False (May reduce performance). 
 run_in_background = False           # True or False, Note: True or False are case-sensitive ,   If True, this will make pause_at_failed_question, pause_before_submit and run_in_background as False
 
@@ -70,6 +75,13 @@ disable_extensions = False          # True or False, Note: True or False are cas
 # Run in safe mode. Set this true if chrome is taking too long to open or if you have multiple profiles in browser. This will open chrome in guest profile!
 safe_mode = True                    # True or False, Note: True or False are case-sensitive
 
+# Do you want to block images, fonts, videos, ads and tracking scripts that the bot never reads? Pages load faster and use less data. (Nothing needed for Easy Apply is blocked)
+block_heavy_resources = True        # True or False, Note: True or False are case-sensitive
+extra_blocked_urls = []             # More URL patterns to block, "*" matches anything (Eg: ["*.svg", "*example-tracker.com*"]). Patterns that would block Easy Apply are ignored
+
+# Do you want the bot to read the next job in the background while it fills the current application? Jobs that would be skipped anyway are then skipped without opening them.
+prefetch_next_job = True            # True or False, Note: True or False are case-sensitive
+
 # Do you want scrolling to be smooth or instantaneous? (Can reduce performance if True)
 smooth_scroll = False               # True or False, Note: True or False are case-sensitive
 
@@ -78,10 +90,22 @@ keep_screen_awake = True            # True or False, Note: True or False are cas
 
 # Run in undetected mode to bypass anti-bot protections (Preview Feature, UNSTABLE. Recommended to leave it as False)
 stealth_mode = False               # True or False, Note: True or False are case-sensitive
+driver_cache_folder = "chromedriver_cache/"   # Folder to keep the Chrome Driver of stealth_mode in, it is downloaded again only when Chrome updates
+
+# How many browsers should apply in parallel? Each one runs in the background with its own Chrome profile and takes the next search term from search_terms. 1 means the usual single visible browser.
+parallel_workers = 1                # Enter number of browsers (Only Positive Integers Eg: 1,2,3,....) (Note: More browsers need more RAM, 2 to 4 is a good range)
+worker_profiles_folder = "chrome_profiles/"   # Folder where each parallel browser keeps its own Chrome profile, so it stays logged in between runs
+max_applications_per_minute = 6     # Maximum applications per minute across all parallel browsers, keeps the account safe. (Only Non Negative Integers Eg: 0,4,6,....) 0 means no limit
 
 # Do you want to get alerts on errors related to AI API connection?
 showAiErrorAlerts = False            # True or False, Note: True or False are case-sensitive
 
+# Skills extracted by AI are remembered for jobs with the same description. Do you want to also reuse them for nearly the same descriptions (Eg: same job posted in several locations with small edits)?
+reuse_skills_of_similar_jobs = True # True or False, Note: True or False are case-sensitive
+
+# Questions the rules can't answer are first matched against the answers you gave before, including questions asked in other words (Eg: "How many years have you worked with Python?" and "Python experience (years)?"). How similar must they be to reuse the answer?
+similar_question_threshold = 0.85   # Only Numbers from 0 to 1 Eg: 0.8, 0.85, 0.9,... (0 never reuses answers, higher reuses only very similar questions)
+
 # Use ChatGPT for resume building (Experimental Feature can break the application. Recommended to leave it as False) 
 # use_resume_generator = False       # True or False, Note: True or False are case-sensitive ,   This feature may only work with 'stealth_mode = True'. As ChatGPT website is hosted by CloudFlare which is protected by Anti-bot protections!
 
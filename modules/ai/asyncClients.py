@@ -0,0 +1,192 @@
+"""
+Async Clients Module - One event loop and pooled async clients for all AI requests
+A single asyncio loop runs in a background thread for the whole bot. The sync code hands
+it coroutines and waits for their results, so a page's questions are asked concurrently
+over one keep-alive connection pool instead of a thread and a connection per question
+
+Author: Performance Optimization
+"""
+
+import asyncio
+import re
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Iterable
+
+from config.secrets import llm_api_key, llm_api_url, llm_model, llm_spec, ai_max_concurrent_requests
+from modules.helpers import print_lg, convert_to_json
+from modules.ai.streaming import StreamConsumer
+
+
+# ------------------------------------------------------------------
+# Event Loop (sync facade)
+# ------------------------------------------------------------------
+
+class EventLoopThread:
+    """
+    Runs one asyncio event loop in a background thread for the whole bot
+    Sync code hands coroutines to it and waits for their results, so AI calls can be
+    fanned out from the Selenium thread without a thread per call
+    """
+
+    def __init__(self):
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="AI-event-loop", daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def submit(self, coroutine: Awaitable) -> Future:
+        """Schedule `coroutine` on the loop, returns a `concurrent.futures.Future`"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def run(self, coroutine: Awaitable) -> Any:
+        """Run `coroutine` on the loop and block until it is done, raises what it raises"""
+        return self.submit(coroutine).result()
+
+    def gather(self, coroutines: Iterable[Awaitable]) -> list:
+        """Run all `coroutines` concurrently and block until all are done, exceptions are returned in place of results"""
+        async def gather_all():
+            return await asyncio.gather(*coroutines, return_exceptions=True)
+        return self.run(gather_all())
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._loop.close()
+            self._loop = None
+
+
+_event_loop_thread: EventLoopThread | None = None
+
+
+def get_event_loop_thread() -> EventLoopThread:
+    """Get or create the global AI event loop"""
+    global _event_loop_thread
+    if _event_loop_thread is None:
+        _event_loop_thread = EventLoopThread()
+    return _event_loop_thread
+
+
+# ------------------------------------------------------------------
+# OpenAI-compatible (OpenAI, DeepSeek, Ollama, LM Studio, ...)
+# ------------------------------------------------------------------
+
+def create_async_openai_client(timeout: float, max_connections: int = ai_max_concurrent_requests):
+    """
+    Creates an `AsyncOpenAI` client over one pooled keep-alive HTTP transport
+    Must be called inside the event loop that will use it
+    """
+    import httpx
+    from openai import AsyncOpenAI
+
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=120
+        ),
+        timeout=httpx.Timeout(timeout, connect=10)
+    )
+    # Retries are done by `modules/ai/resilience.py`, SDK retries would multiply them
+    return AsyncOpenAI(api_key=llm_api_key, base_url=llm_api_url.rstrip("/"), http_client=http_client, max_retries=0)
+
+
+async def async_openai_completion(
+    client,
+    messages: list[dict],
+    response_format: dict | None = None,
+    temperature: float = 0.0,
+    stream: bool = False,
+    spec: str = llm_spec,
+    usage: dict | None = None,
+    stop_options: list[str] | None = None
+) -> str | dict:
+    """
+    Async chat completion on an OpenAI-compatible endpoint
+    * `stream` echoes the answer while it is generated
+    * With `stop_options` the answer is streamed (echoed only if `stream`) and cut off as
+      soon as it matches exactly one of them, that option is returned
+    * Fills `usage` with `prompt_tokens` and `completion_tokens` if the endpoint reports them
+    """
+    stop_options = None if response_format else stop_options
+    streamed = stream or bool(stop_options)
+    params = {
+        "model": llm_model,
+        "messages": messages,
+        "temperature": temperature,
+        "stream": streamed
+    }
+    if response_format and spec in {"openai", "openai-like", "deepseek"}:
+        params["response_format"] = response_format
+    if streamed and spec == "openai":
+        params["stream_options"] = {"include_usage": True}
+
+    completion = await client.chat.completions.create(**params)
+
+    def record_usage(reported) -> None:
+        if usage is not None and reported is not None:
+            usage["prompt_tokens"] = reported.prompt_tokens or 0
+            usage["completion_tokens"] = reported.completion_tokens or 0
+
+    if streamed:
+        consumer = StreamConsumer(echo=stream, options=stop_options)
+        async for chunk in completion:
+            record_usage(getattr(chunk, "usage", None))
+            delta = chunk.choices[0].delta if chunk.choices else None
+            if delta and consumer.feed(delta.content):
+                # Closing the response stops the generation, no need to wait for the rest
+                await completion.close()
+                break
+        result = consumer.finish()
+    else:
+        record_usage(completion.usage)
+        result = completion.choices[0].message.content
+
+    if not result:
+        raise ValueError("Empty AI response")
+
+    if response_format:
+        return convert_to_json(result)
+
+    return result
+
+
+# ------------------------------------------------------------------
+# Gemini
+# ------------------------------------------------------------------
+
+async def async_gemini_completion(client, prompt: str, is_json: bool = False, usage: dict | None = None) -> str | dict:
+    """
+    Async Gemini completion through the client's pooled `aio` transport
+    * Fills `usage` with `prompt_tokens` and `completion_tokens`
+    """
+    response = await client.aio.models.generate_content(
+        model=llm_model,
+        contents=prompt
+    )
+
+    metadata = getattr(response, "usage_metadata", None)
+    if usage is not None and metadata is not None:
+        usage["prompt_tokens"] = metadata.prompt_token_count or 0
+        usage["completion_tokens"] = metadata.candidates_token_count or 0
+
+    result = response.text
+    if not result:
+        raise ValueError("Empty response from Gemini")
+
+    if is_json:
+        result = re.sub(r"```json|```", "", result).strip()
+        return convert_to_json(result)
+
+    return result
@@ -0,0 +1,107 @@
+import json
+import re
+from typing import Literal
+
+from modules.helpers import print_lg, convert_to_json
+from modules.option_index import get_option_set
+from modules.ai.prompts import ai_batch_answer_prompt
+
+
+# A question of a form page as `(label, question_type, options)`
+BatchQuestion = tuple[str, Literal["select", "text", "textarea"], list[str] | None]
+
+
+# ------------------------------------------------------------------
+# Prompt
+# ------------------------------------------------------------------
+
+def question_id(index: int) -> str:
+    """
+    Key of the `index`th question in the batch request and response
+    """
+    return f"q{index + 1}"
+
+
+def build_batch_prompt(
+    questions: list[BatchQuestion],
+    user_information_all: str | None = None,
+    job_description: str | None = None
+) -> str:
+    """
+    Builds one prompt asking all `questions` of a page, shared context is sent only once
+    """
+    listed = []
+    for index, (label, question_type, options) in enumerate(questions):
+        entry = {"id": question_id(index), "question": label, "type": question_type}
+        if options:
+            entry["options"] = options
+        listed.append(entry)
+
+    prompt = ai_batch_answer_prompt.format(
+        user_information_all or "",
+        json.dumps(listed, ensure_ascii=False, indent=1)
+    )
+    if job_description:
+        prompt += f"\n\nJOB DESCRIPTION:\n{job_description}"
+    return prompt
+
+
+# ------------------------------------------------------------------
+# Response
+# ------------------------------------------------------------------
+
+def _as_json(response: str | dict | None) -> dict:
+    # `convert_to_json` failures keep the raw text, which may still hold the object
+    if isinstance(response, dict) and "error" in response and isinstance(response.get("data"), str):
+        response = response["data"]
+    if isinstance(response, dict):
+        return response
+    if not isinstance(response, str):
+        return {}
+    response = re.sub(r"```json|```", "", response).strip()
+    # Some models wrap the object in chatter, keep the outermost braces
+    start, end = response.find("{"), response.rfind("}")
+    if start != -1 and end > start:
+        response = response[start:end + 1]
+    result = convert_to_json(response)
+    return result if isinstance(result, dict) else {}
+
+
+def validate_answer(answer, question_type: str, options: list[str] | None) -> str | None:
+    """
+    Returns `answer` as text if it is a usable answer for the question, else None
+    * Answers of select questions are mapped to the exact option they match
+    """
+    if isinstance(answer, list) and len(answer) == 1:
+        answer = answer[0]
+    if isinstance(answer, bool) or not isinstance(answer, (str, int, float)):
+        return None
+    answer = str(answer).strip()
+    if not answer:
+        return None
+    if question_type == "select":
+        if not options:
+            return None
+        if answer in options:
+            return answer
+        return get_option_set(options).match(answer)
+    return answer
+
+
+def parse_batch_answers(response: str | dict | None, questions: list[BatchQuestion]) -> list[str | None]:
+    """
+    Parses the keyed JSON response of a batch request
+    * Returns the answers in the order of `questions`, None for every missing or invalid answer
+    """
+    data = _as_json(response)
+    if not data or ("error" in data and not any(question_id(i) in data for i in range(len(questions)))):
+        print_lg("Batch AI response could not be parsed!", data.get("error", "") if data else "")
+        return [None] * len(questions)
+
+    answers = []
+    for index, (label, question_type, options) in enumerate(questions):
+        answer = validate_answer(data.get(question_id(index)), question_type, options)
+        if answer is None:
+            print_lg(f'Batch AI answer for "{label}" is missing or invalid.')
+        answers.append(answer)
+    return answers
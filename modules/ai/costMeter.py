@@ -0,0 +1,50 @@
+"""
+Cost Meter Module - Counts the tokens and cost of AI requests
+Records prompt and completion tokens of every request (estimated when the provider
+doesn't report them) and prices them per million tokens. Totals are handed to the
+`PerformanceMonitor` for the summary of the run
+
+Author: Performance Optimization
+"""
+
+from threading import Lock
+from typing import Dict
+
+from modules.performance_monitor import get_monitor
+
+
+class CostMeter:
+    """Token and cost totals of the AI requests of this run"""
+
+    def __init__(self, input_price_per_million: float, output_price_per_million: float):
+        self.input_price = input_price_per_million / 1_000_000
+        self.output_price = output_price_per_million / 1_000_000
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.estimated_calls = 0
+        self.cost = 0.0
+        self._lock = Lock()
+
+    def record(self, prompt_tokens: int, completion_tokens: int, estimated: bool = False) -> float:
+        """
+        Record the usage of one request
+
+        Returns:
+            Cost of the request
+        """
+        cost = prompt_tokens * self.input_price + completion_tokens * self.output_price
+        with self._lock:
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+            self.estimated_calls += estimated
+            self.cost += cost
+        get_monitor().log_ai_usage(prompt_tokens, completion_tokens, cost)
+        return cost
+
+    def get_stats(self) -> Dict:
+        return {
+            'prompt_tokens': self.prompt_tokens,
+            'completion_tokens': self.completion_tokens,
+            'estimated_calls': self.estimated_calls,
+            'cost': self.cost,
+        }
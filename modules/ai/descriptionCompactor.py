@@ -0,0 +1,184 @@
+"""
+Description Compactor Module - Shrinks job descriptions before they are sent to the AI
+Boilerplate (equal opportunity statements, benefits lists, privacy notices) is removed,
+repeated sentences are dropped, and only the parts relevant to the question are kept
+within a token budget. The cleaned description is computed once per job and reused by
+every question of that job
+
+Author: Performance Optimization
+"""
+
+import re
+from collections import OrderedDict
+from hashlib import sha256
+from math import ceil
+from threading import Lock
+from typing import Dict, List, Optional, Set, Tuple
+
+from config.secrets import ai_job_description_tokens
+from modules.helpers import print_lg
+
+
+# Headings that start a section with nothing useful for answering questions
+BOILERPLATE_HEADING = re.compile(
+    r"^\W*(benefits|perks|what we offer|why (join|work)|our benefits|compensation (and|&) benefits|"
+    r"equal (employment )?opportunity|eeo|diversity|privacy|accommodation|e-verify|disclaimer)\b.{0,40}$",
+    re.IGNORECASE
+)
+# Sentences that are boilerplate wherever they show up
+BOILERPLATE_SENTENCE = re.compile(
+    r"equal (employment )?opportunity|without regard to|race, colou?r|sexual orientation|gender identity|"
+    r"veteran status|reasonable accommodation|e-verify|applicant privacy|privacy (notice|policy)|"
+    r"401\(?k\)?|paid time off|\bpto\b|dental|vision insurance|health insurance|parental leave|"
+    r"we are an? (proud )?equal|fraudulent|recruitment scam",
+    re.IGNORECASE
+)
+HEADING = re.compile(
+    r"^\W*([A-Z][\w '&/,-]{0,50}:|(about|responsibilities|requirements|qualifications|what you|who you|"
+    r"you will|your role|the role|skills|nice to have|preferred|overview|job description)\b.{0,40})\s*$",
+    re.IGNORECASE
+)
+SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9])")
+WORD = re.compile(r"[a-z0-9+#]+")
+STOP_WORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "do", "does", "for", "from", "have", "how",
+    "i", "if", "in", "is", "it", "many", "of", "on", "or", "our", "please", "the", "this", "to", "we",
+    "what", "when", "which", "will", "with", "you", "your", "years", "year", "experience",
+}
+LEAD_UNITS = 2      # The opening lines usually summarize the role, they are always kept
+
+
+def estimate_tokens(text: str) -> int:
+    """Fast local estimate of the tokens of `text` (~4 characters or ~0.75 words per token)"""
+    return max(ceil(len(text) / 4), ceil(len(text.split()) / 0.75)) if text else 0
+
+
+def keywords(text: str) -> Set[str]:
+    """Lowercase words of `text` that carry meaning"""
+    return {word for word in WORD.findall(text.lower()) if word not in STOP_WORDS and len(word) > 1}
+
+
+def clean_units(description: str) -> List[str]:
+    """
+    Split `description` into sentences without boilerplate sections, boilerplate sentences and repeats
+    """
+    units: List[str] = []
+    seen: Set[str] = set()
+    skipping = False
+    for line in description.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if HEADING.match(line) or BOILERPLATE_HEADING.match(line):
+            skipping = bool(BOILERPLATE_HEADING.match(line))
+            if skipping:
+                continue
+        elif skipping:
+            continue
+        for sentence in SENTENCE_SPLIT.split(line):
+            normalized = " ".join(WORD.findall(sentence.lower()))
+            if not normalized or normalized in seen or BOILERPLATE_SENTENCE.search(sentence):
+                continue
+            seen.add(normalized)
+            units.append(sentence)
+    return units
+
+
+class DescriptionCompactor:
+    """Compacts job descriptions to a token budget, caching the cleaned description per job"""
+
+    def __init__(self, token_budget: int, max_jobs: int = 16):
+        """
+        Args:
+            token_budget: Max estimated tokens of a compacted description, 0 keeps the whole cleaned description
+            max_jobs: Number of recent jobs whose cleaned descriptions are kept
+        """
+        self.token_budget = token_budget
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, Tuple[List[str], List[Set[str]], List[int]]]" = OrderedDict()
+        self._selections: Dict[Tuple[str, frozenset, int], str] = {}
+        # Skills are extracted on the Selenium thread while answers are prepared on the AI event loop thread
+        self._lock = Lock()
+        self.original_tokens = 0
+        self.compacted_tokens = 0
+
+    def _units(self, description: str) -> Tuple[str, List[str], List[Set[str]], List[int]]:
+        fingerprint = sha256(description.encode()).hexdigest()
+        with self._lock:
+            job = self._jobs.get(fingerprint)
+            if job is not None:
+                self._jobs.move_to_end(fingerprint)
+                return (fingerprint, *job)
+        units = clean_units(description)
+        job = (units, [keywords(unit) for unit in units], [estimate_tokens(unit) for unit in units])
+        with self._lock:
+            self._jobs[fingerprint] = job
+            if len(self._jobs) > self.max_jobs:
+                old_fingerprint, _ = self._jobs.popitem(last=False)
+                self._selections = {key: value for key, value in self._selections.items() if key[0] != old_fingerprint}
+        return (fingerprint, *job)
+
+    def compact(self, description: Optional[str], question: Optional[str] = None, token_budget: Optional[int] = None) -> Optional[str]:
+        """
+        Get the parts of `description` relevant to `question` within the token budget
+
+        Without a `question` the cleaned description is kept in order up to the budget
+        """
+        if not description:
+            return description
+        budget = self.token_budget if token_budget is None else token_budget
+        fingerprint, units, unit_keywords, unit_tokens = self._units(description)
+        question_keywords = frozenset(keywords(question)) if question else frozenset()
+        key = (fingerprint, question_keywords, budget)
+        with self._lock:
+            compacted = self._selections.get(key)
+        if compacted is None:
+            compacted = self._select(units, unit_keywords, unit_tokens, question_keywords, budget)
+        with self._lock:
+            self._selections[key] = compacted
+            self.original_tokens += estimate_tokens(description)
+            self.compacted_tokens += estimate_tokens(compacted)
+        return compacted
+
+    def _select(self, units: List[str], unit_keywords: List[Set[str]], unit_tokens: List[int], question_keywords: frozenset, budget: int) -> str:
+        chosen = list(range(len(units)))
+        if budget and sum(unit_tokens) > budget:
+            scores = [len(question_keywords & words) for words in unit_keywords]
+            # Lead lines first, then the most relevant ones, or the rest in order if nothing is relevant
+            ranked = list(range(min(LEAD_UNITS, len(units))))
+            ranked += sorted((i for i in range(len(units)) if i >= LEAD_UNITS and scores[i]), key=lambda i: -scores[i])
+            if not any(scores):
+                ranked += [i for i in range(LEAD_UNITS, len(units))]
+            chosen, used = [], 0
+            for index in ranked:
+                if used + unit_tokens[index] > budget:
+                    continue
+                chosen.append(index)
+                used += unit_tokens[index]
+            chosen.sort()
+
+        return "\n".join(units[index] for index in chosen)
+
+    def get_stats(self) -> Dict:
+        return {
+            'original_tokens': self.original_tokens,
+            'compacted_tokens': self.compacted_tokens,
+            'saved_ratio': (1 - self.compacted_tokens / self.original_tokens) if self.original_tokens else 0.0,
+        }
+
+    def report(self) -> None:
+        stats = self.get_stats()
+        if stats['original_tokens']:
+            print_lg(f"Job descriptions compacted by {stats['saved_ratio']:.0%} (~{stats['original_tokens']} to ~{stats['compacted_tokens']} tokens)")
+
+
+# Global compactor instance
+_compactor: Optional[DescriptionCompactor] = None
+
+
+def get_description_compactor() -> DescriptionCompactor:
+    """Get or create global description compactor instance"""
+    global _compactor
+    if _compactor is None:
+        _compactor = DescriptionCompactor(ai_job_description_tokens)
+    return _compactor
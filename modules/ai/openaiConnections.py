@@ -1,11 +1,9 @@
-from typing import Literal
-from openai import OpenAI
-from pyautogui import confirm
+from openai import AsyncOpenAI
 
 from config.secrets import *
 from config import settings
-from modules.helpers import print_lg, critical_error_log, convert_to_json
-from modules.ai.prompts import *
+from modules.helpers import print_lg, critical_error_log, confirm
+from modules.ai.asyncClients import get_event_loop_thread, create_async_openai_client
 
 
 # ------------------------------------------------------------------
@@ -31,9 +29,9 @@ def ai_error_alert(message: str, error: Exception, title: str = "AI Error") -> N
 # Client
 # ------------------------------------------------------------------
 
-def ai_create_openai_client() -> OpenAI | None:
+def ai_create_openai_client() -> AsyncOpenAI | None:
     """
-    Creates OpenAI / OpenAI-compatible client
+    Creates the pooled async OpenAI / OpenAI-compatible client on the shared AI event loop
     """
     try:
         if not use_AI:
@@ -42,16 +40,11 @@ def ai_create_openai_client() -> OpenAI | None:
         if not llm_api_key or "YOUR_API_KEY" in llm_api_key:
             raise ValueError("Invalid API key")
 
-        base_url = llm_api_url.rstrip("/")
-
         print_lg("Creating OpenAI client...")
-        client = OpenAI(api_key=llm_api_key, base_url=base_url)
-
-        # lightweight validation
-        client.models.list()
+        client = get_event_loop_thread().run(acreate_validated_client())
 
         print_lg("---- OPENAI CLIENT READY ----")
-        print_lg(f"API URL : {base_url}")
+        print_lg(f"API URL : {llm_api_url.rstrip('/')}")
         print_lg(f"Model   : {llm_model}")
         print_lg("--------------------------------")
 
@@ -62,143 +55,37 @@ def ai_create_openai_client() -> OpenAI | None:
         return None
 
 
-def ai_close_openai_client(client: OpenAI) -> None:
+async def acreate_validated_client() -> AsyncOpenAI:
     """
-    Safely closes client
+    Creates the async client inside the event loop that will use it, so its pooled
+    connections belong to that loop, and validates it with a lightweight request
     """
+    client = create_async_openai_client(ai_request_timeout)
     try:
-        if client:
-            client.close()
-    except Exception as e:
-        ai_error_alert("Failed to close OpenAI client", e)
-
-
-# ------------------------------------------------------------------
-# Completion
-# ------------------------------------------------------------------
-
-def ai_completion(
-    client: OpenAI,
-    messages: list[dict],
-    response_format: dict | None = None,
-    temperature: float = 0.0,
-    stream: bool = stream_output
-) -> str | dict:
-    """
-    Core chat completion wrapper
-    """
-    if not client:
-        raise ValueError("OpenAI client not initialized")
-
-    try:
-        params = {
-            "model": llm_model,
-            "messages": messages,
-            "temperature": temperature,
-            "stream": stream
-        }
-
-        if response_format and llm_spec in {"openai", "openai-like"}:
-            params["response_format"] = response_format
-
-        print_lg("Calling AI completion...")
-        completion = client.chat.completions.create(**params)
-
-        result = ""
-
-        if stream:
-            print_lg("-- STREAM START --")
-            for chunk in completion:
-                delta = chunk.choices[0].delta
-                if delta and delta.content:
-                    result += delta.content
-                    print_lg(delta.content, end="", flush=True)
-            print_lg("\n-- STREAM END --")
-        else:
-            result = completion.choices[0].message.content
-
-        if not result:
-            raise ValueError("Empty AI response")
-
-        if response_format:
-            return convert_to_json(result)
-
-        return result
-
-    except Exception as e:
-        ai_error_alert("AI completion failed", e)
+        await client.models.list()
+    except Exception:
+        await client.close()
         raise
+    return client
 
 
-# ------------------------------------------------------------------
-# Skill Extraction
-# ------------------------------------------------------------------
-
-def ai_extract_skills(
-    client: OpenAI,
-    job_description: str,
-    stream: bool = stream_output
-) -> dict:
+async def ai_close_openai_client(client: AsyncOpenAI) -> None:
     """
-    Extracts skills from job description
+    Safely closes client, on the event loop that created it
     """
     try:
-        print_lg("Extracting skills...")
-        prompt = extract_skills_prompt.format(job_description)
-        messages = [{"role": "user", "content": prompt}]
-
-        return ai_completion(
-            client,
-            messages,
-            response_format=extract_skills_response_format,
-            stream=stream
-        )
-
+        if client:
+            await client.close()
     except Exception as e:
-        ai_error_alert("Skill extraction failed", e)
-        return {"error": str(e)}
+        ai_error_alert("Failed to close OpenAI client", e)
 
 
 # ------------------------------------------------------------------
-# Question Answering
+# Requests
 # ------------------------------------------------------------------
 
-def ai_answer_question(
-    client: OpenAI,
-    question: str,
-    options: list[str] | None = None,
-    question_type: Literal["text", "textarea", "single_select", "multiple_select"] = "text",
-    job_description: str | None = None,
-    about_company: str | None = None,
-    user_information_all: str | None = None,
-    stream: bool = stream_output
-) -> str | dict:
-    """
-    Answers application questions
-    """
-    try:
-        print_lg("Answering question with AI...")
-        prompt = ai_answer_prompt.format(user_information_all or "N/A", question)
-
-        if options and question_type in {"single_select", "multiple_select"}:
-            prompt += "\n\nOPTIONS:\n" + "\n".join(f"- {o}" for o in options)
-            prompt += (
-                "\n\nSelect EXACTLY ONE option."
-                if question_type == "single_select"
-                else "\n\nSelect ALL applicable options."
-            )
-
-        if job_description:
-            prompt += f"\n\nJOB DESCRIPTION:\n{job_description}"
-        if about_company:
-            prompt += f"\n\nABOUT COMPANY:\n{about_company}"
-
-        messages = [{"role": "user", "content": prompt}]
-        return ai_completion(client, messages, stream=stream)
-
-    except Exception as e:
-        ai_error_alert("Question answering failed", e)
-        return {"error": str(e)}
+# Completions, skill extraction and question answering of every backend go through
+# `modules/ai/providers.py`, this module only creates and closes the client
 
 
 # ------------------------------------------------------------------
@@ -0,0 +1,39 @@
+from typing import Literal
+
+from modules.ai.prompts import ai_answer_prompt
+
+
+# ------------------------------------------------------------------
+# Question Answering
+# ------------------------------------------------------------------
+
+def build_answer_prompt(
+    question: str,
+    options: list[str] | None = None,
+    question_type: Literal[
+        "text", "textarea", "select", "single_select", "multiple_select"
+    ] = "text",
+    job_description: str | None = None,
+    about_company: str | None = None,
+    user_information_all: str | None = None
+) -> str:
+    """
+    Builds the prompt to answer one application question, shared by every AI provider
+    """
+    prompt = ai_answer_prompt.format(user_information_all or "N/A", question)
+
+    if options and question_type in {"select", "single_select", "multiple_select"}:
+        prompt += "\n\nOPTIONS:\n" + "\n".join(f"- {o}" for o in options)
+        prompt += (
+            "\n\nSelect ALL applicable options."
+            if question_type == "multiple_select"
+            else "\n\nSelect EXACTLY ONE option."
+        )
+
+    if job_description:
+        prompt += f"\n\nJOB DESCRIPTION:\n{job_description}"
+
+    if about_company:
+        prompt += f"\n\nABOUT COMPANY:\n{about_company}"
+
+    return prompt
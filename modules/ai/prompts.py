@@ -127,3 +127,36 @@ QUESTION:
 {}
 """
 
+
+
+##> Batched Form Question Answering
+
+# Message format = [{"role": "user", "content": ai_batch_answer_prompt}]
+
+ai_batch_answer_prompt = """
+You are an AI assistant completing form responses in a natural, human-like manner.
+Answer EVERY question listed below, following these rules strictly:
+
+1. If the question asks for years of experience, duration, or any numeric value, ALWAYS answer with 2.
+2. If the explicitly requested experience is greater, answer with the required years or 2, emphasizing you have solid practical knowledge.
+3. If the question is a Yes/No question, answer ONLY "Yes" or "No".
+4. For "select" questions, answer with EXACTLY one of the given options, copied verbatim.
+5. For "text" questions, answer with a single short line.
+6. For "textarea" questions, provide a structured and human-like response within 350 characters.
+7. Do NOT repeat or restate the questions.
+8. NEVER say you have "limited experience" or "no experience". Always answer affirmatively that you have 2 years of real-world, hands-on experience in the specific tool, skill, or field asked in the question.
+9. Use the provided user information when relevant.
+
+Return ONLY a valid JSON object mapping every question id to its answer, without any additional text:
+{{"q1": "answer", "q2": "answer"}}
+
+USER INFORMATION:
+{}
+
+QUESTIONS:
+{}
+"""
+"""
+Use `ai_batch_answer_prompt.format(user_information_all, questions_json)`, `questions_json` lists objects of `id`, `question`, `type` and `options`
+"""
+#<
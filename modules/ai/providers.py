@@ -0,0 +1,340 @@
+"""
+AI Providers Module - One interface for every AI backend
+The backend is chosen once at startup, call sites then only talk to an `AIProvider` and
+never branch on `ai_provider` again. Every request of every backend passes through
+`BaseAIProvider.acomplete()`, the one place to add caching, concurrency limits, retries,
+token accounting and latency metrics
+
+Author: Performance Optimization
+"""
+
+import asyncio
+import json
+import time
+from typing import Dict, List, Optional, Protocol
+
+from config.secrets import stream_output, llm_model, llm_spec, ai_max_concurrent_requests, ai_request_timeout, ai_response_cache_hours, ai_response_cache_size, \
+    ai_max_retries, ai_circuit_breaker_failures, ai_circuit_breaker_cooldown, ai_requests_per_minute, ai_tokens_per_minute, ai_rate_limit_file, \
+    ai_price_per_million_input_tokens, ai_price_per_million_output_tokens, ai_pre_answer_questions
+from config.settings import similar_question_threshold
+from modules.helpers import print_lg, critical_error_log
+from modules.skills_cache import get_skills_cache
+from modules.ai.prompts import extract_skills_prompt, deepseek_extract_skills_prompt, extract_skills_response_format
+from modules.ai.promptBuilder import build_answer_prompt
+from modules.ai.batchAnswers import BatchQuestion, build_batch_prompt, parse_batch_answers
+from modules.ai.responseCache import ResponseCache
+from modules.ai.descriptionCompactor import get_description_compactor, estimate_tokens
+from modules.ai.rateLimiter import RateLimiter
+from modules.ai.costMeter import CostMeter
+from modules.ai.streaming import early_stop_options
+from modules.ai.speculativeAnswers import SpeculativeAnswers, predict_questions
+from modules.ai.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+from modules.ai.asyncClients import get_event_loop_thread, async_openai_completion, async_gemini_completion
+
+
+JSON_OBJECT = {"type": "json_object"}
+COMPLETION_TOKENS_ESTIMATE = 200    # Reserved for the answer before a request is sent, corrected once the usage is known
+
+# SDKs are imported where they are used, only the SDK of the chosen provider has to be installed
+
+
+class AIProvider(Protocol):
+    """What the bot needs from an AI backend"""
+
+    name: str
+
+    def extract_skills(self, job_description: str) -> Dict: ...
+
+    def answer_question(self, question: str, options: Optional[List[str]] = None, question_type: str = "text",
+                        job_description: Optional[str] = None, about_company: Optional[str] = None) -> str | Dict: ...
+
+    def answer_questions(self, questions: List[BatchQuestion], job_description: Optional[str] = None) -> List[Optional[str]]: ...
+
+    def answer_all(self, questions: List[BatchQuestion], job_description: Optional[str] = None) -> List[str | Dict | None]: ...
+
+    def pre_answer(self, skills: Dict, job_description: str) -> None: ...
+
+    def close(self) -> None: ...
+
+    def report(self) -> None: ...
+
+
+class BaseAIProvider:
+    """
+    Shared prompt assembly and request bookkeeping, backends only implement `_acomplete()`
+
+    Requests run on one background event loop (`modules/ai/asyncClients.py`), the sync
+    methods are facades over it, so a page's questions are fanned out without threads
+    """
+
+    name = "ai"
+    skills_prompt = extract_skills_prompt
+    skills_response_format: Optional[Dict] = JSON_OBJECT
+
+    def __init__(self, client, user_information_all: Optional[str] = None):
+        self.client = client
+        self.user_information_all = user_information_all
+        self.loop = get_event_loop_thread()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.retry_policy = RetryPolicy(ai_max_retries, CircuitBreaker(ai_circuit_breaker_failures, ai_circuit_breaker_cooldown), self.name)
+        self.rate_limiter = RateLimiter(ai_requests_per_minute, ai_tokens_per_minute, ai_rate_limit_file)
+        self.cost_meter = CostMeter(ai_price_per_million_input_tokens, ai_price_per_million_output_tokens)
+        self.calls = 0
+        self.failures = 0
+        self.seconds = 0.0
+        self.responses = ResponseCache(
+            ai_response_cache_hours * 3600,
+            ai_response_cache_size,
+            context=f"{self.name}|{llm_model}|{user_information_all or ''}"
+        )
+        self.speculation = SpeculativeAnswers(similar_question_threshold, ai_request_timeout)
+
+    async def _acomplete(self, prompt: str, response_format: Optional[Dict], temperature: float, stream: bool, usage: Dict,
+                         stop_options: Optional[List[str]] = None) -> str | Dict:
+        """
+        Send one request, fill `usage` with `prompt_tokens` and `completion_tokens` if the backend reports them
+        Backends that stream may stop as soon as the answer matches exactly one of `stop_options`
+        """
+        raise NotImplementedError
+
+    async def _attempt(self, prompt: str, response_format: Optional[Dict], temperature: float, stream: bool, stop_options: Optional[List[str]]) -> str | Dict:
+        """One rate limited, metered and timed out attempt of a request"""
+        reserved = estimate_tokens(prompt) + COMPLETION_TOKENS_ESTIMATE
+        await self.rate_limiter.acquire(reserved)
+        usage: Dict = {}
+        result = await asyncio.wait_for(self._acomplete(prompt, response_format, temperature, stream, usage, stop_options), ai_request_timeout)
+        if usage:
+            prompt_tokens, completion_tokens = usage["prompt_tokens"], usage["completion_tokens"]
+        else:
+            prompt_tokens = estimate_tokens(prompt)
+            completion_tokens = estimate_tokens(result if isinstance(result, str) else json.dumps(result))
+        self.cost_meter.record(prompt_tokens, completion_tokens, estimated=not usage)
+        await self.rate_limiter.adjust(reserved, prompt_tokens + completion_tokens)
+        return result
+
+    async def _aclose(self) -> None:
+        pass
+
+    async def acomplete(self, prompt: str, response_format: Optional[Dict] = None, temperature: float = 0.0, stream: bool = stream_output,
+                        stop_options: Optional[List[str]] = None) -> str | Dict:
+        """
+        Send `prompt` to the backend, returns text or parsed JSON if `response_format` is given
+        * At most `ai_max_concurrent_requests` requests are in flight, each attempt times out after `ai_request_timeout` secs
+        * Requests wait for room in the requests and tokens per minute limits, their tokens and cost are recorded
+        * Transient failures are retried with backoff, a provider that keeps failing is not called during its cool-down
+        * With `stop_options` the answer may end as soon as it matches exactly one of them
+        * Raises on failure, `CircuitOpenError` right away while the circuit is open
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(ai_max_concurrent_requests)
+        async with self._semaphore:
+            started = time.perf_counter()
+            self.calls += 1
+            try:
+                return await self.retry_policy.call(lambda: self._attempt(prompt, response_format, temperature, stream, stop_options))
+            except Exception:
+                self.failures += 1
+                raise
+            finally:
+                self.seconds += time.perf_counter() - started
+
+    def complete(self, prompt: str, response_format: Optional[Dict] = None, temperature: float = 0.0, stream: bool = stream_output) -> str | Dict:
+        """Blocking version of `acomplete()`"""
+        return self.loop.run(self.acomplete(prompt, response_format, temperature, stream))
+
+    def extract_skills(self, job_description: str) -> Dict:
+        try:
+            # Reposted jobs and jobs posted in many locations share their description
+            skills = get_skills_cache().get(job_description)
+            if skills is not None:
+                print_lg("Using cached skills of this job description.")
+                return skills
+            print_lg(f"Extracting skills using {self.name}...")
+            # Skills may be listed anywhere, only boilerplate and repeats are removed
+            cleaned = get_description_compactor().compact(job_description, token_budget=0)
+            skills = self.complete(self.skills_prompt.format(cleaned), response_format=self.skills_response_format)
+            if isinstance(skills, (dict, list)) and not (isinstance(skills, dict) and "error" in skills):
+                get_skills_cache().set(job_description, skills)
+            return skills
+        except CircuitOpenError as e:
+            return {"error": str(e)}
+        except Exception as e:
+            critical_error_log("Skill extraction failed", e)
+            return {"error": str(e)}
+
+    async def aanswer_question(self, question: str, options: Optional[List[str]] = None, question_type: str = "text",
+                               job_description: Optional[str] = None, about_company: Optional[str] = None, stream: bool = stream_output) -> str | Dict:
+        try:
+            context = "\n".join(filter(None, [job_description, about_company]))
+            cached = self.responses.get(question, question_type, options, context)
+            if cached is not None:
+                print_lg(f'Reusing AI answer for "{question}"')
+                return cached
+            print_lg(f"Answering question: {question}")
+            job_description = get_description_compactor().compact(job_description, question)
+            prompt = build_answer_prompt(question, options, question_type, job_description, about_company, self.user_information_all)
+            # Select and radio answers are known from their first tokens
+            stop_options = early_stop_options(question_type, options)
+            answer = await self.acomplete(prompt, temperature=0.1, stream=stream, stop_options=stop_options)
+            self.responses.set(question, question_type, options, context, answer)
+            return answer
+        except CircuitOpenError as e:
+            return {"error": str(e)}
+        except Exception as e:
+            critical_error_log("Question answering failed", e)
+            return {"error": str(e)}
+
+    def answer_question(self, question: str, options: Optional[List[str]] = None, question_type: str = "text",
+                        job_description: Optional[str] = None, about_company: Optional[str] = None) -> str | Dict:
+        return self.loop.run(self.aanswer_question(question, options, question_type, job_description, about_company))
+
+    async def aanswer_questions(self, questions: List[BatchQuestion], job_description: Optional[str] = None) -> List[Optional[str]]:
+        """
+        Answers all `questions` in one JSON request
+        Returns the answers in the order of `questions`, None where the answer was missing or invalid
+        """
+        answers = [self.responses.get(*question, job_description) for question in questions]
+        missing = [index for index, answer in enumerate(answers) if answer is None]
+        if not missing:
+            return answers
+        try:
+            asked = [questions[index] for index in missing]
+            print_lg(f"Answering {len(asked)} questions with one {self.name} request...")
+            compacted = get_description_compactor().compact(job_description, " ".join(label for label, _, _ in asked))
+            prompt = build_batch_prompt(asked, self.user_information_all, compacted)
+            response = await self.acomplete(prompt, response_format=JSON_OBJECT, stream=False)
+            for index, answer in zip(missing, parse_batch_answers(response, asked)):
+                answers[index] = answer
+                if answer is not None:
+                    self.responses.set(*questions[index], job_description, answer)
+        except CircuitOpenError:
+            pass
+        except Exception as e:
+            critical_error_log("Batch question answering failed", e)
+        return answers
+
+    def answer_questions(self, questions: List[BatchQuestion], job_description: Optional[str] = None) -> List[Optional[str]]:
+        return self.loop.run(self.aanswer_questions(questions, job_description))
+
+    def pre_answer(self, skills: Dict, job_description: str) -> None:
+        """
+        Start answering the questions the form of this job likely asks (Eg: experience with each
+        required skill) in the background, `answer_all()` then finds them ready
+        """
+        self.speculation.clear()
+        if not ai_pre_answer_questions or not similar_question_threshold or self.retry_policy.breaker.is_open:
+            return
+        questions = predict_questions(skills, ai_pre_answer_questions)
+        if questions:
+            self.speculation.start(job_description, questions, self.loop.submit(self.aanswer_questions(questions, job_description)))
+
+    def answer_all(self, questions: List[BatchQuestion], job_description: Optional[str] = None) -> List[str | Dict | None]:
+        """
+        Answers all `questions` of a page
+        * Questions answered in advance for this job by `pre_answer()` are taken from memory
+        * Several questions go in one batched request, the ones it leaves unanswered are asked
+          one by one concurrently on the event loop
+        * Returns the answers in the order of `questions`, None where the AI failed
+        """
+        answers: List[str | Dict | None] = [self.speculation.get(*question, job_description) for question in questions]
+        asked = [index for index, answer in enumerate(answers) if answer is None]
+        if len(asked) == 1:
+            label, question_type, options = questions[asked[0]]
+            answers[asked[0]] = self.answer_question(label, options, question_type, job_description)
+            return answers
+        if asked:
+            for index, answer in zip(asked, self.answer_questions([questions[index] for index in asked], job_description)):
+                answers[index] = answer
+        missing = [index for index in asked if answers[index] is None]
+        if missing and self.retry_policy.breaker.is_open:
+            print_lg(f"{self.name} is unavailable, using rule and cached fallbacks for {len(missing)} questions.")
+        elif missing:
+            # Streams of concurrent answers would interleave in the log
+            results = self.loop.gather(
+                self.aanswer_question(questions[index][0], questions[index][2], questions[index][1], job_description, stream=False)
+                for index in missing
+            )
+            for index, result in zip(missing, results):
+                answers[index] = None if isinstance(result, BaseException) else result
+        return answers
+
+    def close(self) -> None:
+        self.speculation.clear()
+        try:
+            self.loop.run(self._aclose())
+        finally:
+            self.loop.stop()
+            self._semaphore = None
+
+    def get_stats(self) -> Dict:
+        return {
+            "provider": self.name,
+            "calls": self.calls,
+            "failures": self.failures,
+            "average_seconds": (self.seconds / self.calls) if self.calls else 0.0,
+            **self.retry_policy.get_stats(),
+            **self.cost_meter.get_stats(),
+        }
+
+    def report(self) -> None:
+        if self.calls:
+            stats = self.get_stats()
+            print_lg(f"AI ({self.name}): {stats['calls']} requests, {stats['failures']} failed, {stats['average_seconds']:.1f}s average, {stats['retries']} retries, unavailable {stats['circuit_opened']} times ({stats['short_circuited']} requests skipped)")
+        self.rate_limiter.report()
+        self.responses.report()
+        self.speculation.report()
+        get_skills_cache().report()
+        get_description_compactor().report()
+
+
+class OpenAIProvider(BaseAIProvider):
+    name = "openai"
+    spec = llm_spec
+    skills_response_format = extract_skills_response_format
+
+    async def _acomplete(self, prompt, response_format, temperature, stream, usage, stop_options=None):
+        return await async_openai_completion(self.client, [{"role": "user", "content": prompt}], response_format, temperature, stream, self.spec, usage, stop_options)
+
+    async def _aclose(self) -> None:
+        from modules.ai.openaiConnections import ai_close_openai_client
+        await ai_close_openai_client(self.client)
+
+
+class DeepSeekProvider(OpenAIProvider):
+    name = "deepseek"
+    spec = "deepseek"
+    skills_prompt = deepseek_extract_skills_prompt
+    skills_response_format = JSON_OBJECT
+
+
+class GeminiProvider(BaseAIProvider):
+    name = "gemini"
+    skills_prompt = extract_skills_prompt + "\n\nRespond ONLY with valid JSON."
+
+    async def _acomplete(self, prompt, response_format, temperature, stream, usage, stop_options=None):
+        return await async_gemini_completion(self.client, prompt, is_json=bool(response_format), usage=usage)
+
+
+def create_ai_provider(provider: str, user_information_all: Optional[str] = None) -> Optional[BaseAIProvider]:
+    """
+    Create the client of `provider` ("openai", "deepseek" or "gemini") and wrap it in its `AIProvider`
+
+    Returns:
+        The provider, or None if the client couldn't be created
+    """
+    provider = provider.lower()
+    if provider == "openai":
+        from modules.ai.openaiConnections import ai_create_openai_client
+        client, provider_class = ai_create_openai_client(), OpenAIProvider
+    ##> ------ Yang Li : MARKYangL - Feature ------
+    elif provider == "deepseek":
+        from modules.ai.deepseekConnections import deepseek_create_client
+        client, provider_class = deepseek_create_client(), DeepSeekProvider
+    elif provider == "gemini":
+        from modules.ai.geminiConnections import gemini_create_client
+        client, provider_class = gemini_create_client(), GeminiProvider
+    ##<
+    else:
+        print_lg(f'Unknown AI provider "{provider}"!')
+        return None
+    return provider_class(client, user_information_all) if client else None
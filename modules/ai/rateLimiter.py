@@ -0,0 +1,159 @@
+"""
+Rate Limiter Module - Keeps AI requests under the provider's rate limits
+Two token buckets, one for requests per minute and one for tokens per minute, are
+refilled continuously. A request waits until both buckets hold enough. The bucket
+levels can be kept in a small state file, so several bots or parallel workers on one
+machine share one budget instead of each using all of it
+
+Author: Performance Optimization
+"""
+
+import asyncio
+import json
+import os
+import time
+from typing import Dict, Optional
+
+from modules.helpers import print_lg, try_lock_file, unlock_file
+
+
+class TokenBucket:
+    """Bucket of `capacity` units refilled at `capacity` per minute, 0 capacity means unlimited"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = time.time()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Secs until `amount` units are available, 0 if they are available now"""
+        if not self.capacity:
+            return 0.0
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        return 0.0 if self.level >= amount else (amount - self.level) / self.rate
+
+    def take(self, amount: float) -> None:
+        """Take `amount` units, a negative amount gives units back"""
+        if self.capacity:
+            self.level = min(self.capacity, self.level - amount)
+
+    def state(self) -> Dict:
+        return {"level": self.level, "updated": self.updated}
+
+    def load(self, state: Optional[Dict]) -> None:
+        if state:
+            self.level = min(self.capacity, float(state.get("level", self.level)))
+            self.updated = float(state.get("updated", self.updated))
+
+
+class RateLimiter:
+    """Requests and tokens per minute limits, optionally shared through `state_file`"""
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float, state_file: Optional[str] = None):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.state_file = state_file or None
+        self.waited_seconds = 0.0
+        self.waits = 0
+        if self.state_file:
+            os.makedirs(os.path.dirname(os.path.abspath(self.state_file)), exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.requests.capacity or self.tokens.capacity)
+
+    # File backed state, guarded by an exclusive lock file
+    def _lock(self) -> bool:
+        return try_lock_file(self.state_file + ".lock")
+
+    def _unlock(self) -> None:
+        unlock_file(self.state_file + ".lock")
+
+    def _load(self) -> None:
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as file:
+                state = json.load(file)
+            self.requests.load(state.get("requests"))
+            self.tokens.load(state.get("tokens"))
+        except Exception:
+            pass
+
+    def _save(self) -> None:
+        temp_file = f"{self.state_file}.{os.getpid()}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as file:
+            json.dump({"requests": self.requests.state(), "tokens": self.tokens.state()}, file)
+        os.replace(temp_file, self.state_file)
+
+    def _try_take(self, tokens: float, correction: bool = False) -> float:
+        """
+        Take one request and `tokens` if both are available, else return the secs to wait
+        A `correction` only takes (or gives back if negative) `tokens`, right away
+        """
+        now = time.time()
+        if correction:
+            self.tokens.wait_time(0, now)
+            self.tokens.take(tokens)
+            return 0.0
+        wait = max(self.requests.wait_time(1, now), self.tokens.wait_time(tokens, now))
+        if not wait:
+            self.requests.take(1)
+            self.tokens.take(tokens)
+        return wait
+
+    def _try_take_shared(self, tokens: float, correction: bool) -> Optional[float]:
+        """`_try_take()` on the state file, None if another process or request holds its lock"""
+        if not self._lock():
+            return None
+        try:
+            self._load()
+            wait = self._try_take(tokens, correction)
+            self._save()
+            return wait
+        finally:
+            self._unlock()
+
+    async def _shared(self, tokens: float, correction: bool = False) -> float:
+        if not self.state_file:
+            return self._try_take(tokens, correction)
+        while True:
+            # File I/O runs off the event loop, the other requests on it go on meanwhile
+            wait = await asyncio.to_thread(self._try_take_shared, tokens, correction)
+            if wait is not None:
+                return wait
+            await asyncio.sleep(0.01)
+
+    async def acquire(self, tokens: float) -> float:
+        """
+        Wait until one more request of about `tokens` tokens fits in the limits
+
+        Returns:
+            Secs waited
+        """
+        if not self.enabled:
+            return 0.0
+        waited = 0.0
+        while True:
+            wait = await self._shared(tokens)
+            if not wait:
+                break
+            waited += wait
+            await asyncio.sleep(wait)
+        if waited:
+            self.waits += 1
+            self.waited_seconds += waited
+        return waited
+
+    async def adjust(self, estimated_tokens: float, actual_tokens: float) -> None:
+        """Correct the tokens taken by `acquire()` once the real usage is known"""
+        if self.tokens.capacity and actual_tokens != estimated_tokens:
+            await self._shared(actual_tokens - estimated_tokens, correction=True)
+
+    def report(self) -> None:
+        if self.waits:
+            print_lg(f"AI rate limiter: waited {self.waits} times, {self.waited_seconds:.0f}s in total")
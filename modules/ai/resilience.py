@@ -0,0 +1,158 @@
+"""
+Resilience Module - Retries and circuit breaking for AI requests
+Transient failures (rate limits, overloaded or restarting servers, dropped connections)
+are retried with exponential backoff and jitter. When a provider keeps failing, the
+circuit breaker stops calling it for a cool-down, so every question falls back to rules
+and cached answers right away instead of waiting for yet another timeout
+
+Author: Performance Optimization
+"""
+
+import asyncio
+import time
+from random import uniform
+from threading import Lock
+from typing import Dict, Optional
+
+
+MAX_RETRY_AFTER = 60.0     # Never wait longer than this between retries, whatever the server asks
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+# Exception names of the SDKs and httpx for dropped connections and timeouts
+RETRYABLE_ERROR_NAMES = {
+    "TimeoutError", "APITimeoutError", "APIConnectionError", "ConnectError", "ConnectTimeout",
+    "ReadTimeout", "ReadError", "WriteError", "RemoteProtocolError", "PoolTimeout", "ServerError", "ConnectionError",
+}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit is open"""
+
+
+def status_code(error: BaseException) -> Optional[int]:
+    """HTTP status of an SDK error if it has one"""
+    for code in (getattr(error, "status_code", None), getattr(error, "code", None),
+                 getattr(getattr(error, "response", None), "status_code", None)):
+        if isinstance(code, int):
+            return code
+    return None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """True if `error` is transient and the same request may succeed when sent again"""
+    code = status_code(error)
+    if code is not None:
+        return code in RETRYABLE_STATUS_CODES
+    return any(cls.__name__ in RETRYABLE_ERROR_NAMES for cls in type(error).__mro__)
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Seconds the server asked to wait before retrying, if it said so"""
+    try:
+        value = getattr(error, "response").headers.get("retry-after")
+        return float(value) if value is not None else None
+    except Exception:
+        return None
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """Exponential backoff with full jitter for the `attempt`th retry (0 based)"""
+    return uniform(0, min(cap, base * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and rejects calls for `cooldown` secs.
+    Then lets one trial call through, which closes it again on success
+    """
+
+    def __init__(self, failure_threshold: int, cooldown: float):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = Lock()
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None and time.monotonic() - self._opened_at < self.cooldown
+
+    def allow(self) -> bool:
+        """True if a call may be made now"""
+        if self.failure_threshold <= 0:
+            return True
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at >= self.cooldown and not self._trial_running:
+                self._trial_running = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            self._failures += 1
+            # A failed trial opens the circuit again for another cool-down
+            if self._trial_running or (self._opened_at is None and self._failures >= self.failure_threshold):
+                self.times_opened += 1
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+
+class RetryPolicy:
+    """Runs an async call with retries and a circuit breaker"""
+
+    def __init__(self, max_retries: int, breaker: CircuitBreaker, name: str = "AI"):
+        self.max_retries = max_retries
+        self.breaker = breaker
+        self.name = name
+        self.retries = 0
+
+    async def call(self, make_call):
+        """
+        Await `make_call()`, calling it again on transient failures
+
+        Raises:
+            CircuitOpenError: If the provider's circuit is open, without calling it
+            The last error: If the call failed for good
+        """
+        attempt = 0
+        while True:
+            if not self.breaker.allow():
+                raise CircuitOpenError(f"{self.name} is failing, not calling it for up to {self.breaker.cooldown:.0f}s")
+            try:
+                result = await make_call()
+            except Exception as error:
+                if not is_retryable(error):
+                    # The request itself was bad, the provider is fine
+                    self.breaker.record_success()
+                    raise
+                self.breaker.record_failure()
+                if attempt >= self.max_retries or self.breaker.is_open:
+                    raise
+                delay = min(retry_after(error) or backoff_delay(attempt), MAX_RETRY_AFTER)
+                attempt += 1
+                self.retries += 1
+                await asyncio.sleep(delay)
+                continue
+            self.breaker.record_success()
+            return result
+
+    def get_stats(self) -> Dict:
+        return {
+            "retries": self.retries,
+            "circuit_opened": self.breaker.times_opened,
+            "short_circuited": self.breaker.rejected,
+        }
@@ -0,0 +1,129 @@
+"""
+Response Cache Module - Memoizes AI answers to form questions
+Questions that don't depend on the job (Eg: "Years of experience with Python?",
+"Are you authorized to work in ...?") are answered once and reused for every job.
+Questions about the job itself (Eg: "Why do you want to join us?") are reused only
+for the same job description. Entries expire after a TTL and the cache is size bounded
+
+Author: Performance Optimization
+"""
+
+import json
+import re
+import time
+from collections import OrderedDict
+from hashlib import sha256
+from typing import Dict, List, Optional, Tuple
+
+from modules.helpers import print_lg
+from modules.skills_cache import normalize_description
+
+
+# Questions that can only be answered well with the job description at hand
+JOB_DEPENDENT_PATTERN = re.compile(
+    r"\b(this|the|our) (role|job|position|company|team|opportunity|organi[sz]ation)\b"
+    r"|\bwhy\b|\bcover letter\b|\binterest(ed|s)?\b|\bmotivat|\bfit\b|\babout us\b",
+    re.IGNORECASE
+)
+
+
+def canonical_question(question: str) -> str:
+    """Lowercase `question` without punctuation and extra whitespace"""
+    return " ".join(re.findall(r"\w+", question.lower()))
+
+
+def is_job_dependent(question: str, question_type: str) -> bool:
+    """True if the answer to `question` depends on the job description"""
+    return question_type == "textarea" or bool(JOB_DEPENDENT_PATTERN.search(question))
+
+
+class ResponseCache:
+    """
+    In memory LRU cache of AI answers with a TTL, keyed by a hash of the canonical prompt
+    Only used by the providers' coroutines on the one AI event loop thread, so it needs no lock
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int, context: str = ""):
+        """
+        Args:
+            ttl_seconds: Answers older than this are asked again, 0 disables the cache
+            max_entries: Least recently used answers are dropped beyond this
+            context: What else shapes the answers (Eg: model and user information), part of every key
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.context = sha256(context.encode()).hexdigest()
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._job_fingerprints: Dict[str, str] = {}
+        self.hits = {"global": 0, "job": 0}
+        self.misses = {"global": 0, "job": 0}
+        self.expired = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def _fingerprint(self, job_description: Optional[str]) -> str:
+        if not job_description:
+            return ""
+        fingerprint = self._job_fingerprints.get(job_description)
+        if fingerprint is None:
+            if len(self._job_fingerprints) > 64:
+                self._job_fingerprints.clear()
+            fingerprint = sha256(normalize_description(job_description).encode()).hexdigest()
+            self._job_fingerprints[job_description] = fingerprint
+        return fingerprint
+
+    def key(self, question: str, question_type: str, options: Optional[List[str]], job_description: Optional[str]) -> Tuple[str, str]:
+        """
+        Returns:
+            `(key, policy)`, policy is "job" for job dependent questions, else "global"
+        """
+        policy = "job" if is_job_dependent(question, question_type) else "global"
+        parts = [self.context, canonical_question(question), question_type, list(options or [])]
+        if policy == "job":
+            parts.append(self._fingerprint(job_description))
+        return sha256(json.dumps(parts, ensure_ascii=False).encode()).hexdigest(), policy
+
+    def get(self, question: str, question_type: str, options: Optional[List[str]] = None, job_description: Optional[str] = None) -> Optional[str]:
+        """Get the cached answer to the question, else None"""
+        if not self.enabled:
+            return None
+        key, policy = self.key(question, question_type, options, job_description)
+        entry = self._entries.get(key)
+        if entry is not None and time.time() - entry[0] > self.ttl_seconds:
+            del self._entries[key]
+            self.expired += 1
+            entry = None
+        if entry is None:
+            self.misses[policy] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits[policy] += 1
+        return entry[1]
+
+    def set(self, question: str, question_type: str, options: Optional[List[str]], job_description: Optional[str], answer: str) -> None:
+        """Remember a valid `answer` to the question"""
+        if not self.enabled or not isinstance(answer, str) or not answer.strip():
+            return
+        key, _ = self.key(question, question_type, options, job_description)
+        self._entries[key] = (time.time(), answer)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get_stats(self) -> Dict:
+        """Get cache statistics"""
+        hits, misses = sum(self.hits.values()), sum(self.misses.values())
+        return {
+            'entries': len(self._entries),
+            'hits': dict(self.hits),
+            'misses': dict(self.misses),
+            'expired': self.expired,
+            'hit_rate': (hits / (hits + misses)) if hits + misses else 0.0,
+        }
+
+    def report(self) -> None:
+        stats = self.get_stats()
+        if sum(stats['hits'].values()) + sum(stats['misses'].values()):
+            print_lg(f"AI response cache: {stats['hit_rate']:.0%} hit rate, {stats['hits']['global']} job independent and {stats['hits']['job']} same job answers reused, {stats['expired']} expired")
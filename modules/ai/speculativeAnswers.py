@@ -0,0 +1,107 @@
+"""
+Speculative Answers Module - Answers the questions of a job's form before they are asked
+Many Easy Apply questions follow from the job's skills (Eg: "Do you have experience with
+Kubernetes?"). Right after the skills are extracted, these questions are predicted and
+answered in one background request while the form is opened and paged through. The
+real questions are matched to the predicted ones by meaning, like similar saved questions
+
+Author: Performance Optimization
+"""
+
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+from modules.helpers import print_lg
+from modules.semantic_index import hash_embed, subject_terms
+from modules.ai.batchAnswers import BatchQuestion
+
+
+SKILL_GROUPS = ("required_skills", "tech_stack")    # Most asked about first
+EXPERIENCE_QUESTION = "Do you have experience with {}?"
+YES_NO = ["Yes", "No"]
+MAX_SKILL_WORDS = 4         # Longer "skills" are sentences, forms don't ask about them
+
+
+def predict_questions(skills: Dict, limit: int) -> List[BatchQuestion]:
+    """Questions the form of a job with these extracted `skills` likely asks, at most `limit`"""
+    if not isinstance(skills, dict) or "error" in skills:
+        return []
+    names: Dict[str, str] = {}
+    for group in SKILL_GROUPS:
+        for skill in skills.get(group) or []:
+            if isinstance(skill, str) and skill.strip() and len(skill.split()) <= MAX_SKILL_WORDS:
+                names.setdefault(skill.strip().lower(), skill.strip())
+    return [(EXPERIENCE_QUESTION.format(name), "select", YES_NO) for name in list(names.values())[:limit]]
+
+
+class SpeculativeAnswers:
+    """Answers of the questions predicted for the current job, being answered or done"""
+
+    def __init__(self, similarity_threshold: float, wait_seconds: float):
+        """
+        Args:
+            similarity_threshold: Minimum cosine similarity of a real and a predicted question (0-1)
+            wait_seconds: How long a real question waits for the predicted answers still being generated
+        """
+        self.similarity_threshold = similarity_threshold
+        self.wait_seconds = wait_seconds
+        self._job_description: Optional[str] = None
+        self._questions: List[Tuple[BatchQuestion, List[float], frozenset]] = []
+        self._answers: Optional[Future] = None
+        self.predicted = 0
+        self.used = 0
+
+    def start(self, job_description: str, questions: List[BatchQuestion], answers: Future) -> None:
+        """Keep the `questions` predicted for `job_description`, `answers` resolves to their answers in order"""
+        self.clear()
+        self._job_description = job_description
+        self._questions = [(question, hash_embed(question[0]), subject_terms(question[0])) for question in questions]
+        self._answers = answers
+        self.predicted += len(questions)
+
+    def clear(self) -> None:
+        """Forget the previous job's questions, stop answering them if still running"""
+        if self._answers is not None and not self._answers.done():
+            self._answers.cancel()
+        self._job_description = None
+        self._questions = []
+        self._answers = None
+
+    def _match(self, question: str, question_type: str) -> Optional[int]:
+        vector = hash_embed(question)
+        subject = subject_terms(question)
+        best, best_similarity = None, self.similarity_threshold
+        for index, ((_, predicted_type, _), predicted_vector, predicted_subject) in enumerate(self._questions):
+            # A Yes/No answer doesn't fit a text field of the same subject (Eg: "Kubernetes experience?" wants years)
+            if predicted_type != question_type:
+                continue
+            similarity = sum(a * b for a, b in zip(vector, predicted_vector))
+            if similarity >= best_similarity and predicted_subject == subject:
+                best, best_similarity = index, similarity
+        return best
+
+    def get(self, question: str, question_type: str, options: Optional[List[str]], job_description: Optional[str]) -> Optional[str]:
+        """
+        The answer of the predicted question of the same job and type matching `question`
+
+        Returns:
+            The answer if it fits `options`, else None
+        """
+        if self._answers is None or job_description != self._job_description:
+            return None
+        index = self._match(question, question_type)
+        if index is None:
+            return None
+        try:
+            answer = self._answers.result(self.wait_seconds)[index]
+        except Exception:
+            return None
+        if not isinstance(answer, str) or (options is not None and answer not in options):
+            return None
+        self.used += 1
+        print_lg(f'Using the answer prepared for "{question}": "{answer}"')
+        return answer
+
+    def report(self) -> None:
+        if self.predicted:
+            print_lg(f"Pre-answered questions: {self.used} of {self.predicted} predicted answers were used")
@@ -0,0 +1,117 @@
+"""
+Streaming Module - Reads streamed AI answers
+Chunks are buffered and echoed to the log a few times a second instead of once per
+token. Select and radio answers can end the stream as soon as the words received so
+far can only be one of the options, the rest of the answer is never generated
+
+Author: Performance Optimization
+"""
+
+import re
+import time
+
+from modules.helpers import print_lg
+
+
+# Answers that must be one of the options, free text fields need the whole answer (Eg: "Yes, after a 30-day notice")
+CHOICE_TYPES = ("select", "radio")
+
+
+def _words(text: str) -> list[str]:
+    return re.findall(r"\w+", text.lower())
+
+
+def early_stop_options(question_type: str, options: list[str] | None) -> list[str] | None:
+    """
+    Options whose match ends the answer's stream early, None if the whole answer is needed
+    """
+    if question_type in CHOICE_TYPES and options:
+        return options
+    return None
+
+
+# ------------------------------------------------------------------
+# Stream Consumer
+# ------------------------------------------------------------------
+
+class StreamConsumer:
+    """
+    Collects the chunks of a streamed answer
+    * Chunks go to a list buffer, joined once at the end
+    * Echo to the console and log is throttled to one write per `echo_interval` secs
+    * With `options`, the stream can stop as soon as the partial answer matches exactly one option.
+      Only the words completed by each chunk are matched, against the options still possible
+    """
+
+    def __init__(self, echo: bool = True, options: list[str] | None = None, echo_interval: float = 0.25):
+        self.echo = echo
+        self.echo_interval = echo_interval
+        self._parts: list[str] = []
+        self._pending: list[str] = []
+        self._last_echo = time.monotonic()
+        # Options the answer can still turn out to be, matching ends when none is left to tell apart
+        self._candidates = [(option, _words(option)) for option in options or [] if _words(option)]
+        self._matching = bool(self._candidates)
+        self._words: list[str] = []
+        self._tail = ""
+        self.matched_option: str | None = None
+        if self.echo:
+            print_lg("-- STREAM START --")
+
+    def _flush(self) -> None:
+        if self._pending:
+            print_lg("".join(self._pending), end="", flush=True)
+            self._pending = []
+        self._last_echo = time.monotonic()
+
+    def _match(self, text: str) -> str | None:
+        self._tail += text
+        words = _words(self._tail)
+        # The last word may still go on ("No" of "Not sure", "2" of "25"), it counts once a boundary follows it
+        unfinished = re.search(r"\w+$", self._tail)
+        if unfinished:
+            words.pop()
+        self._tail = unfinished.group() if unfinished else ""
+        if not words:
+            return None
+        self._words.extend(words)
+        size = len(self._words)
+        self._candidates = [(option, option_words) for option, option_words in self._candidates
+                            if option_words[:size] == self._words or self._words[:len(option_words)] == option_words]
+        if len(self._candidates) == 1:
+            option, option_words = self._candidates[0]
+            if size >= len(option_words):
+                return option
+        # No option left, or more words can't tell the ones left apart (Eg: "Yes" and "Yes, I do" both matched)
+        if not self._candidates or all(len(option_words) <= size for _, option_words in self._candidates):
+            self._matching = False
+        return None
+
+    def feed(self, text: str) -> bool:
+        """
+        Add a chunk of the answer
+
+        Returns:
+            True if the answer is already known and the stream can be stopped
+        """
+        if not text:
+            return False
+        self._parts.append(text)
+        if self.echo:
+            self._pending.append(text)
+            if time.monotonic() - self._last_echo >= self.echo_interval:
+                self._flush()
+        if self._matching:
+            self.matched_option = self._match(text)
+            return self.matched_option is not None
+        return False
+
+    def finish(self) -> str:
+        """
+        Returns:
+            The matched option if the stream was stopped early, else the whole answer
+        """
+        if self.echo:
+            self._flush()
+            print_lg("\n-- STREAM END --" if self.matched_option is None else f"\n-- STREAM STOPPED: \"{self.matched_option}\" --")
+        return self.matched_option if self.matched_option is not None else "".join(self._parts)
@@ -8,19 +8,29 @@ Author: Performance Optimization
 import json
 import os
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Tuple
+from typing import Callable, Optional, Dict, List, Tuple
 from hashlib import md5
 
+from config.secrets import llm_embedding_url, llm_embedding_model
+from config.settings import similar_question_threshold
+from modules.helpers import print_lg
+from modules.ai.responseCache import is_job_dependent
+from modules.semantic_index import SemanticIndex, create_semantic_index, subject_terms
+
 CACHE_FILE = "logs/question_cache.json"
+# Answers worth reusing for other questions, not fallback guesses made when no answer was known
+REUSABLE_SOURCES = {"rule", "ai"}
 CACHE_EXPIRY_DAYS = 30  # Answers expire after 30 days
 
 
 class AnswerCache:
     """Intelligent cache for job application answers"""
     
-    def __init__(self, cache_file: str = CACHE_FILE):
+    def __init__(self, cache_file: str = CACHE_FILE, sink: Optional[Callable[[str, str, str, str], None]] = None):
         self.cache_file = cache_file
+        self.sink = sink
         self.cache: Dict = self._load_cache()
+        self._semantic_index: Optional[SemanticIndex] = None
         self._sanitize_old_entries()
     
     def _load_cache(self) -> Dict:
@@ -80,7 +90,7 @@ class AnswerCache:
         
         return None
     
-    def set(self, question: str, answer: str, question_type: str) -> None:
+    def set(self, question: str, answer: str, question_type: str, source: str = "rule") -> None:
         """
         Store answer in cache
         
@@ -88,6 +98,7 @@ class AnswerCache:
             question: The question text
             answer: The answer to cache
             question_type: Type of question
+            source: Where the answer came from, "rule", "ai" or "fallback" (a guess, never reused)
         """
         question_hash = self._get_question_hash(question)
         
@@ -95,10 +106,15 @@ class AnswerCache:
             'question': question,
             'answer': answer,
             'type': question_type,
+            'source': source,
             'timestamp': datetime.now().isoformat()
         }
         
-        self._save_cache()
+        if self.sink:
+            # Another process owns the cache file, hand the answer over to it
+            self.sink(question, answer, question_type, source)
+        else:
+            self._save_cache()
     
     def _is_expired(self, timestamp_str: str) -> bool:
         """Check if cache entry is expired"""
@@ -120,7 +136,8 @@ class AnswerCache:
         for key in expired_keys:
             del self.cache[key]
         
-        if expired_keys:
+        # Another process owns the cache file, it drops them from the file itself
+        if expired_keys and not self.sink:
             self._save_cache()
     
     def find_similar_answer(self, question: str, similarity_threshold: float = 0.7) -> Optional[Tuple[str, str]]:
@@ -152,6 +169,55 @@ class AnswerCache:
         
         return None
     
+    @property
+    def semantic_index(self) -> SemanticIndex:
+        """Vectors of the cached questions, built on first use"""
+        if self._semantic_index is None:
+            self._semantic_index = create_semantic_index(llm_embedding_url, llm_embedding_model)
+        return self._semantic_index
+
+    def find_semantic_answer(self, question: str, question_type: str, options: Optional[List[str]] = None,
+                             similarity_threshold: float = similar_question_threshold) -> Optional[Tuple[str, str, float]]:
+        """
+        Find the answer of a cached question that asks the same in other words
+        (Eg: "How many years have you worked with Python?" and "Python experience (years)?")
+        
+        Args:
+            question: The question to find a match for
+            question_type: Only answers of this type are reused
+            options: If given, the answer must be one of them
+            similarity_threshold: Minimum cosine similarity of the questions (0-1), 0 disables the search
+        
+        Returns:
+            Tuple of (cached_question, cached_answer, similarity) if found, else None
+        """
+        if similarity_threshold <= 0 or not self.cache or is_job_dependent(question, question_type):
+            return None
+        index = self.semantic_index
+        index.lookups += 1
+        if index.sync({key: entry['question'] for key, entry in self.cache.items()}) and not self.sink:
+            index.save()
+        subject = subject_terms(question)
+        for key, similarity in index.nearest(question):
+            if similarity < similarity_threshold:
+                break
+            entry = self.cache.get(key)
+            if not entry or entry.get('type') != question_type or not entry.get('answer') or self._is_expired(entry['timestamp']):
+                continue
+            # Fallback guesses (and older entries that don't say where they came from) would be repeated for good
+            if entry.get('source') not in REUSABLE_SOURCES:
+                continue
+            # Nearly the same words about another subject (Eg: Python vs Java) is another question
+            if subject_terms(entry['question']) != subject or (options is not None and entry['answer'] not in options):
+                continue
+            index.hits += 1
+            return (entry['question'], entry['answer'], similarity)
+        return None
+    
+    def report(self) -> None:
+        if self._semantic_index is not None:
+            self._semantic_index.report()
+    
     def clear(self) -> None:
         """Clear entire cache"""
         self.cache = {}
@@ -188,21 +254,40 @@ class AnswerCache:
 
 # Global cache instance
 _answer_cache: Optional[AnswerCache] = None
+_answer_sink: Optional[Callable[[str, str, str, str], None]] = None
 
 
 def get_cache() -> AnswerCache:
     """Get or create global cache instance"""
     global _answer_cache
     if _answer_cache is None:
-        _answer_cache = AnswerCache()
+        _answer_cache = AnswerCache(sink=_answer_sink)
     return _answer_cache
 
 
-def cache_answer(question: str, answer: str, question_type: str) -> None:
+def set_answer_sink(sink: Optional[Callable[[str, str, str, str], None]]) -> None:
+    """Send new answers to `sink(question, answer, question_type, source)` instead of writing the cache file"""
+    global _answer_sink
+    _answer_sink = sink
+    if _answer_cache is not None:
+        _answer_cache.sink = sink
+
+
+def cache_answer(question: str, answer: str, question_type: str, source: str = "rule") -> None:
     """Convenience function to cache an answer"""
-    get_cache().set(question, answer, question_type)
+    get_cache().set(question, answer, question_type, source)
 
 
 def get_cached_answer(question: str, question_type: str) -> Optional[str]:
     """Convenience function to retrieve cached answer"""
     return get_cache().get(question, question_type)
+
+
+def get_similar_answer(question: str, question_type: str, options: Optional[List[str]] = None) -> Optional[str]:
+    """Convenience function to reuse the cached answer of a question asked in other words"""
+    found = get_cache().find_semantic_answer(question, question_type, options)
+    if found is None:
+        return None
+    cached_question, answer, similarity = found
+    print_lg(f'Answering "{question}" like the saved question "{cached_question}" ({similarity:.0%} similar)')
+    return answer
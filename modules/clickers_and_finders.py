@@ -4,7 +4,7 @@ LinkedIn:   https://www.linkedin.com/in/omkar-gutal-a25935249/
 '''
 
 from config.settings import click_gap, smooth_scroll
-from modules.helpers import buffer, print_lg, sleep
+from modules.helpers import buffer, print_lg, sleep, pace, pacer
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -12,9 +12,218 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import StaleElementReferenceException, ElementClickInterceptedException
+from collections import OrderedDict
+from functools import lru_cache
+from time import perf_counter
+
+
+# Locator cache
+class LocatorCache:
+    '''
+    Maps `(context, locator)` to the `WebElement` found for it last time.
+    - Cached elements are used optimistically, any failure evicts them and the locator is queried again.
+    - Keeps count of hits (cached elements that worked), misses, stale evictions and WebDriver round-trips saved.
+    '''
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._elements: OrderedDict = OrderedDict()
+        self._class_order: dict[tuple[str, ...], int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.round_trips_saved = 0
+
+    @staticmethod
+    def _key(context: WebDriver | WebElement, by: str, value: str) -> tuple:
+        context_id = getattr(context, "session_id", None) or getattr(context, "id", None) or id(context)
+        return (context_id, by, value)
+
+    def get(self, context: WebDriver | WebElement, by: str, value: str) -> WebElement | None:
+        '''
+        Returns the cached element or `None`.
+        - Doesn't check it, call `used()` once it worked or `evict()` if it didn't.
+        '''
+        key = self._key(context, by, value)
+        element = self._elements.get(key)
+        if element is None:
+            self.misses += 1
+            return None
+        self._elements.move_to_end(key)
+        return element
+
+    def put(self, context: WebDriver | WebElement, by: str, value: str, element: WebElement) -> WebElement:
+        key = self._key(context, by, value)
+        self._elements[key] = element
+        self._elements.move_to_end(key)
+        if len(self._elements) > self.max_entries:
+            self._elements.popitem(last=False)
+        return element
+
+    def evict(self, context: WebDriver | WebElement, by: str, value: str) -> None:
+        if self._elements.pop(self._key(context, by, value), None) is not None:
+            self.stale += 1
+
+    def class_index(self, classes: tuple[str, ...]) -> int:
+        '''
+        Index of the class of `classes` that matched last time, `0` if none did yet.
+        '''
+        return self._class_order.get(classes, 0)
+
+    def set_class_index(self, classes: tuple[str, ...], index: int) -> None:
+        self._class_order[classes] = index
+
+    def used(self, round_trips: int = 1) -> None:
+        '''
+        Counts a cached element that worked without being queried again.
+        '''
+        self.hits += 1
+        self.round_trips_saved += round_trips
+
+    def saved(self, round_trips: int = 1) -> None:
+        self.round_trips_saved += round_trips
+
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses + self.stale
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_evictions": self.stale,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "round_trips_saved": self.round_trips_saved,
+        }
+
+    def report(self) -> None:
+        stats = self.get_stats()
+        print_lg(f"Locator cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.1%} hit rate), {stats['stale_evictions']} stale evictions, ~{stats['round_trips_saved']} WebDriver round-trips saved")
+
+locator_cache = LocatorCache()
+
+
+def xpath_literal(text: str) -> str:
+    '''
+    Quotes `text` as an XPath string literal, using `concat()` if it contains both quote types.
+    '''
+    if '"' not in text: return '"' + text + '"'
+    if "'" not in text: return "'" + text + "'"
+    return "concat(" + ", '\"', ".join('"' + part + '"' for part in text.split('"')) + ")"
+
+@lru_cache(maxsize=512)
+def span_xpath(text: str) -> str:
+    '''
+    Precompiled XPath of the `span` element with the given `text`.
+    '''
+    return './/span[normalize-space(.)=' + xpath_literal(text) + ']'
+
+
+# Wait Functions
+SETTLE_SCRIPT = '''
+var quiet = arguments[0], budget = arguments[1], done = arguments[arguments.length - 1];
+var start = performance.now(), last = start;
+var touch = function() { last = performance.now(); };
+var mutations = new MutationObserver(touch);
+mutations.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+var network = null;
+try {
+    network = new PerformanceObserver(touch);
+    network.observe({type: "resource", buffered: false});
+} catch (e) {}
+(function check() {
+    var now = performance.now();
+    if ((now - last >= quiet && document.readyState === "complete") || now - start >= budget) {
+        mutations.disconnect();
+        if (network) network.disconnect();
+        done(now - start);
+    } else {
+        setTimeout(check, 50);
+    }
+})();
+'''
+
+class WaitMeter:
+    '''
+    Compares the fixed sleeps that condition waits replaced (`budget`) with the time actually waited.
+    '''
+    def __init__(self) -> None:
+        self.label = ""
+        self.waits = 0
+        self.budget = 0.0
+        self.spent = 0.0
+
+    def start(self, label: str) -> None:
+        self.label = label
+        self.waits = 0
+        self.budget = 0.0
+        self.spent = 0.0
+
+    def record(self, budget: float, spent: float) -> None:
+        self.waits += 1
+        self.budget += budget
+        self.spent += min(spent, budget)
+
+    def report(self) -> None:
+        if self.waits:
+            print_lg(f'Condition waits for "{self.label}": {self.waits} waits took {self.spent:.1f}s instead of {self.budget:.1f}s, saved {self.budget - self.spent:.1f}s')
+
+wait_meter = WaitMeter()
+
+
+def settle(driver: WebDriver, budget: float, quiet: float = 0.3) -> float:
+    '''
+    Waits until the page stops changing, instead of sleeping for a fixed time.
+    - The page is settled once no DOM mutation and no network request happened for `quiet` seconds.
+    - Will never wait longer than `budget` seconds, the fixed sleep this replaces.
+    - Returns the seconds waited.
+    '''
+    started = perf_counter()
+    try:
+        driver.execute_async_script(SETTLE_SCRIPT, quiet * 1000, budget * 1000)
+    except Exception as e:
+        remaining = budget - (perf_counter() - started)
+        if remaining > 0: sleep(remaining)
+    spent = perf_counter() - started
+    wait_meter.record(budget, spent)
+    if spent < budget: pacer.observe(spent - quiet)
+    return spent
+
+def wait_until(driver: WebDriver, condition, budget: float) -> WebElement | bool:
+    '''
+    Waits for a max of `budget` seconds for an `expected_conditions` `condition` (like an element being clickable).
+    - Returns what the condition returned, else `False` on timeout.
+    '''
+    started = perf_counter()
+    try:
+        result = WebDriverWait(driver, budget, poll_frequency=0.1).until(condition)
+        pacer.observe(perf_counter() - started)
+        return result
+    except Exception as e:
+        return False
+    finally:
+        wait_meter.record(budget, perf_counter() - started)
+
 
 # Click Functions
+def _use_cached_span(driver: WebDriver, xpath: str, click: bool, scroll: bool, scrollTop: bool) -> WebElement | None:
+    '''
+    Scrolls to and clicks the element cached for `xpath` as is, without checking it first.
+    - Returns `None` if there is none or it failed, it's evicted then and the caller queries again.
+    '''
+    button = locator_cache.get(driver, By.XPATH, xpath)
+    if button is None:
+        return None
+    try:
+        if scroll:  scroll_to_view(driver, button, scrollTop)
+        if click:
+            button.click()
+            pace()
+    except Exception:
+        # Stale, hidden or disabled by now (Eg: filter modals and dialogs are rebuilt), not a reason to slow down
+        locator_cache.evict(driver, By.XPATH, xpath)
+        return None
+    # The query, and the displayed and enabled checks of waiting for it to be clickable
+    locator_cache.used(3 if click else 1)
+    return button
+
 def wait_span_click(driver: WebDriver, text: str, time: float=5.0, click: bool=True, scroll: bool=True, scrollTop: bool=False) -> WebElement | bool:
     '''
     Finds the span element with the given `text`.
@@ -23,21 +232,30 @@ def wait_span_click(driver: WebDriver, text: str, time: float=5.0, click: bool=T
     - Will spend a max of `time` seconds in searching for each element.
     - Will scroll to the element if `scroll = True`.
     - Will scroll to the top if `scrollTop = True`.
-    - Handles stale element references with retry logic.
+    - Reuses the element found last time from `locator_cache` when it scrolls or clicks, re-queries right away if that fails.
     '''
     if text:
+        xpath = span_xpath(text)
+        if scroll or click:
+            button = _use_cached_span(driver, xpath, click, scroll, scrollTop)
+            if button is not None:
+                return button
         max_retries = 3
         for attempt in range(max_retries):
+            started = perf_counter()
             try:
-                button = WebDriverWait(driver, time).until(EC.presence_of_element_located((By.XPATH, './/span[normalize-space(.)="'+text+'"]')))
+                button = locator_cache.put(driver, By.XPATH, xpath, WebDriverWait(driver, time).until(EC.presence_of_element_located((By.XPATH, xpath))))
                 if scroll:  scroll_to_view(driver, button, scrollTop)
                 if click:
                     # Wait for element to be clickable before clicking
-                    WebDriverWait(driver, time).until(EC.element_to_be_clickable((By.XPATH, './/span[normalize-space(.)="'+text+'"]')))
+                    WebDriverWait(driver, time).until(EC.element_to_be_clickable(button))
+                    pacer.observe(perf_counter() - started)
                     button.click()
-                    buffer(click_gap)
+                    pace()
                 return button
             except StaleElementReferenceException as e:
+                locator_cache.evict(driver, By.XPATH, xpath)
+                pacer.penalize("stale element")
                 if attempt < max_retries - 1:
                     print_lg(f"Stale element for '{text}', retrying ({attempt + 1}/{max_retries - 1})...")
                     sleep(1)
@@ -45,9 +263,13 @@ def wait_span_click(driver: WebDriver, text: str, time: float=5.0, click: bool=T
                     print_lg("Click Failed! Didn't find '"+text+"'")
                     return False
             except Exception as e:
+                if isinstance(e, ElementClickInterceptedException): pacer.penalize("click intercepted")
+                # Never keep an element that failed (Eg: timed out waiting to be clickable)
+                locator_cache.evict(driver, By.XPATH, xpath)
                 print_lg("Click Failed! Didn't find '"+text+"'")
                 # print_lg(e)
                 return False
+        return False
 
 def multi_sel(driver: WebDriver, texts: list, time: float=5.0) -> None:
     '''
@@ -56,27 +278,9 @@ def multi_sel(driver: WebDriver, texts: list, time: float=5.0) -> None:
     '''
     for text in texts:
         ##> ------ Dheeraj Deshwal : dheeraj20194@iiitd.ac.in/dheerajdeshwal9811@gmail.com - Bug fix ------
-        wait_span_click(driver, text, time, False)
+        # Scrolls to, waits for and clicks the element in one pass (used to wait for the same element twice)
+        wait_span_click(driver, text, time)
         ##<
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                button = WebDriverWait(driver, time).until(EC.presence_of_element_located((By.XPATH, './/span[normalize-space(.)="'+text+'"]')))
-                scroll_to_view(driver, button)
-                WebDriverWait(driver, time).until(EC.element_to_be_clickable((By.XPATH, './/span[normalize-space(.)="'+text+'"]')))
-                button.click()
-                buffer(click_gap)
-                break
-            except StaleElementReferenceException as e:
-                if attempt < max_retries - 1:
-                    print_lg(f"Stale element for '{text}', retrying ({attempt + 1}/{max_retries - 1})...")
-                    sleep(1)
-                else:
-                    print_lg("Click Failed! Didn't find '"+text+"'")
-            except Exception as e:
-                print_lg("Click Failed! Didn't find '"+text+"'")
-                # print_lg(e)
-                break
 
 def multi_sel_noWait(driver: WebDriver, texts: list, actions: ActionChains = None) -> None:
     '''
@@ -86,11 +290,12 @@ def multi_sel_noWait(driver: WebDriver, texts: list, actions: ActionChains = Non
     '''
     for text in texts:
         try:
-            button = driver.find_element(By.XPATH, './/span[normalize-space(.)="'+text+'"]')
+            button = driver.find_element(By.XPATH, span_xpath(text))
             scroll_to_view(driver, button)
             button.click()
-            buffer(click_gap)
+            pace()
         except Exception as e:
+            if isinstance(e, ElementClickInterceptedException): pacer.penalize("click intercepted")
             if actions: company_search_click(driver,actions,text)
             else:   print_lg("Click Failed! Didn't find '"+text+"'")
             # print_lg(e)
@@ -104,8 +309,9 @@ def boolean_button_click(driver: WebDriver, actions: ActionChains, text: str) ->
         button = list_container.find_element(By.XPATH, './/input[@role="switch"]')
         scroll_to_view(driver, button)
         actions.move_to_element(button).click().perform()
-        buffer(click_gap)
+        pace()
     except Exception as e:
+        if isinstance(e, ElementClickInterceptedException): pacer.penalize("click intercepted")
         print_lg("Click Failed! Didn't find '"+text+"'")
         # print_lg(e)
 
@@ -142,13 +348,14 @@ def try_xp(driver: WebDriver, xpath: str, click: bool=True) -> WebElement | bool
     max_retries = 3
     for attempt in range(max_retries):
         try:
-            element = driver.find_element(By.XPATH, xpath)
             if click:
-                element.click()
+                # Not cached, a node that re-rendered but is still attached may no longer match `xpath`
+                driver.find_element(By.XPATH, xpath).click()
                 return True
             else:
-                return element
+                return driver.find_element(By.XPATH, xpath)
         except StaleElementReferenceException as e:
+            pacer.penalize("stale element")
             if attempt < max_retries - 1:
                 print_lg(f"Stale element detected in try_xp, retrying ({attempt + 1}/{max_retries - 1})...")
                 sleep(1)
@@ -163,11 +370,60 @@ def try_linkText(driver: WebDriver, linkText: str) -> WebElement | bool:
     except:  return False
 
 def try_find_by_classes(driver: WebDriver, classes: list[str]) -> WebElement | ValueError:
-    for cla in classes:
-        try:    return driver.find_element(By.CLASS_NAME, cla)
+    '''
+    Returns the first element found for the given `classes`.
+    - Tries the class that matched last time first, skipping lookups that are known to fail.
+    '''
+    key = tuple(classes)
+    first = locator_cache.class_index(key)
+    for index in [first] + [i for i in range(len(classes)) if i != first]:
+        try:
+            element = driver.find_element(By.CLASS_NAME, classes[index])
+            locator_cache.set_class_index(key, index)
+            if index == first: locator_cache.saved(first)
+            return element
         except: pass
     raise ValueError("Failed to find an element with given classes")
 
+# Select (dropdown) functions
+LONG_DROPDOWN_OPTIONS = 50
+
+def get_select_options(driver: WebDriver, select: WebElement, limit: int = LONG_DROPDOWN_OPTIONS) -> tuple[int, list[str] | None]:
+    '''
+    Reads the option texts of a `select` element in a single round-trip.
+    - Returns `(option_count, option_texts)`.
+    - `option_texts` is `None` if the select has more than `limit` options, use `select_option_in_browser()` for those.
+    '''
+    return tuple(driver.execute_script(
+        'const options = arguments[0].options;'
+        'if (options.length > arguments[1]) return [options.length, null];'
+        'return [options.length, Array.from(options, option => option.text)];',
+        select, limit))
+
+def select_option_in_browser(driver: WebDriver, select: WebElement, answer: str, phrases: list[str]) -> tuple[int, str] | None:
+    '''
+    Resolves the option for `answer` inside the browser, so long dropdowns (Eg: country lists) cost one round-trip.
+    - Tries an exact (whitespace and case normalized) match of `answer` first.
+    - Then for each phrase in `phrases`, matches an option if their digits are equal, their texts are equal or either contains the other.
+    - Returns `(index, option_text)` of the chosen option, else `None`.
+    '''
+    result = driver.execute_script(
+        'const norm = text => text.replace(/\\s+/g, " ").trim().toLowerCase();'
+        'const digits = text => text.replace(/\\D/g, "");'
+        'const options = Array.from(arguments[0].options, option => option.text);'
+        'const lowered = options.map(text => text.toLowerCase());'
+        'const answer = norm(arguments[1]);'
+        'let index = lowered.findIndex(text => norm(text) === answer);'
+        'for (const phrase of arguments[2]) {'
+        '  if (index >= 0) break;'
+        '  const low = phrase.toLowerCase(), stripped = low.trim(), phraseDigits = digits(phrase);'
+        '  index = lowered.findIndex((text, i) => (phraseDigits && digits(options[i]) && phraseDigits === digits(options[i]))'
+        '    || stripped === text.trim() || text.includes(low) || low.includes(text));'
+        '}'
+        'return index >= 0 ? [index, options[index]] : null;',
+        select, answer, phrases)
+    return tuple(result) if result else None
+
 def company_search_click(driver: WebDriver, actions: ActionChains, companyName: str) -> None:
     '''
     Tries to search and Add the company to company filters list.
@@ -183,11 +439,12 @@ def company_search_click(driver: WebDriver, actions: ActionChains, companyName:
 
 def text_input(actions: ActionChains, textInputEle: WebElement | bool, value: str, textFieldName: str = "Text") -> None | Exception:
     if textInputEle:
-        sleep(1)
+        driver = textInputEle.parent
+        wait_until(driver, EC.element_to_be_clickable(textInputEle), 1)
         # actions.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).perform()
         textInputEle.clear()
         textInputEle.send_keys(value.strip())
-        sleep(2)
+        settle(driver, 2)   # Let the suggestions render
         actions.send_keys(Keys.ENTER).perform()
     else:
         print_lg(f'{textFieldName} input was not given!')
\ No newline at end of file
@@ -0,0 +1,132 @@
+"""
+Driver Cache Module - Reuses the patched chromedriver of undetected mode across runs
+`undetected_chromedriver` downloads and patches a fresh chromedriver on every launch.
+The patched binary is kept per Chrome major version together with its checksum and is
+only refreshed when the installed Chrome version changes, so stealth mode starts in
+about a second and without network access
+
+Author: Performance Optimization
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+from datetime import datetime
+from typing import Dict, Optional
+
+from modules.helpers import make_directories, print_lg
+
+
+MANIFEST_FILE = "manifest.json"
+DRIVER_NAME = "chromedriver.exe" if sys.platform.startswith("win") else "chromedriver"
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def detect_chrome_major_version(chrome_path: Optional[str] = None) -> Optional[int]:
+    """
+    Find the major version of the installed Chrome without any network access
+
+    Returns:
+        Major version (Eg: 126) or None if it couldn't be determined
+    """
+    if not chrome_path:
+        try:
+            import undetected_chromedriver as uc
+            chrome_path = uc.find_chrome_executable()
+        except Exception:
+            chrome_path = None
+    if not chrome_path:
+        return None
+    # Windows builds don't print their version, but keep it as the name of a folder next to chrome.exe
+    if sys.platform.startswith("win"):
+        folder = os.path.dirname(chrome_path)
+        versions = [name for name in os.listdir(folder) if re.match(r"^\d+\.\d+\.\d+\.\d+$", name)] if os.path.isdir(folder) else []
+        if versions:
+            return max(int(version.split(".")[0]) for version in versions)
+    try:
+        output = subprocess.run([chrome_path, "--version"], capture_output=True, text=True, timeout=10).stdout
+    except Exception:
+        return None
+    match = re.search(r"(\d+)\.\d+\.\d+", output)
+    return int(match.group(1)) if match else None
+
+
+class DriverCache:
+    """Patched chromedriver binaries stored under `cache_dir/<chrome major version>/`"""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+
+    def _entry_dir(self, major_version: int) -> str:
+        return os.path.join(self.cache_dir, str(major_version))
+
+    def _manifest(self, major_version: int) -> Dict:
+        try:
+            with open(os.path.join(self._entry_dir(major_version), MANIFEST_FILE), "r", encoding="utf-8") as file:
+                return json.load(file)
+        except Exception:
+            return {}
+
+    def get(self, major_version: int) -> Optional[str]:
+        """Return the cached driver path for `major_version` if it is present and intact, else None"""
+        manifest = self._manifest(major_version)
+        path = os.path.join(self._entry_dir(major_version), DRIVER_NAME)
+        if manifest.get("major_version") != major_version or not os.path.isfile(path):
+            return None
+        if manifest.get("sha256") != _sha256(path):
+            print_lg(f"Cached chromedriver for Chrome {major_version} is corrupted, it will be downloaded again.")
+            return None
+        return path
+
+    def put(self, major_version: int, driver_path: str) -> str:
+        """Copy a patched driver into the cache and record its checksum, returns the cached path"""
+        entry_dir = self._entry_dir(major_version)
+        make_directories([entry_dir + "/"])
+        path = os.path.join(entry_dir, DRIVER_NAME)
+        shutil.copy2(driver_path, path)
+        os.chmod(path, 0o755)
+        with open(os.path.join(entry_dir, MANIFEST_FILE), "w", encoding="utf-8") as file:
+            json.dump({
+                "major_version": major_version,
+                "sha256": _sha256(path),
+                "source": driver_path,
+                "created": datetime.now().isoformat(),
+            }, file, indent=2)
+        # Drivers of older Chrome versions are of no use anymore
+        for name in os.listdir(self.cache_dir):
+            if name.isdigit() and int(name) != major_version:
+                shutil.rmtree(os.path.join(self.cache_dir, name), ignore_errors=True)
+        return path
+
+    def resolve(self, major_version: Optional[int] = None) -> tuple[Optional[str], Optional[int]]:
+        """
+        Get a patched driver for the installed Chrome, downloading it only on a cache miss
+
+        Returns:
+            `(driver_path, major_version)`, `(None, None)` if the version is unknown and nothing was cached
+        """
+        major_version = major_version or detect_chrome_major_version()
+        if major_version is None:
+            print_lg("Couldn't detect the installed Chrome version, undetected mode will download Chrome Driver.")
+            return None, None
+        cached = self.get(major_version)
+        if cached:
+            print_lg(f"Using cached Chrome Driver for Chrome {major_version}.")
+            return cached, major_version
+
+        import undetected_chromedriver as uc
+        print_lg(f"Downloading Chrome Driver for Chrome {major_version}... This may take some time, it will be reused on next runs!")
+        patcher = uc.Patcher(version_main=major_version)
+        patcher.auto()
+        return self.put(major_version, patcher.executable_path), major_version
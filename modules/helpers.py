@@ -8,19 +8,19 @@ LinkedIn:   https://www.linkedin.com/in/omkar-gutal-a25935249/
 
 import os
 import sys
+import csv
 import json
 import pathlib
 
 from time import sleep
-from random import randint
+from random import randint, uniform
 from datetime import datetime, timedelta
-from pyautogui import alert
 from pprint import pprint
 from functools import wraps
 
 from selenium.common.exceptions import StaleElementReferenceException
 
-from config.settings import logs_folder_path
+from config.settings import logs_folder_path, click_gap, adaptive_pacing, pacing_floor, pacing_jitter
 
 
 
@@ -129,6 +129,76 @@ def print_lg(*msgs: str | dict, end: str = "\n", pretty: bool = False, flush: bo
 #>
 
 
+#< File lock related
+LOCK_STALE_SECONDS = 5      # A lock file older than this was left behind by a crashed process
+
+def try_lock_file(lock_file: str) -> bool:
+    '''
+    Function to take the exclusive `lock_file` shared by processes, returns `False` if another process holds it.
+    - Removes a stale lock file, so the next try can take it.
+    '''
+    try:
+        os.close(os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        return True
+    except FileExistsError:
+        try:
+            if datetime.now().timestamp() - os.path.getmtime(lock_file) > LOCK_STALE_SECONDS:
+                os.remove(lock_file)
+        except OSError:
+            pass
+        return False
+
+def unlock_file(lock_file: str) -> None:
+    '''
+    Function to release a `lock_file` taken with `try_lock_file()`
+    '''
+    try:
+        os.remove(lock_file)
+    except OSError:
+        pass
+#>
+
+
+#< Dialogs related
+show_dialogs = True     # False in background workers, nobody can answer their dialogs and they may have no display
+
+def _pyautogui():
+    '''
+    Function to import `pyautogui` only when it's used, it needs a display
+    '''
+    import pyautogui
+    pyautogui.FAILSAFE = False
+    return pyautogui
+
+def alert(text: str = "", title: str = "", button: str = "OK") -> str:
+    '''
+    Function to show an alert, returns the `button` clicked.
+    - Only prints `text` and returns `button` if `show_dialogs = False`.
+    '''
+    if not show_dialogs:
+        print(f"{title}: {text}")
+        return button
+    return _pyautogui().alert(text, title, button)
+
+def confirm(text: str = "", title: str = "", buttons: list[str] | tuple[str, ...] = ("OK", "Cancel")) -> str | None:
+    '''
+    Function to ask to pick one of the `buttons`, returns the button clicked.
+    - Only prints `text` and returns `None` (like a closed dialog) if `show_dialogs = False`.
+    '''
+    if not show_dialogs:
+        print(f"{title}: {text}")
+        return None
+    return _pyautogui().confirm(text, title, buttons)
+
+def press_key(key: str) -> None:
+    '''
+    Function to press a keyboard `key`, does nothing if `show_dialogs = False`.
+    '''
+    if show_dialogs:
+        _pyautogui().press(key)
+#>
+
+
 def buffer(speed: int=0) -> None:
     '''
     Function to wait within a period of selected random range.
@@ -148,13 +218,85 @@ def buffer(speed: int=0) -> None:
         return sleep(randint(18,round(speed)*10)*0.1)
     
 
+class PacingController:
+    '''
+    Adaptive replacement for `buffer(click_gap)`.
+    - Learns how fast the page responds from the time-to-element of waits, using a moving average.
+    - Shrinks the wait while the page is responsive, widens it after stale element or click intercepted errors.
+    - Never waits less than `floor` secs and always adds up to `jitter` (fraction of the wait) of random variation.
+    '''
+    def __init__(self, max_gap: float, floor: float, jitter: float, smoothing: float = 0.2, report_every: int = 50) -> None:
+        self.max_gap = max_gap
+        self.floor = min(floor, max_gap)
+        self.jitter = jitter
+        self.smoothing = smoothing
+        self.report_every = report_every
+        self.latency = None
+        self.backoff = 1.0
+        self.paces = 0
+        self.errors = 0
+        self.total_waited = 0.0
+        self.window_waited = 0.0
+
+    def observe(self, latency: float) -> None:
+        '''
+        Records how many secs the page took to respond to a wait.
+        '''
+        if latency < 0: return
+        self.latency = latency if self.latency is None else self.latency + self.smoothing * (latency - self.latency)
+
+    def penalize(self, reason: str = "") -> None:
+        '''
+        Widens the wait after the page failed to keep up (stale element, click intercepted...).
+        '''
+        self.errors += 1
+        self.backoff = min(self.backoff * 2, 4.0)
+
+    def delay(self) -> float:
+        '''
+        Returns the secs to wait before the next click, without jitter.
+        '''
+        if self.latency is None:
+            target = self.max_gap
+        else:
+            target = min(self.max_gap, max(self.floor, 2 * self.latency))
+        return max(self.floor, target * self.backoff)
+
+    def pace(self) -> None:
+        if self.max_gap <= 0: return
+        delay = self.delay()
+        delay += uniform(0, self.jitter * delay)
+        sleep(delay)
+        self.backoff = max(1.0, self.backoff * 0.8)
+        self.paces += 1
+        self.total_waited += delay
+        self.window_waited += delay
+        if self.paces % self.report_every == 0:
+            print_lg(f"Pacing: last {self.report_every} clicks waited {self.window_waited / self.report_every:.2f}s on average (page latency {self.latency or 0:.2f}s, backoff x{self.backoff:.2f})")
+            self.window_waited = 0.0
+
+    def report(self) -> None:
+        if self.paces:
+            print_lg(f"Pacing: {self.paces} clicks waited {self.total_waited / self.paces:.2f}s on average, {self.errors} slowdowns after errors")
+
+pacer = PacingController(click_gap, pacing_floor, pacing_jitter)
+
+
+def pace() -> None:
+    '''
+    Function to wait between clicks, drop-in for `buffer(click_gap)`.
+    * Adapts to the page speed if `adaptive_pacing = True` in settings, else same as `buffer(click_gap)`
+    '''
+    if adaptive_pacing: pacer.pace()
+    else: buffer(click_gap)
+
+
 def manual_login_retry(is_logged_in: callable, limit: int = 2) -> None:
     '''
     Function to ask and validate manual login
     '''
     count = 0
     while not is_logged_in():
-        from pyautogui import alert
         print_lg("Seems like you're not logged in!")
         button = "Confirm Login"
         message = 'After you successfully Log In, please click "{}" button below.'.format(button)
@@ -268,6 +410,16 @@ def truncate_for_csv(data, max_length: int = 131000, suffix: str = "...[TRUNCATE
         return f"[ERROR CONVERTING DATA: {e}]"
 
 
+def append_csv_row(path: str, row: dict) -> None:
+    '''
+    Function to append a `row` to the CSV file at `path`, writes the header (keys of `row`) if the file is empty.
+    '''
+    with open(path, 'a', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=list(row.keys()))
+        if file.tell() == 0: writer.writeheader()
+        writer.writerow(row)
+
+
 #### Selenium Helper Decorators ####
 
 def retry_on_stale_element(max_retries: int = 3, wait_time: float = 1.0):
@@ -0,0 +1,121 @@
+"""
+Job Prefetcher Module - Loads the next job's details while the current one is being applied
+A background `fetch` in the LinkedIn tab downloads the next job's page and parses its
+description, company box and hirer card with `DOMParser`, without touching the visible
+page. By the time the current Easy Apply form is done, the next job can already be
+filtered out without ever being opened
+
+Author: Performance Optimization
+"""
+
+from typing import Dict, Optional
+
+from modules.helpers import print_lg
+
+
+PREFETCH_SCRIPT = r"""
+var jobId = arguments[0];
+var store = window.__jobPrefetch = window.__jobPrefetch || {};
+if (store[jobId]) return;
+store[jobId] = {pending: true};
+var BLOCKS = "p, div, li, ul, ol, h1, h2, h3, h4, h5, h6, section, article, header, footer, table, tr, blockquote, pre, hr";
+var readable = function(element) {
+    // Text like Selenium's `.text`: textContent runs block elements together ("Requirements:5+ years")
+    var clone = element.cloneNode(true);
+    var walker = clone.ownerDocument.createTreeWalker(clone, NodeFilter.SHOW_TEXT);
+    for (var node = walker.nextNode(); node; node = walker.nextNode()) node.nodeValue = node.nodeValue.replace(/\s+/g, " ");
+    clone.querySelectorAll("br").forEach(function(br) { br.replaceWith("\n"); });
+    clone.querySelectorAll(BLOCKS).forEach(function(block) { block.before("\n"); block.after("\n"); });
+    return clone.textContent.replace(/ *\n */g, "\n").replace(/\n{3,}/g, "\n\n").trim();
+};
+var text = function(doc, selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var element = doc.querySelector(selectors[i]);
+        var value = element && readable(element);
+        if (value) return value;
+    }
+    return null;
+};
+var fromCodeBlocks = function(doc) {
+    // Logged-in pages ship their data as JSON inside <code> blocks
+    var blocks = doc.querySelectorAll("code");
+    for (var i = 0; i < blocks.length; i++) {
+        try {
+            var data = JSON.parse(blocks[i].textContent);
+            var items = [data].concat(data.included || []);
+            for (var j = 0; j < items.length; j++) {
+                var description = items[j] && items[j].description;
+                if (description && typeof description.text === "string" && description.text.trim()) return description.text.trim();
+            }
+        } catch (e) {}
+    }
+    return null;
+};
+fetch("/jobs/view/" + jobId + "/", {credentials: "include"})
+    .then(function(response) { return response.ok ? response.text() : Promise.reject(response.status); })
+    .then(function(html) {
+        var doc = new DOMParser().parseFromString(html, "text/html");
+        store[jobId] = {
+            description: text(doc, [".jobs-box__html-content", ".jobs-description__content", ".show-more-less-html__markup", ".description__text"]) || fromCodeBlocks(doc),
+            about_company: text(doc, [".jobs-company__box", ".jobs-company__company-description"]),
+            hirer: text(doc, [".hirer-card__hirer-information"])
+        };
+    })
+    .catch(function(error) { store[jobId] = {error: String(error)}; });
+"""
+
+TAKE_SCRIPT = """
+var store = window.__jobPrefetch || {};
+var entry = store[arguments[0]];
+if (!entry || entry.pending) return null;
+delete store[arguments[0]];
+return entry;
+"""
+
+
+class JobPrefetcher:
+    """Starts background fetches of upcoming jobs and hands out their parsed details"""
+
+    def __init__(self):
+        self.started = 0
+        self.ready = 0
+        self.early_skips = 0
+        self._pending: set = set()
+
+    def start(self, driver, job_id: Optional[str]) -> None:
+        """Start fetching `job_id` in the background, returns immediately"""
+        if not job_id or job_id in self._pending:
+            return
+        try:
+            driver.execute_script(PREFETCH_SCRIPT, job_id)
+            self.started += 1
+            self._pending.add(job_id)
+        except Exception as e:
+            print_lg(f"Failed to prefetch job {job_id}!", e)
+
+    def pending(self, job_id: Optional[str]) -> bool:
+        """True if `job_id` was started and not taken yet"""
+        return job_id in self._pending
+
+    def take(self, driver, job_id: Optional[str]) -> Optional[Dict]:
+        """
+        Get the prefetched details of `job_id` if they are ready
+
+        Returns:
+            Dict with `description`, `about_company` and `hirer` (each may be None), else None
+        """
+        if not self.pending(job_id):
+            return None
+        self._pending.discard(job_id)
+        try:
+            entry = driver.execute_script(TAKE_SCRIPT, job_id)
+        except Exception:
+            return None
+        if not entry or entry.get("error") or not entry.get("description"):
+            return None
+        self.ready += 1
+        return entry
+
+    def report(self) -> None:
+        if self.started:
+            print_lg(f"Prefetch: {self.ready} of {self.started} upcoming jobs were ready in time, {self.early_skips} skipped without opening them")
@@ -0,0 +1,115 @@
+"""
+Keyword Matcher Module - Compiled multi-pattern (Aho-Corasick) keyword search
+Finds every configured keyword in a text with a single linear pass instead of
+running one substring check per keyword
+
+Author: Performance Optimization
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class KeywordMatcher:
+    """Case-insensitive Aho-Corasick automaton built once from a keyword list"""
+
+    def __init__(self, keywords: Iterable[str], whole_words: bool = False):
+        """
+        Compile the automaton
+
+        Args:
+            keywords: Keywords or phrases to search for (blank entries are ignored)
+            whole_words: If True, a hit only counts when it is not surrounded by
+                         letters, digits or underscores (word-boundary semantics)
+        """
+        self.whole_words = whole_words
+        self.keywords: Dict[str, str] = {}    # normalized keyword -> original keyword
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+
+        for keyword in keywords:
+            normalized = keyword.lower() if keyword else ""
+            if normalized.strip() and normalized not in self.keywords:
+                self.keywords[normalized] = keyword
+                self._add(normalized)
+        self._build_failure_links()
+
+    def _add(self, keyword: str) -> None:
+        """Insert a normalized keyword into the trie"""
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(keyword)
+
+    def _build_failure_links(self) -> None:
+        """Breadth-first construction of failure links and merged outputs"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def _is_boundary(self, text: str, start: int, end: int) -> bool:
+        """Check that the match `text[start:end]` is not glued to surrounding word characters"""
+        if start > 0 and (text[start - 1].isalnum() or text[start - 1] == '_'):
+            return False
+        if end < len(text) and (text[end].isalnum() or text[end] == '_'):
+            return False
+        return True
+
+    def iter_matches(self, text: str) -> Iterable[Tuple[int, str]]:
+        """
+        Yield `(start_index, original_keyword)` for every hit in `text`, in order of match end
+        """
+        if not text or not self.keywords:
+            return
+        lowered = text.lower()
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for index, char in enumerate(lowered):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                for keyword in output[state]:
+                    start = index - len(keyword) + 1
+                    if self.whole_words and not self._is_boundary(lowered, start, index + 1):
+                        continue
+                    yield start, self.keywords[keyword]
+
+    def find_all(self, text: str) -> List[Tuple[int, str]]:
+        """Return all `(start_index, original_keyword)` hits in `text`"""
+        return list(self.iter_matches(text))
+
+    def first(self, text: str) -> Optional[str]:
+        """Return the first keyword found in `text`, else None"""
+        for _, keyword in self.iter_matches(text):
+            return keyword
+        return None
+
+    def hits(self, text: str) -> Set[str]:
+        """Return the set of normalized (lowercase) keywords present in `text`"""
+        return {keyword.lower() for _, keyword in self.iter_matches(text)}
+
+    def search(self, text: str) -> bool:
+        """Return True if any keyword is present in `text`"""
+        return self.first(text) is not None
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
@@ -3,52 +3,301 @@ Author:     Omkar Santosh Gutal
 LinkedIn:   https://www.linkedin.com/in/omkar-gutal-a25935249/
 '''
 
+import sys
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+
 from modules.helpers import make_directories
-from config.settings import run_in_background, stealth_mode, disable_extensions, safe_mode, file_name, failed_file_name, logs_folder_path, generated_resume_path
+from config.settings import run_in_background, stealth_mode, disable_extensions, safe_mode, file_name, failed_file_name, logs_folder_path, generated_resume_path, driver_cache_folder, block_heavy_resources, extra_blocked_urls
 from config.questions import default_resume_path
 if stealth_mode:
     import undetected_chromedriver as uc
+    from modules.driver_cache import DriverCache
 else: 
     from selenium import webdriver
     from selenium.webdriver.chrome.options import Options
     # from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
-from modules.helpers import find_default_profile_directory, critical_error_log, print_lg
+from selenium.webdriver.remote.webdriver import WebDriver
+from modules.helpers import find_default_profile_directory, critical_error_log, print_lg, alert
+
+
+@dataclass(frozen=True)
+class BrowserPreset:
+    '''
+    Reusable set of Chrome options.
+    * `use_default_profile`: Open with the user's Chrome profile, when no `profile_dir` is given to the session
+    * `block_resources`: Don't load images, fonts, videos, ads and trackers (see `BLOCKED_URL_PATTERNS`)
+    '''
+    headless: bool = False
+    use_default_profile: bool = False
+    maximize: bool = True
+    block_resources: bool = False
+    arguments: tuple[str, ...] = ()
+
+
+PRESETS: dict[str, BrowserPreset] = {
+    "default": BrowserPreset(headless=run_in_background, use_default_profile=not safe_mode, block_resources=block_heavy_resources),
+    "worker": BrowserPreset(headless=True, block_resources=block_heavy_resources),
+}
+
+# Resources the bot never reads, "*" matches anything
+BLOCKED_URL_PATTERNS = [
+    # Fonts and media
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm", "*.m3u8", "*.gif",
+    "*/dms/prv/vid/*", "*/playlist/vid/*",
+    # Ads and analytics
+    "*doubleclick.net*", "*google-analytics.com*", "*googletagmanager.com*", "*googlesyndication.com*",
+    "*bat.bing.com*", "*connect.facebook.net*", "*ads.linkedin.com*", "*snap.licdn.com*",
+    "*linkedin.com/li/track*", "*linkedin.com/tscp-serving/*", "*linkedin.com/sensorCollect*",
+]
+
+# Requests Easy Apply depends on, as host/path patterns ("*" matches anything)
+EASY_APPLY_ALLOWED_URLS = [
+    # Easy Apply form, answers and submission
+    "https://www.linkedin.com/voyager/api/voyagerJobsDashOnsiteApplyApplication*",
+    # Resume upload
+    "https://www.linkedin.com/voyager/api/voyagerMediaUploadMetadata*",
+    "https://media.licdn.com/dms/document/*",
+    # Job pages and login
+    "https://www.linkedin.com/jobs/*",
+    "https://www.linkedin.com/checkpoint/*",
+    "https://www.linkedin.com/login*",
+    # LinkedIn's app scripts and styles
+    "https://static.licdn.com/*.js",
+    "https://static.licdn.com/*.css",
+]
+
+
+def blocks_allowed_url(pattern: str, allowed: str) -> bool:
+    '''
+    Function to check if the blocked `pattern` would block requests of the `allowed` pattern Easy Apply needs.
+    * `pattern` covers `allowed`, its `*` taken as text any `*` of `pattern` can match (Eg: "*.js" covers "https://static.licdn.com/*.js")
+    * Or `allowed` covers `pattern`, it blocks some of those requests (Eg: "https://www.linkedin.com/jobs/view/*")
+    '''
+    return fnmatchcase(allowed, pattern) or fnmatchcase(pattern, allowed)
+
+
+def blocked_url_patterns(extra: list[str] = extra_blocked_urls) -> list[str]:
+    '''
+    Function to get the URL patterns to block, leaving out any pattern that would block one of `EASY_APPLY_ALLOWED_URLS`
+    '''
+    patterns = []
+    for pattern in BLOCKED_URL_PATTERNS + list(extra):
+        allowed = next((url for url in EASY_APPLY_ALLOWED_URLS if blocks_allowed_url(pattern, url)), None)
+        if allowed: print_lg(f'Not blocking "{pattern}", it would block "{allowed}" needed for Easy Apply!')
+        else: patterns.append(pattern)
+    return patterns
+
 
-try:
+def block_resources(driver: WebDriver) -> bool:
+    '''
+    Function to block the `blocked_url_patterns()` through DevTools network interception.
+    * Returns `True` if blocking is active
+    '''
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_url_patterns()})
+        return True
+    except Exception as e:
+        print_lg("Couldn't block heavy resources, pages will load everything!", e)
+        return False
+
+
+def make_bot_directories() -> None:
+    '''
+    Function to create the folders the bot writes to
+    '''
     make_directories([file_name,failed_file_name,logs_folder_path+"/screenshots",default_resume_path,generated_resume_path+"/temp"])
 
-    # Set up WebDriver with Chrome Profile
-    options = uc.ChromeOptions() if stealth_mode else Options()
-    if run_in_background:   options.add_argument("--headless")
-    if disable_extensions:  options.add_argument("--disable-extensions")
-
-    print_lg("IF YOU HAVE MORE THAN 10 TABS OPENED, PLEASE CLOSE OR BOOKMARK THEM! Or it's highly likely that application will just open browser and not do anything!")
-    if safe_mode: 
-        print_lg("SAFE MODE: Will login with a guest profile, browsing history will not be saved in the browser!")
-    else:
-        profile_dir = find_default_profile_directory()
-        if profile_dir: options.add_argument(f"--user-data-dir={profile_dir}")
-        else: print_lg("Default profile directory not found. Logging in with a guest profile, Web history will not be saved!")
-    if stealth_mode:
-        # try: 
-        #     driver = uc.Chrome(driver_executable_path="C:\\Program Files\\Google\\Chrome\\chromedriver-win64\\chromedriver.exe", options=options)
-        # except (FileNotFoundError, PermissionError) as e: 
-        #     print_lg("(Undetected Mode) Got '{}' when using pre-installed ChromeDriver.".format(type(e).__name__)) 
-            print_lg("Downloading Chrome Driver... This may take some time. Undetected mode requires download every run!")
-            driver = uc.Chrome(options=options)
-    else: driver = webdriver.Chrome(options=options) #, service=Service(executable_path="C:\\Program Files\\Google\\Chrome\\chromedriver-win64\\chromedriver.exe"))
-    driver.maximize_window()
-    wait = WebDriverWait(driver, 5)
-    actions = ActionChains(driver)
-except Exception as e:
-    msg = 'Seems like either... \n\n1. Chrome is already running. \nA. Close all Chrome windows and try again. \n\n2. Google Chrome or Chromedriver is out dated. \nA. Update browser and Chromedriver (You can run "windows-setup.bat" in /setup folder for Windows PC to update Chromedriver)! \n\n3. If error occurred when using "stealth_mode", try reinstalling undetected-chromedriver. \nA. Open a terminal and use commands "pip uninstall undetected-chromedriver" and "pip install undetected-chromedriver". \n\n\nIf issue persists, try Safe Mode. Set, safe_mode = True in config.py \n\nPlease check GitHub discussions/support for solutions https://github.com/omkargutal/linkedin_Job_Easy_Apply \n  '
-    if isinstance(e,TimeoutError): msg = "Couldn't download Chrome-driver. Set stealth_mode = False in config!"
-    print_lg(msg)
-    critical_error_log("In Opening Chrome", e)
-    from pyautogui import alert
-    alert(msg, "Error in opening chrome")
-    try: driver.quit()
-    except NameError: exit()
-    
+
+class DriverFactory:
+    '''
+    Builds Chrome drivers from named `presets`, can build any number of them.
+    '''
+    def __init__(self, presets: dict[str, BrowserPreset] = PRESETS) -> None:
+        self.presets = dict(presets)
+
+    def options(self, preset: str = "default", profile_dir: str | None = None):
+        config = self.presets[preset]
+        options = uc.ChromeOptions() if stealth_mode else Options()
+        if config.headless:
+            options.add_argument("--headless=new")
+            if sys.platform.startswith('linux'):
+                options.add_argument("--no-sandbox")
+                options.add_argument("--disable-dev-shm-usage")
+        if disable_extensions:  options.add_argument("--disable-extensions")
+        # Given as an argument, so a real Chrome profile keeps showing images when used by hand
+        if config.block_resources:  options.add_argument("--blink-settings=imagesEnabled=false")
+        for argument in config.arguments:  options.add_argument(argument)
+
+        if profile_dir:
+            make_directories([profile_dir+"/"])
+            options.add_argument(f"--user-data-dir={profile_dir}")
+        elif not config.use_default_profile: 
+            print_lg("SAFE MODE: Will login with a guest profile, browsing history will not be saved in the browser!")
+        else:
+            profile_dir = find_default_profile_directory()
+            if profile_dir: options.add_argument(f"--user-data-dir={profile_dir}")
+            else: print_lg("Default profile directory not found. Logging in with a guest profile, Web history will not be saved!")
+        return options
+
+    def create_driver(self, preset: str = "default", profile_dir: str | None = None) -> WebDriver:
+        options = self.options(preset, profile_dir)
+        if stealth_mode:
+            try: 
+                driver_path, major_version = DriverCache(driver_cache_folder).resolve()
+            except Exception as e: 
+                print_lg("(Undetected Mode) Got '{}' when resolving cached Chrome Driver.".format(type(e).__name__), e)
+                driver_path, major_version = None, None
+            if driver_path:
+                driver = uc.Chrome(options=options, driver_executable_path=driver_path, version_main=major_version)
+            else:
+                print_lg("Downloading Chrome Driver... This may take some time!")
+                driver = uc.Chrome(options=options)
+        else: driver = webdriver.Chrome(options=options) #, service=Service(executable_path="C:\\Program Files\\Google\\Chrome\\chromedriver-win64\\chromedriver.exe"))
+        if self.presets[preset].maximize: driver.maximize_window()
+        if self.presets[preset].block_resources: block_resources(driver)
+        return driver
+
+    def session(self, preset: str = "default", profile_dir: str | None = None, exit_on_error: bool = False) -> "BrowserSession":
+        return BrowserSession(self, preset, profile_dir, exit_on_error)
+
+
+class BrowserSession:
+    '''
+    One Chrome window with its `driver`, `wait` and `actions`.
+    - Chrome is opened lazily, on first access of `driver`, `wait` or `actions`, or on `start()`.
+    - `close()` quits Chrome, the session can be started again afterwards.
+    - Usable as a context manager, `with driver_factory.session("worker") as session: ...`
+    '''
+    def __init__(self, factory: DriverFactory, preset: str = "default", profile_dir: str | None = None, exit_on_error: bool = False) -> None:
+        self.factory = factory
+        self.preset = preset
+        self.profile_dir = profile_dir
+        self.exit_on_error = exit_on_error
+        self._driver: WebDriver | None = None
+        self._wait: WebDriverWait | None = None
+        self._actions: ActionChains | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._driver is not None
+
+    def start(self) -> "BrowserSession":
+        if self._driver is not None: return self
+        try:
+            if self.preset == "default":
+                make_bot_directories()
+                print_lg("IF YOU HAVE MORE THAN 10 TABS OPENED, PLEASE CLOSE OR BOOKMARK THEM! Or it's highly likely that application will just open browser and not do anything!")
+            self._driver = self.factory.create_driver(self.preset, self.profile_dir)
+            self._wait = WebDriverWait(self._driver, 5)
+            self._actions = ActionChains(self._driver)
+        except Exception as e:
+            if not self.exit_on_error: raise
+            msg = 'Seems like either... \n\n1. Chrome is already running. \nA. Close all Chrome windows and try again. \n\n2. Google Chrome or Chromedriver is out dated. \nA. Update browser and Chromedriver (You can run "windows-setup.bat" in /setup folder for Windows PC to update Chromedriver)! \n\n3. If error occurred when using "stealth_mode", try reinstalling undetected-chromedriver. \nA. Open a terminal and use commands "pip uninstall undetected-chromedriver" and "pip install undetected-chromedriver". \n\n\nIf issue persists, try Safe Mode. Set, safe_mode = True in config.py \n\nPlease check GitHub discussions/support for solutions https://github.com/omkargutal/linkedin_Job_Easy_Apply \n  '
+            if isinstance(e,TimeoutError): msg = "Couldn't download Chrome-driver. Set stealth_mode = False in config!"
+            print_lg(msg)
+            critical_error_log("In Opening Chrome", e)
+            alert(msg, "Error in opening chrome")
+            exit()
+        return self
+
+    def close(self) -> None:
+        driver, self._driver, self._wait, self._actions = self._driver, None, None, None
+        if driver is not None: driver.quit()
+
+    @property
+    def driver(self) -> WebDriver:
+        return self.start()._driver
+
+    @property
+    def wait(self) -> WebDriverWait:
+        return self.start()._wait
+
+    @property
+    def actions(self) -> ActionChains:
+        return self.start()._actions
+
+    def __enter__(self) -> "BrowserSession":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class SessionProxy:
+    '''
+    Stands in for the `driver`, `wait` or `actions` of a `BrowserSession`, opening Chrome only when first used.
+    - Is falsy until the session is open.
+    '''
+    def __init__(self, session: BrowserSession, attribute: str) -> None:
+        object.__setattr__(self, "_session", session)
+        object.__setattr__(self, "_attribute", attribute)
+
+    def __getattr__(self, name: str):
+        return getattr(getattr(self._session, self._attribute), name)
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(getattr(self._session, self._attribute), name, value)
+
+    def __bool__(self) -> bool:
+        return self._session.is_open
+
+    def __repr__(self) -> str:
+        return f"<SessionProxy of {self._attribute} ({'open' if self._session.is_open else 'not started'})>"
+
+
+PAGE_LOAD_MARK_SCRIPT = '''
+performance.setResourceTimingBufferSize(10000);
+performance.clearResourceTimings();
+return performance.now();
+'''
+
+PAGE_LOAD_MEASURE_SCRIPT = '''
+var entries = performance.getEntriesByType("resource");
+var bytes = 0;
+for (var i = 0; i < entries.length; i++) bytes += entries[i].transferSize || 0;
+return [performance.now() - arguments[0], bytes, entries.length];
+'''
+
+class PageLoadMeter:
+    '''
+    Measures load time, bytes transferred and requests made for each job, from the browser's Resource Timing.
+    - Call `start()` before opening a job and `stop()` once its details are read.
+    '''
+    def __init__(self) -> None:
+        self._started = None
+        self.jobs = 0
+        self.seconds = 0.0
+        self.bytes = 0
+        self.requests = 0
+
+    def start(self, driver: WebDriver) -> None:
+        try:    self._started = driver.execute_script(PAGE_LOAD_MARK_SCRIPT)
+        except Exception: self._started = None
+
+    def stop(self, driver: WebDriver) -> None:
+        if self._started is None: return
+        try:    elapsed, transferred, requests = driver.execute_script(PAGE_LOAD_MEASURE_SCRIPT, self._started)
+        except Exception: return
+        finally: self._started = None
+        self.jobs += 1
+        self.seconds += elapsed / 1000
+        self.bytes += transferred
+        self.requests += requests
+
+    def report(self) -> None:
+        if self.jobs:
+            print_lg(f"Page loads ({'blocking' if block_heavy_resources else 'not blocking'} heavy resources): {self.seconds / self.jobs:.2f}s, {self.bytes / self.jobs / 1024:.0f} KB and {self.requests / self.jobs:.0f} requests per job on average over {self.jobs} jobs")
+
+page_load_meter = PageLoadMeter()
+
+
+driver_factory = DriverFactory()
+# Nothing is opened on import, Chrome starts when the bot first uses `driver`, `wait` or `actions`
+default_session = driver_factory.session("default", exit_on_error=True)
+driver = SessionProxy(default_session, "driver")
+wait = SessionProxy(default_session, "wait")
+actions = SessionProxy(default_session, "actions")
@@ -0,0 +1,145 @@
+"""
+Option Index Module - Memoized answer to option matching for select and radio questions
+The same option lists (Yes/No, country lists, proficiency scales) show up on every job,
+so each distinct option list is normalized once and every resolved answer is remembered
+
+Author: Performance Optimization
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+DECLINE_PHRASES = ["Decline", "not wish", "don't wish", "Prefer not", "not want"]
+YES_PHRASES = ["Yes", "Agree", "I do", "I have"]
+NO_PHRASES = ["No", "Disagree", "I don't", "I do not"]
+
+
+def answer_phrases(answer: str) -> List[str]:
+    """
+    Phrases that an option may contain when it means the same thing as `answer`
+    """
+    if answer == 'Decline':
+        return DECLINE_PHRASES
+    elif 'yes' in answer.lower():
+        return YES_PHRASES
+    elif 'no' in answer.lower():
+        return NO_PHRASES
+    # Try partial matching for any answer, with case variants and without special characters
+    return [answer, answer.lower(), answer.upper(), ''.join(c for c in answer if c.isalnum())]
+
+
+def _digits(text: str) -> str:
+    return ''.join(c for c in text if c.isdigit())
+
+
+class OptionSet:
+    """Precomputed normalized forms of one option list plus its resolved answers"""
+
+    def __init__(self, options: Tuple[str, ...]):
+        self.options = options
+        self._lower = [option.lower() for option in options]
+        self._stripped = [option.strip() for option in self._lower]
+        self._digits = [_digits(option) for option in options]
+        self._resolved: Dict[str, Optional[str]] = {}
+        self._substring_resolved: Dict[Tuple[str, ...], Optional[int]] = {}
+
+    def match(self, answer: str) -> Optional[str]:
+        """
+        Return the option best matching `answer`, else None
+        An option matches a phrase of `answer_phrases(answer)` if their digits are equal,
+        their lowercase texts are equal, or either contains the other
+        """
+        if answer in self._resolved:
+            return self._resolved[answer]
+        found = None
+        for phrase in answer_phrases(answer):
+            phrase_lower = phrase.lower()
+            phrase_stripped = phrase_lower.strip()
+            phrase_digit = _digits(phrase)
+            for index, option_lower in enumerate(self._lower):
+                option_digit = self._digits[index]
+                if (phrase_digit and option_digit and phrase_digit == option_digit) or \
+                   (phrase_stripped == self._stripped[index]) or \
+                   (phrase_lower in option_lower) or \
+                   (option_lower in phrase_lower):
+                    found = self.options[index]
+                    break
+            if found is not None: break
+        self._resolved[answer] = found
+        return found
+
+    def find_containing(self, phrases: Sequence[str]) -> Optional[int]:
+        """
+        Return the index of the first option that contains one of `phrases` (case-sensitive), else None
+        """
+        key = tuple(phrases)
+        if key in self._substring_resolved:
+            return self._substring_resolved[key]
+        found = None
+        for phrase in phrases:
+            for index, option in enumerate(self.options):
+                if phrase in option:
+                    found = index
+                    break
+            if found is not None: break
+        self._substring_resolved[key] = found
+        return found
+
+    def __contains__(self, option: str) -> bool:
+        return option in self.options
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+
+class OptionIndex:
+    """Bounded index of option lists seen across jobs, keyed by the option tuple"""
+
+    def __init__(self, max_sets: int = 512):
+        self.max_sets = max_sets
+        self._sets: "OrderedDict[Tuple[str, ...], OptionSet]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, options: Sequence[str]) -> OptionSet:
+        """Get the indexed `OptionSet` for `options`, creating it if this list wasn't seen yet"""
+        key = tuple(options)
+        option_set = self._sets.get(key)
+        if option_set is not None:
+            self.hits += 1
+            self._sets.move_to_end(key)
+            return option_set
+        self.misses += 1
+        option_set = OptionSet(key)
+        self._sets[key] = option_set
+        if len(self._sets) > self.max_sets:
+            self._sets.popitem(last=False)
+        return option_set
+
+    def get_stats(self) -> Dict:
+        """Get index statistics"""
+        total = self.hits + self.misses
+        return {
+            'option_sets': len(self._sets),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / total) if total else 0.0,
+        }
+
+
+# Global index instance
+_option_index: Optional[OptionIndex] = None
+
+
+def get_option_index() -> OptionIndex:
+    """Get or create global option index instance"""
+    global _option_index
+    if _option_index is None:
+        _option_index = OptionIndex()
+    return _option_index
+
+
+def get_option_set(options: Sequence[str]) -> OptionSet:
+    """Convenience function to get the indexed option set for an option list"""
+    return get_option_index().get(options)
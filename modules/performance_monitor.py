@@ -22,6 +22,11 @@ class PerformanceMonitor:
             'smart_selection_matches': 0,
             'api_calls_saved': 0,
             'total_time_seconds': 0,
+            'applications': 0,
+            'ai_calls': 0,
+            'ai_prompt_tokens': 0,
+            'ai_completion_tokens': 0,
+            'ai_cost': 0.0,
             'questions_answered': [],
         }
         self.session_start = time.time()
@@ -58,6 +63,37 @@ class PerformanceMonitor:
         """Log when smart selection successfully matches an option"""
         self.metrics['smart_selection_matches'] += 1
     
+    def log_application(self):
+        """Log a submitted application"""
+        self.metrics['applications'] += 1
+
+    def log_ai_usage(self, prompt_tokens: int, completion_tokens: int, cost: float):
+        """
+        Log the tokens and cost of one AI request
+
+        Args:
+            prompt_tokens: Tokens sent
+            completion_tokens: Tokens received
+            cost: Price of the request (0 if prices are not configured)
+        """
+        self.metrics['ai_calls'] += 1
+        self.metrics['ai_prompt_tokens'] += prompt_tokens
+        self.metrics['ai_completion_tokens'] += completion_tokens
+        self.metrics['ai_cost'] += cost
+
+    def merge(self, metrics: Dict):
+        """
+        Add the counts of another process's monitor (Eg: a parallel worker) to this one
+
+        Args:
+            metrics: `get_metrics()` of the other monitor
+        """
+        for key, value in metrics.items():
+            if key == 'questions_answered':
+                self.metrics[key].extend(value)
+            elif key != 'total_time_seconds' and isinstance(value, (int, float)):
+                self.metrics[key] = self.metrics.get(key, 0) + value
+
     def get_session_duration(self) -> float:
         """Get elapsed time since session start"""
         return time.time() - self.session_start
@@ -95,6 +131,13 @@ class PerformanceMonitor:
             print(f"\nAverage Time per Question: {avg_time_per_question:.2f}s")
             print(f"Average Questions per Minute: {(60 / avg_time_per_question):.1f}")
         
+        if self.metrics['ai_calls'] > 0:
+            print(f"\nAI Requests: {self.metrics['ai_calls']}")
+            print(f"AI Tokens: {self.metrics['ai_prompt_tokens']} prompt + {self.metrics['ai_completion_tokens']} completion")
+            print(f"AI Cost of Run: ${self.metrics['ai_cost']:.4f}")
+            if self.metrics['applications'] > 0:
+                print(f"AI Cost per Application: ${self.metrics['ai_cost'] / self.metrics['applications']:.4f} ({self.metrics['applications']} applications)")
+        
         print("="*60 + "\n")
     
     def get_metrics(self) -> Dict:
@@ -0,0 +1,279 @@
+"""
+Question Rules Module - Declarative rule table for answering Easy Apply questions
+The rules replace the if/elif label chains in `answer_questions`. All rule keywords are
+compiled into one keyword matcher and a keyword -> rule dispatch index, so a label is
+classified in a single pass and the result is memoized per normalized label.
+
+Run `python -m modules.question_rules` for a micro-benchmark against sequential chains.
+
+Author: Performance Optimization
+"""
+
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from modules.keyword_matcher import KeywordMatcher
+
+
+SELECT, RADIO, TEXT, TEXTAREA = "select", "radio", "text", "textarea"
+COMMON_TYPES = (SELECT, RADIO, TEXT)
+
+
+@dataclass(frozen=True)
+class QuestionRule:
+    """
+    One label rule
+
+    * `keywords`: Groups of keywords, the label must contain at least one keyword of EVERY group
+    * `exclude`: The rule is skipped if the label contains any of these keywords
+    * `priority`: Lower runs first (same order as the old if/elif chains)
+    * `question_types`: Question types this rule applies to
+    * `source`: Name of the answer variable to use (See `QuestionRuleEngine.resolve`)
+    * `value`: Literal answer, used when `source` is None
+    * `autocomplete`: If True, the input is a type-ahead that must be confirmed from the suggestions
+    * If both `source` and `value` are None, the default answer is kept
+    """
+    name: str
+    keywords: Tuple[Tuple[str, ...], ...]
+    priority: int
+    question_types: Tuple[str, ...]
+    source: Optional[str] = None
+    value: Optional[str] = None
+    exclude: Tuple[str, ...] = ()
+    autocomplete: bool = False
+
+    def matches(self, hits: set) -> bool:
+        """Check the rule against the set of keywords found in a label"""
+        if any(word in hits for word in self.exclude):
+            return False
+        return all(any(word in hits for word in group) for group in self.keywords)
+
+
+def _rule(name: str, question_types: Tuple[str, ...], priority: int, *keywords: Iterable[str], **kwargs) -> QuestionRule:
+    groups = tuple((group,) if isinstance(group, str) else tuple(group) for group in keywords)
+    return QuestionRule(name, groups, priority, tuple(question_types), **kwargs)
+
+
+_SALARY = ('salary', 'compensation', 'ctc', 'pay')
+_CURRENT = ('current', 'present')
+
+RULES: List[QuestionRule] = [
+    # Select questions
+    _rule("select_contact", (SELECT,), 10, ('email', 'phone'), source="prev_answer"),
+    _rule("select_gender", (SELECT,), 20, ('gender', 'sex'), source="gender"),
+    _rule("select_disability", (SELECT,), 30, 'disability', source="disability_status"),
+    _rule("select_experience", (SELECT,), 40, ('experience', 'years'), source="years_of_experience"),
+    _rule("select_proficiency", (SELECT,), 50, 'proficiency', value="Professional"),
+    _rule("select_country", (SELECT,), 60, 'country', source="country"),
+    _rule("select_state", (SELECT,), 61, 'state', source="state"),
+    _rule("select_city", (SELECT,), 62, 'city', source="city_or_work_location"),
+    _rule("select_location", (SELECT,), 63, 'location', source="work_location"),
+    _rule("select_additional_months", (SELECT,), 70, 'additional', 'month', source="additional_months"),
+
+    # Radio questions
+    _rule("radio_citizenship", (RADIO,), 10, ('citizenship', 'employment eligibility'), source="us_citizenship"),
+    _rule("radio_veteran", (RADIO,), 20, ('veteran', 'protected'), source="veteran_status"),
+    _rule("radio_disability", (RADIO,), 30, ('disability', 'handicapped'), source="disability_status"),
+    _rule("radio_experience", (RADIO,), 40, ('experience', 'years'), exclude=('additional', 'month'), source="years_of_experience"),
+    _rule("radio_experience_months", (RADIO,), 41, ('experience', 'years')),
+    _rule("radio_relocation", (RADIO,), 50, ('relocate', 'relocation'), value="Yes"),
+    _rule("radio_background_check", (RADIO,), 60, 'background check', value="Yes"),
+    _rule("radio_additional_months", (RADIO,), 70, 'additional', 'month', source="additional_months"),
+
+    # Text questions
+    _rule("text_experience", (TEXT,), 10, ('experience', 'years'), source="years_of_experience"),
+    _rule("text_phone", (TEXT,), 20, ('phone', 'mobile'), source="phone_number"),
+    _rule("text_street", (TEXT,), 30, 'street', source="street"),
+    _rule("text_city", (TEXT,), 40, ('city', 'location', 'address'), source="city_or_work_location", autocomplete=True),
+    _rule("text_signature", (TEXT,), 50, 'signature', source="full_name"),
+    _rule("text_full_name", (TEXT,), 60, 'name', 'full', source="full_name"),
+    _rule("text_first_name", (TEXT,), 61, 'name', 'first', exclude=('last',), source="first_name"),
+    _rule("text_middle_name", (TEXT,), 62, 'name', 'middle', exclude=('last',), source="middle_name"),
+    _rule("text_last_name", (TEXT,), 63, 'name', 'last', exclude=('first',), source="last_name"),
+    _rule("text_employer_name", (TEXT,), 64, 'name', 'employer', source="recent_employer"),
+    _rule("text_name", (TEXT,), 65, 'name', source="full_name"),
+    _rule("text_notice_months", (TEXT,), 70, 'notice', 'month', source="notice_period_months"),
+    _rule("text_notice_weeks", (TEXT,), 71, 'notice', 'week', source="notice_period_weeks"),
+    _rule("text_notice", (TEXT,), 72, 'notice', source="notice_period"),
+    _rule("text_current_ctc_monthly", (TEXT,), 80, _SALARY, _CURRENT, 'month', source="current_ctc_monthly"),
+    _rule("text_current_ctc_lakhs", (TEXT,), 81, _SALARY, _CURRENT, 'lakh', source="current_ctc_lakhs"),
+    _rule("text_current_ctc", (TEXT,), 82, _SALARY, _CURRENT, source="current_ctc"),
+    _rule("text_desired_salary_monthly", (TEXT,), 83, _SALARY, 'month', source="desired_salary_monthly"),
+    _rule("text_desired_salary_lakhs", (TEXT,), 84, _SALARY, 'lakh', source="desired_salary_lakhs"),
+    _rule("text_desired_salary", (TEXT,), 85, _SALARY, source="desired_salary"),
+    _rule("text_linkedin", (TEXT,), 90, 'linkedin', source="linkedIn"),
+    _rule("text_website", (TEXT,), 100, ('website', 'blog', 'portfolio', 'link'), source="website"),
+    _rule("text_confidence", (TEXT,), 110, 'scale of 1-10', source="confidence_level"),
+    _rule("text_headline", (TEXT,), 120, 'headline', source="linkedin_headline"),
+    _rule("text_referral_source", (TEXT,), 130, ('hear', 'come across'), 'this', ('job', 'position'), value="https://github.com/omkargutal/linkedin_Job_Easy_Apply"),
+    _rule("text_state", (TEXT,), 140, ('state', 'province'), source="state"),
+    _rule("text_zipcode", (TEXT,), 150, ('zip', 'postal', 'code'), source="zipcode"),
+    _rule("text_country", (TEXT,), 160, 'country', source="country"),
+    _rule("text_additional_months", (TEXT,), 170, 'additional', 'month', source="additional_months"),
+
+    # Textarea questions
+    _rule("textarea_summary", (TEXTAREA,), 10, 'summary', source="linkedin_summary"),
+    _rule("textarea_cover_letter", (TEXTAREA,), 20, ('cover', 'message', 'hiring manager'), source="cover_letter"),
+    _rule("textarea_additional_information", (TEXTAREA,), 30, 'additional', 'information', value="Please see my resume for more details."),
+
+    # Common questions (checked after the type specific rules)
+    _rule("common_sponsorship", COMMON_TYPES, 1000, ('sponsorship', 'visa'), source="require_visa"),
+    _rule("common_background_check", COMMON_TYPES, 1010, ('background check', 'screening'), value="Yes"),
+    _rule("common_relocation", COMMON_TYPES, 1020, ('relocate', 'relocation'), value="Yes"),
+    _rule("common_travel", COMMON_TYPES, 1030, 'travel', value="Yes"),
+    _rule("common_start_now", COMMON_TYPES, 1040, 'start', 'now', value="Yes"),
+    _rule("common_work_authorization", COMMON_TYPES, 1050, 'authorized', ('work', 'eligible'), value="Yes"),
+    _rule("common_overtime", COMMON_TYPES, 1060, 'overtime', value="Yes"),
+    _rule("common_drug_test", COMMON_TYPES, 1070, 'drug', 'test', value="Yes"),
+    _rule("common_education", COMMON_TYPES, 1080, ('education', 'degree'), value="Yes"),
+    _rule("common_additional_documents", COMMON_TYPES, 1090, 'additional', ('document', 'attachment', 'information'), value="No"),
+]
+
+
+class QuestionRuleEngine:
+    """Compiled rule table with a keyword dispatch index and memoized label classification"""
+
+    def __init__(self, rules: Iterable[QuestionRule] = RULES, memo_size: int = 4096):
+        self.rules = sorted(rules, key=lambda rule: rule.priority)
+        keywords = {word for rule in self.rules for group in rule.keywords for word in group}
+        keywords.update(word for rule in self.rules for word in rule.exclude)
+        self.matcher = KeywordMatcher(keywords)
+
+        # A rule can only match when one of its first group keywords is present, so dispatch on those
+        self._index: Dict[Tuple[str, str], List[QuestionRule]] = {}
+        for rule in self.rules:
+            for question_type in rule.question_types:
+                for word in rule.keywords[0]:
+                    self._index.setdefault((question_type, word), []).append(rule)
+
+        self._classify = lru_cache(maxsize=memo_size)(self._classify_normalized)
+
+    @staticmethod
+    def normalize(label: str) -> str:
+        """Normalize label text for memoization"""
+        return ' '.join(label.lower().split())
+
+    def _classify_normalized(self, label: str, question_type: str) -> Optional[QuestionRule]:
+        hits = self.matcher.hits(label)
+        best: Optional[QuestionRule] = None
+        for word in hits:
+            for rule in self._index.get((question_type, word), ()):
+                if best is not None and rule.priority >= best.priority:
+                    break
+                if rule.matches(hits):
+                    best = rule
+                    break
+        return best
+
+    def classify(self, label: str, question_type: str) -> Optional[QuestionRule]:
+        """Return the highest priority rule matching `label` for `question_type`, else None"""
+        return self._classify(self.normalize(label), question_type)
+
+    def resolve(self, label: str, question_type: str, answers: Dict[str, str], default: str) -> Tuple[str, Optional[QuestionRule]]:
+        """
+        Answer a question from the rule table
+
+        Args:
+            label: Question label
+            question_type: 'select', 'radio', 'text' or 'textarea'
+            answers: Mapping of answer variable names (rule `source`) to values
+            default: Answer to use when no rule applies or the rule keeps the default
+
+        Returns:
+            Tuple of (answer, matched rule or None)
+        """
+        rule = self.classify(label, question_type)
+        if rule is None:
+            return default, None
+        if rule.source is not None:
+            return answers.get(rule.source, default), rule
+        if rule.value is not None:
+            return rule.value, rule
+        return default, rule
+
+    def classify_sequential(self, label: str, question_type: str) -> Optional[QuestionRule]:
+        """Reference implementation that scans every rule in order, like the old if/elif chains"""
+        label = label.lower()
+        for rule in self.rules:
+            if question_type not in rule.question_types:
+                continue
+            if any(word in label for word in rule.exclude):
+                continue
+            if all(any(word in label for word in group) for group in rule.keywords):
+                return rule
+        return None
+
+    def cache_info(self):
+        """Memoization statistics"""
+        return self._classify.cache_info()
+
+    def clear_cache(self) -> None:
+        """Clear memoized classifications"""
+        self._classify.cache_clear()
+
+
+# Global engine instance
+_engine: Optional[QuestionRuleEngine] = None
+
+
+def get_rule_engine() -> QuestionRuleEngine:
+    """Get or create global rule engine instance"""
+    global _engine
+    if _engine is None:
+        _engine = QuestionRuleEngine()
+    return _engine
+
+
+def benchmark(labels: List[Tuple[str, str]], rounds: int = 2000) -> Dict[str, float]:
+    """
+    Micro-benchmark the compiled engine against sequential rule chains
+
+    Args:
+        labels: List of (label, question_type) pairs
+        rounds: How many times to classify the whole list
+
+    Returns:
+        Microseconds per classification for each strategy
+    """
+    engine = QuestionRuleEngine()
+    for label, question_type in labels:
+        if engine.classify(label, question_type) != engine.classify_sequential(label, question_type):
+            raise AssertionError(f'Compiled and sequential rules disagree for "{label}" ({question_type})')
+
+    def timed(func) -> float:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for label, question_type in labels:
+                func(label, question_type)
+        return (time.perf_counter() - start) / (rounds * len(labels)) * 1e6
+
+    def compiled_cold(label: str, question_type: str):
+        return engine._classify_normalized(engine.normalize(label), question_type)
+
+    return {
+        'sequential_chains_us': timed(engine.classify_sequential),
+        'compiled_unmemoized_us': timed(compiled_cold),
+        'compiled_memoized_us': timed(engine.classify),
+    }
+
+
+if __name__ == "__main__":
+    sample_labels = [
+        ("How many years of work experience do you have with Python?", TEXT),
+        ("Mobile phone number", TEXT),
+        ("What is your current CTC in lakhs?", TEXT),
+        ("What is your notice period in weeks?", TEXT),
+        ("First name", TEXT),
+        ("How did you hear about this job?", TEXT),
+        ("Will you now or in the future require sponsorship for employment visa status?", RADIO),
+        ("Are you legally authorized to work in India?", RADIO),
+        ("Are you comfortable commuting to this job's location?", SELECT),
+        ("What is your level of proficiency in English?", SELECT),
+        ("Do you have a Bachelor's degree?", SELECT),
+        ("Cover letter", TEXTAREA),
+        ("Describe a challenging project you led", TEXTAREA),
+    ]
+    for name, micros in benchmark(sample_labels).items():
+        print(f"{name}: {micros:.2f}")
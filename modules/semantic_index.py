@@ -0,0 +1,277 @@
+"""
+Semantic Index Module - Finds saved answers of questions asked in other words
+Question labels are embedded into vectors, by a local embedding model if one is
+configured, else by a small built-in hashing vectorizer. The vectors are kept in one
+contiguous matrix saved next to the answer cache, so the nearest saved question of a
+new one is a single matrix-vector product
+
+Author: Performance Optimization
+"""
+
+import json
+import math
+import os
+import re
+import urllib.request
+from hashlib import md5
+from typing import Dict, List, Tuple
+
+from modules.helpers import print_lg
+
+try:
+    import numpy as np
+except ImportError:     # NumPy is optional, plain lists are fast enough for a few thousand questions
+    np = None
+
+
+VECTORS_FILE = "logs/question_vectors.npy"
+VECTORS_KEYS_FILE = "logs/question_vectors.json"
+HASH_DIMENSIONS = 512
+TOP_CANDIDATES = 5          # Nearest questions checked for a usable answer
+
+# Words that don't tell questions apart
+STOP_WORDS = {
+    "a", "an", "the", "and", "or", "of", "to", "in", "on", "at", "for", "with", "by", "from", "as", "about",
+    "you", "your", "yours", "we", "our", "us", "i", "me", "my", "this", "that", "these", "those", "it", "its",
+    "do", "does", "did", "have", "has", "had", "are", "is", "am", "be", "been", "will", "would", "can", "could",
+    "how", "many", "much", "what", "which", "please", "enter", "provide", "select", "any", "if", "so", "total",
+}
+# Words asked in other words, mapped to one canonical word
+CANONICAL_WORDS = {
+    "yrs": "years", "yr": "years", "year": "years",
+    "exp": "experience", "experienced": "experience", "worked": "experience", "working": "experience",
+    "expected": "expectation", "expectations": "expectation", "expecting": "expectation", "desired": "expectation",
+    "compensation": "salary", "ctc": "salary", "pay": "salary",
+    "relocating": "relocate", "relocation": "relocate",
+    "joining": "start", "join": "start",
+    "skills": "skill", "proficient": "proficiency", "familiar": "proficiency", "familiarity": "proficiency",
+    "authorised": "authorized", "authorization": "authorized", "sponsor": "sponsorship",
+    "requires": "require", "required": "require",
+}
+# Generic words of how a question is asked. Words that change what is asked (Eg: "current" vs
+# "expectation", "authorized" vs "sponsorship") are not generic and stay part of the subject
+QUESTION_WORDS = STOP_WORDS | {
+    "years", "yrs", "yr", "year", "experience", "exp", "experienced", "worked", "working", "skill", "skills",
+    "proficiency", "proficient", "familiar", "familiarity", "work", "job", "role", "position", "company", "level",
+    "number", "rate", "scale", "rating", "yes", "no", "per", "professional", "hands", "using", "use", "used",
+    "knowledge", "comfortable", "willing", "able", "open", "legally", "describe", "tell", "why",
+}
+
+TOKEN = re.compile(r"[A-Za-z0-9][A-Za-z0-9+#.]*[A-Za-z0-9+#]|[A-Za-z0-9]")
+
+
+def tokenize(question: str) -> List[str]:
+    """Lowercase canonical words of `question` without stop words"""
+    words = [CANONICAL_WORDS.get(word, word) for word in TOKEN.findall(question.lower())]
+    return [word for word in words if word not in STOP_WORDS]
+
+
+def subject_terms(question: str) -> frozenset:
+    """
+    Words of `question` that aren't generic question words, what it is about (Eg: "python", "aws", "c++", "5").
+    Questions about different subjects can read almost the same, so their terms must agree
+    """
+    return frozenset(word for word in tokenize(question) if word not in QUESTION_WORDS)
+
+
+def hash_embed(question: str, dimensions: int = HASH_DIMENSIONS) -> List[float]:
+    """
+    Unit length hashing vector of the words, word pairs and character trigrams of `question`
+    Trigrams make "engineer" and "engineering" close, without any model
+    """
+    words = tokenize(question)
+    features: Dict[str, float] = {}
+    for i, word in enumerate(words):
+        # Generic question words count half, the subject decides what is asked
+        weight = 0.5 if word in QUESTION_WORDS else 1.0
+        features["w:" + word] = features.get("w:" + word, 0.0) + weight
+        if i:
+            pair = f"p:{words[i - 1]} {word}"
+            features[pair] = features.get(pair, 0.0) + 0.5 * weight
+        padded = f" {word} "
+        for j in range(len(padded) - 2):
+            trigram = "c:" + padded[j:j + 3]
+            features[trigram] = features.get(trigram, 0.0) + 0.25 * weight
+    vector = [0.0] * dimensions
+    for feature, weight in features.items():
+        digest = md5(feature.encode()).digest()
+        index = int.from_bytes(digest[:4], "big") % dimensions
+        vector[index] += weight if digest[4] & 1 else -weight
+    return _unit(vector)
+
+
+def _unit(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(value * value for value in vector))
+    return [value / norm for value in vector] if norm else vector
+
+
+class EmbeddingEndpoint:
+    """Embeds questions through a local OpenAI-compatible `/embeddings` endpoint (Eg: LM Studio, Ollama)"""
+
+    def __init__(self, url: str, model: str, timeout: float = 30):
+        self.url = url.rstrip("/") + "/embeddings"
+        self.model = model
+        self.timeout = timeout
+
+    @property
+    def name(self) -> str:
+        return f"{self.url}|{self.model}"
+
+    def embed(self, questions: List[str]) -> List[List[float]]:
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps({"model": self.model, "input": questions}).encode(),
+            headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            data = json.load(response)["data"]
+        return [_unit(item["embedding"]) for item in sorted(data, key=lambda item: item["index"])]
+
+
+class HashEmbedder:
+    """Built-in embedder, works offline and needs no model"""
+
+    name = f"hash-{HASH_DIMENSIONS}"
+
+    def embed(self, questions: List[str]) -> List[List[float]]:
+        return [hash_embed(question) for question in questions]
+
+
+class SemanticIndex:
+    """
+    Vectors of question labels, one row per answer cache key.
+    Rows live in a preallocated matrix that doubles when full, so adding stays cheap
+    """
+
+    def __init__(self, embedder, vectors_file: str = VECTORS_FILE, keys_file: str = VECTORS_KEYS_FILE):
+        self.embedder = embedder
+        self.vectors_file = vectors_file
+        self.keys_file = keys_file
+        self.keys: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._matrix = None
+        self.failed = False
+        self.hits = 0
+        self.lookups = 0
+        self._load()
+
+    # Storage
+    def _load(self) -> None:
+        if np is None or not os.path.exists(self.vectors_file) or not os.path.exists(self.keys_file):
+            return
+        try:
+            with open(self.keys_file, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            matrix = np.load(self.vectors_file)
+            # Vectors of another embedder can't be compared with this one's
+            if meta.get('embedder') != self.embedder.name or len(meta.get('keys', [])) != len(matrix):
+                return
+            self._matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+            self.keys = list(meta['keys'])
+            self._rows = {key: row for row, key in enumerate(self.keys)}
+        except Exception:
+            self.keys, self._rows, self._matrix = [], {}, None
+
+    def save(self) -> None:
+        if np is None or self._matrix is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.vectors_file), exist_ok=True)
+            temp_file = f"{self.vectors_file}.{os.getpid()}.tmp.npy"
+            np.save(temp_file, self._matrix[:len(self.keys)])
+            os.replace(temp_file, self.vectors_file)
+            with open(self.keys_file, 'w', encoding='utf-8') as f:
+                json.dump({'embedder': self.embedder.name, 'keys': self.keys}, f)
+        except Exception as e:
+            print(f"Warning: Could not save question vectors: {e}")
+
+    def _append(self, keys: List[str], vectors: List[List[float]]) -> None:
+        if np is None:
+            self._matrix = (self._matrix or []) + vectors
+        else:
+            needed = len(self.keys) + len(keys)
+            if self._matrix is None or needed > len(self._matrix):
+                capacity = max(64, needed, 2 * (len(self._matrix) if self._matrix is not None else 0))
+                grown = np.zeros((capacity, len(vectors[0])), dtype=np.float32)
+                if self._matrix is not None:
+                    grown[:len(self.keys)] = self._matrix[:len(self.keys)]
+                self._matrix = grown
+            self._matrix[len(self.keys):needed] = np.asarray(vectors, dtype=np.float32)
+        for key in keys:
+            self._rows[key] = len(self.keys)
+            self.keys.append(key)
+
+    def _embed_failed(self, error: Exception) -> None:
+        # Don't wait on a dead endpoint for every question, the rules and the AI still answer them
+        self.failed = True
+        print_lg("Question embedding failed, similar questions won't be matched in this run!", error)
+
+    def _drop_missing(self, questions: Dict[str, str]) -> None:
+        """Drop the rows of keys no longer in `questions` (Eg: expired answers)"""
+        kept = [row for row, key in enumerate(self.keys) if key in questions]
+        if len(kept) == len(self.keys):
+            return
+        if np is None:
+            self._matrix = [self._matrix[row] for row in kept]
+        else:
+            self._matrix = np.ascontiguousarray(self._matrix[kept])
+        self.keys = [self.keys[row] for row in kept]
+        self._rows = {key: row for row, key in enumerate(self.keys)}
+
+    def sync(self, questions: Dict[str, str]) -> bool:
+        """
+        Match the rows to `questions` (cache key -> question), embedding the new ones in one batch
+
+        Returns:
+            True if vectors were added
+        """
+        if self.failed:
+            return False
+        self._drop_missing(questions)
+        missing = [key for key in questions if key not in self._rows]
+        if not missing:
+            return False
+        try:
+            vectors = self.embedder.embed([questions[key] for key in missing])
+        except Exception as e:
+            self._embed_failed(e)
+            return False
+        self._append(missing, vectors)
+        return True
+
+    def nearest(self, question: str, top: int = TOP_CANDIDATES) -> List[Tuple[str, float]]:
+        """
+        Cache keys of the `top` saved questions nearest to `question`
+
+        Returns:
+            List of (key, cosine similarity), most similar first
+        """
+        if not self.keys or self.failed:
+            return []
+        try:
+            query = self.embedder.embed([question])[0]
+        except Exception as e:
+            self._embed_failed(e)
+            return []
+        size = len(self.keys)
+        if np is None:
+            scores = [sum(a * b for a, b in zip(row, query)) for row in self._matrix]
+            best = sorted(range(size), key=scores.__getitem__, reverse=True)[:top]
+            return [(self.keys[row], scores[row]) for row in best]
+        scores = self._matrix[:size] @ np.asarray(query, dtype=np.float32)
+        if size > top:
+            best = np.argpartition(scores, -top)[-top:]
+            best = best[np.argsort(scores[best])[::-1]]
+        else:
+            best = np.argsort(scores)[::-1]
+        return [(self.keys[row], float(scores[row])) for row in best]
+
+    def report(self) -> None:
+        if self.lookups:
+            print_lg(f"Similar questions: {self.hits} of {self.lookups} unanswered questions answered from saved answers")
+
+
+def create_semantic_index(embedding_url: str = "", embedding_model: str = "") -> SemanticIndex:
+    """Semantic index on the local embedding endpoint if `embedding_url` is given, else on the built-in embedder"""
+    embedder = EmbeddingEndpoint(embedding_url, embedding_model) if embedding_url else HashEmbedder()
+    return SemanticIndex(embedder)
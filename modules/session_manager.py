@@ -0,0 +1,111 @@
+"""
+Session Manager Module - Keeps logged-in browser sessions warm between runs
+Checking the LinkedIn auth cookie tells whether a browser is still logged in without
+loading any page, so a warm session is handed to the next run (Eg: next scheduled
+cycle) with near zero setup instead of going through the login page again
+
+Author: Performance Optimization
+"""
+
+import time
+from typing import Callable, Dict, List, Optional
+
+from modules.helpers import print_lg
+
+
+LINKEDIN_AUTH_COOKIE = "li_at"
+EXPIRY_MARGIN = 300     # Treat cookies expiring within this many secs as expired
+
+
+def get_auth_cookie(driver) -> Optional[Dict]:
+    """
+    Get LinkedIn's auth cookie from the browser without navigating anywhere
+
+    Uses the DevTools protocol to read cookies of all domains, falls back to the
+    cookies of the current page if DevTools is not available
+    """
+    try:
+        cookies = driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+    except Exception:
+        try:
+            cookies = driver.get_cookies()
+        except Exception:
+            return None
+    for cookie in cookies:
+        if cookie.get("name") == LINKEDIN_AUTH_COOKIE and "linkedin.com" in cookie.get("domain", ""):
+            return cookie
+    return None
+
+
+def has_valid_session(driver, margin: float = EXPIRY_MARGIN) -> bool:
+    """Check if the browser holds a LinkedIn auth cookie that is not about to expire"""
+    cookie = get_auth_cookie(driver)
+    if not cookie or not cookie.get("value"):
+        return False
+    # DevTools reports session cookies with `expires = -1`, WebDriver leaves out `expiry`
+    expires = cookie.get("expires", cookie.get("expiry", -1))
+    return expires is None or expires <= 0 or expires > time.time() + margin
+
+
+class SessionManager:
+    """Hands out warm, logged-in `BrowserSession`s and keeps them open between runs"""
+
+    def __init__(self, sessions: List, login: Callable):
+        """
+        Args:
+            sessions: `BrowserSession`s to manage, each with a persisted profile or the default one
+            login: `login(session)` makes sure the session is logged in (cheap when it already is)
+        """
+        self.login = login
+        self._idle = list(sessions)
+        self._busy: List = []
+        self.logins = 0
+        self.setup_seconds: List[float] = []
+
+    def _prepare(self, session) -> None:
+        started = time.perf_counter()
+        session.start()
+        if not has_valid_session(session.driver):
+            self.logins += 1
+        self.login(session)
+        self.setup_seconds.append(time.perf_counter() - started)
+
+    def warm_up(self) -> None:
+        """Open and log in every idle session now, so the next `acquire()` is instant"""
+        for session in self._idle:
+            self._prepare(session)
+        print_lg(f"{len(self._idle)} browser session(s) are warm and logged in.")
+
+    def acquire(self):
+        """Get a ready, logged-in session"""
+        if not self._idle:
+            raise RuntimeError("No idle browser session left!")
+        # Prefer a session that is still open and logged in
+        index = next((i for i, session in enumerate(self._idle) if session.is_open and has_valid_session(session.driver)), 0)
+        session = self._idle.pop(index)
+        self._prepare(session)
+        self._busy.append(session)
+        print_lg(f"Browser session ready in {self.setup_seconds[-1]:.1f}s.")
+        return session
+
+    def release(self, session) -> None:
+        """Return a session to keep it warm for the next run"""
+        if session in self._busy:
+            self._busy.remove(session)
+        self._idle.append(session)
+
+    def close_all(self) -> None:
+        for session in self._idle + self._busy:
+            try:
+                session.close()
+            except Exception as e:
+                print_lg("Failed to close browser session!", e)
+        self._idle, self._busy = [], []
+
+    def get_stats(self) -> Dict:
+        return {
+            "sessions": len(self._idle) + len(self._busy),
+            "logins": self.logins,
+            "setups": len(self.setup_seconds),
+            "average_setup_seconds": (sum(self.setup_seconds) / len(self.setup_seconds)) if self.setup_seconds else 0.0,
+        }
@@ -0,0 +1,204 @@
+"""
+Skills Cache Module - Remembers the skills extracted from job descriptions
+Reposted jobs and the same job posted in several locations carry the same description,
+their skills are looked up by a hash of the normalized description instead of asking
+the AI again. A SimHash of the description optionally finds near-duplicates too
+
+Author: Performance Optimization
+"""
+
+import json
+import os
+import re
+import time
+from datetime import datetime
+from hashlib import md5, sha256
+from typing import Callable, Dict, List, Optional
+
+from config.settings import reuse_skills_of_similar_jobs
+from modules.helpers import print_lg, try_lock_file, unlock_file
+
+
+SKILLS_CACHE_FILE = "logs/skills_cache.json"
+MAX_ENTRIES = 5000          # Oldest entries are dropped beyond this
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4           # Fingerprints within `SIMHASH_BANDS - 1` bits share at least one band
+MAX_DISTANCE = 3            # Max differing bits of near-duplicate descriptions
+
+
+def normalize_description(description: str) -> str:
+    """Lowercase words of `description` without punctuation and extra whitespace"""
+    return " ".join(re.findall(r"[a-z0-9+#]+", description.lower()))
+
+
+def simhash(text: str, shingle_size: int = 3) -> int:
+    """64 bit SimHash of the word shingles of normalized `text`"""
+    words = text.split()
+    shingles = [" ".join(words[i:i + shingle_size]) for i in range(max(1, len(words) - shingle_size + 1))]
+    weights = [0] * SIMHASH_BITS
+    for shingle in shingles:
+        value = int.from_bytes(md5(shingle.encode()).digest()[:8], "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit in range(SIMHASH_BITS) if weights[bit] > 0)
+
+
+def _bands(fingerprint: int) -> List[int]:
+    width = SIMHASH_BITS // SIMHASH_BANDS
+    mask = (1 << width) - 1
+    return [(band << width) | (fingerprint >> (band * width) & mask) for band in range(SIMHASH_BANDS)]
+
+
+class SkillsCache:
+    """Persistent cache of extracted skills keyed by job description fingerprint"""
+
+    def __init__(self, cache_file: str = SKILLS_CACHE_FILE, near_duplicates: bool = True,
+                 sink: Optional[Callable[[str, Dict], None]] = None):
+        self.cache_file = cache_file
+        self.near_duplicates = near_duplicates
+        self.sink = sink
+        self.cache: Dict = self._load_cache()
+        self._new_keys: set = set()
+        self._band_index: Dict[int, List[str]] = {}
+        for key, entry in self.cache.items():
+            self._index(key, entry)
+        self.hits = 0
+        self.near_hits = 0
+        self.misses = 0
+
+    def _load_cache(self) -> Dict:
+        """Load cache from file if exists"""
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except:
+                return {}
+        return {}
+
+    def _save_cache(self) -> None:
+        """
+        Save cache to file
+        Merges entries other processes saved meanwhile and replaces the file atomically,
+        under a lock file so concurrent saves don't drop each other's entries
+        """
+        lock_file = self.cache_file + ".lock"
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            while not try_lock_file(lock_file):
+                time.sleep(0.01)
+        except Exception as e:
+            print(f"Warning: Could not save skills cache: {e}")
+            return
+        try:
+            merged = self._load_cache()
+            merged.update({key: self.cache[key] for key in self._new_keys if key in self.cache})
+            if len(merged) > MAX_ENTRIES:
+                oldest = sorted(merged, key=lambda key: merged[key].get('timestamp', ''))
+                for key in oldest[:len(merged) - MAX_ENTRIES]:
+                    del merged[key]
+            temp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(merged, f, ensure_ascii=False)
+            os.replace(temp_file, self.cache_file)
+            self._new_keys.clear()
+        except Exception as e:
+            print(f"Warning: Could not save skills cache: {e}")
+        finally:
+            unlock_file(lock_file)
+
+    def _index(self, key: str, entry: Dict) -> None:
+        if self.near_duplicates and 'simhash' in entry:
+            for band in _bands(entry['simhash']):
+                self._band_index.setdefault(band, []).append(key)
+
+    def _find_near_duplicate(self, fingerprint: int) -> Optional[str]:
+        seen = set()
+        for band in _bands(fingerprint):
+            for key in self._band_index.get(band, []):
+                if key in seen or key not in self.cache:
+                    continue
+                seen.add(key)
+                if bin(self.cache[key]['simhash'] ^ fingerprint).count("1") <= MAX_DISTANCE:
+                    return key
+        return None
+
+    def get(self, description: str) -> Optional[Dict | List]:
+        """
+        Get the cached skills of `description` or of a near-duplicate description
+
+        Returns:
+            Parsed skills JSON if found, else None
+        """
+        normalized = normalize_description(description)
+        key = sha256(normalized.encode()).hexdigest()
+        entry = self.cache.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry['skills']
+        if self.near_duplicates and normalized:
+            near_key = self._find_near_duplicate(simhash(normalized))
+            if near_key:
+                self.near_hits += 1
+                return self.cache[near_key]['skills']
+        self.misses += 1
+        return None
+
+    def set(self, description: str, skills: Dict | List) -> None:
+        """Store the parsed `skills` extracted from `description`"""
+        normalized = normalize_description(description)
+        key = sha256(normalized.encode()).hexdigest()
+        entry = {
+            'skills': skills,
+            'simhash': simhash(normalized),
+            'timestamp': datetime.now().isoformat()
+        }
+        self.add(key, entry)
+
+    def add(self, key: str, entry: Dict) -> None:
+        """Store an `entry` made by `set()`, here or in another process"""
+        self.cache[key] = entry
+        self._index(key, entry)
+        if self.sink:
+            # Another process owns the cache file, hand the entry over to it
+            self.sink(key, entry)
+        else:
+            self._new_keys.add(key)
+            self._save_cache()
+
+    def get_stats(self) -> Dict:
+        """Get cache statistics of this run"""
+        lookups = self.hits + self.near_hits + self.misses
+        return {
+            'total_cached': len(self.cache),
+            'hits': self.hits,
+            'near_hits': self.near_hits,
+            'misses': self.misses,
+            'hit_rate': ((self.hits + self.near_hits) / lookups) if lookups else 0.0,
+        }
+
+    def report(self) -> None:
+        stats = self.get_stats()
+        if stats['hits'] + stats['near_hits'] + stats['misses']:
+            print_lg(f"Skills cache: {stats['hit_rate']:.0%} hit rate ({stats['hits']} exact, {stats['near_hits']} near-duplicate, {stats['misses']} extracted by AI)")
+
+
+# Global cache instance
+_skills_cache: Optional[SkillsCache] = None
+_skills_sink: Optional[Callable[[str, Dict], None]] = None
+
+
+def get_skills_cache() -> SkillsCache:
+    """Get or create global skills cache instance"""
+    global _skills_cache
+    if _skills_cache is None:
+        _skills_cache = SkillsCache(near_duplicates=reuse_skills_of_similar_jobs, sink=_skills_sink)
+    return _skills_cache
+
+
+def set_skills_sink(sink: Optional[Callable[[str, Dict], None]]) -> None:
+    """Send new entries to `sink(key, entry)` instead of writing the cache file"""
+    global _skills_sink
+    _skills_sink = sink
+    if _skills_cache is not None:
+        _skills_cache.sink = sink
@@ -15,6 +15,11 @@ def check_int(var: int, var_name: str, min_value: int=0) -> bool | TypeError | V
     if var < min_value: raise ValueError(f'The variable "{var_name}" in "{__validation_file_path}" expects an Integer greater than or equal to `{min_value}`! Received `{var}` instead!\n\nSolution:\nPlease open "{__validation_file_path}" and update "{var_name}" accordingly.')
     return True
 
+def check_number(var: int | float, var_name: str, min_value: float=0, max_value: float | None=None) -> bool | TypeError | ValueError:
+    if isinstance(var, bool) or not isinstance(var, (int, float)): raise TypeError(f'The variable "{var_name}" in "{__validation_file_path}" must be a Number!\nReceived "{var}" of type "{type(var)}" instead!\n\nSolution:\nPlease open "{__validation_file_path}" and update "{var_name}" to be a Number.\nExample: `{var_name} = 0.5`\n\nNOTE: Do NOT surround Number values in quotes ("0.5")X !\n\n')
+    if var < min_value or (max_value is not None and var > max_value): raise ValueError(f'The variable "{var_name}" in "{__validation_file_path}" expects a Number from `{min_value}`{f" to `{max_value}`" if max_value is not None else " or greater"}! Received `{var}` instead!\n\nSolution:\nPlease open "{__validation_file_path}" and update "{var_name}" accordingly.')
+    return True
+
 def check_boolean(var: bool, var_name: str) -> bool | ValueError:
     if var == True or var == False: return True
     raise ValueError(f'The variable "{var_name}" in "{__validation_file_path}" expects a Boolean input `True` or `False`, not "{var}" of type "{type(var)}" instead!\n\nSolution:\nPlease open "{__validation_file_path}" and update "{var_name}" to either `True` or `False` (case-sensitive, T and F must be CAPITAL/uppercase).\nExample: `{var_name} = True`\n\nNOTE: Do NOT surround Boolean values in quotes ("True")X !\n\n')
@@ -132,6 +137,7 @@ def validate_search() -> None | ValueError | TypeError:
     check_list(about_company_bad_words, "about_company_bad_words")
     check_list(about_company_good_words, "about_company_good_words")
     check_list(bad_words, "bad_words")
+    check_boolean(match_whole_words, "match_whole_words")
     check_boolean(security_clearance, "security_clearance")
     check_boolean(did_masters, "did_masters")
     check_int(current_experience, "current_experience", -1)
@@ -153,8 +159,23 @@ def validate_secrets() -> None | ValueError | TypeError:
     check_boolean(use_AI, "use_AI")
     check_string(llm_api_url, "llm_api_url", min_length=5)
     check_string(llm_api_key, "llm_api_key")
-    # check_string(llm_embedding_model, "llm_embedding_model")
+    check_string(llm_embedding_url, "llm_embedding_url")
+    check_string(llm_embedding_model, "llm_embedding_model")
     check_boolean(stream_output, "stream_output")
+    check_int(ai_max_concurrent_requests, "ai_max_concurrent_requests", 1)
+    check_number(ai_request_timeout, "ai_request_timeout", 1)
+    check_int(ai_max_retries, "ai_max_retries", 0)
+    check_int(ai_circuit_breaker_failures, "ai_circuit_breaker_failures", 0)
+    check_number(ai_circuit_breaker_cooldown, "ai_circuit_breaker_cooldown", 1)
+    check_number(ai_requests_per_minute, "ai_requests_per_minute", 0)
+    check_number(ai_tokens_per_minute, "ai_tokens_per_minute", 0)
+    check_string(ai_rate_limit_file, "ai_rate_limit_file")
+    check_number(ai_price_per_million_input_tokens, "ai_price_per_million_input_tokens", 0)
+    check_number(ai_price_per_million_output_tokens, "ai_price_per_million_output_tokens", 0)
+    check_number(ai_response_cache_hours, "ai_response_cache_hours", 0)
+    check_int(ai_response_cache_size, "ai_response_cache_size", 0)
+    check_int(ai_job_description_tokens, "ai_job_description_tokens", 0)
+    check_int(ai_pre_answer_questions, "ai_pre_answer_questions", 0)
     
     ##> ------ Yang Li : MARKYangL - Feature ------
     # Validate DeepSeek configuration
@@ -196,13 +217,25 @@ def validate_settings() -> None | ValueError | TypeError:
     check_string(logs_folder_path, "logs_folder_path", min_length=1)
 
     check_int(click_gap, "click_gap", 0)
+    check_boolean(adaptive_pacing, "adaptive_pacing")
+    check_number(pacing_floor, "pacing_floor", 0)
+    check_number(pacing_jitter, "pacing_jitter", 0, 1)
 
     check_boolean(run_in_background, "run_in_background")
     check_boolean(disable_extensions, "disable_extensions")
     check_boolean(safe_mode, "safe_mode")
     check_boolean(smooth_scroll, "smooth_scroll")
+    check_boolean(prefetch_next_job, "prefetch_next_job")
+    check_boolean(block_heavy_resources, "block_heavy_resources")
+    check_list(extra_blocked_urls, "extra_blocked_urls")
     check_boolean(keep_screen_awake, "keep_screen_awake")
     check_boolean(stealth_mode, "stealth_mode")
+    check_string(driver_cache_folder, "driver_cache_folder", min_length=1)
+    check_int(parallel_workers, "parallel_workers", 1)
+    check_string(worker_profiles_folder, "worker_profiles_folder", min_length=1)
+    check_int(max_applications_per_minute, "max_applications_per_minute", 0)
+    check_boolean(reuse_skills_of_similar_jobs, "reuse_skills_of_similar_jobs")
+    check_number(similar_question_threshold, "similar_question_threshold", 0, 1)
 
 
 
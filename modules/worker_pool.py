@@ -0,0 +1,198 @@
+"""
+Worker Pool Module - Applies to jobs with several browsers in parallel
+Every worker process opens its own headless Chrome with its own profile directory and
+takes search terms from a shared queue. Applied and failed job rows, newly cached answers
+and extracted skills flow back to the parent process, the single writer of the CSV
+history and the caches, and so do the workers' counters and AI usage for the summary.
+A shared rate limiter caps applications per minute across all workers. Workers show no
+dialogs, so they run without a display
+
+Author: Performance Optimization
+"""
+
+import multiprocessing as mp
+import os
+import time
+from queue import Empty
+from random import shuffle
+from typing import Dict, List
+
+from config.settings import worker_profiles_folder, max_applications_per_minute
+from config.questions import default_resume_path
+from config.search import randomize_search_order
+from modules import helpers
+from modules.helpers import append_csv_row, make_directories, print_lg, critical_error_log
+from modules.answer_cache import cache_answer
+from modules.skills_cache import get_skills_cache
+from modules.performance_monitor import get_monitor
+from modules.open_chrome import make_bot_directories
+
+
+COUNTERS = ["easy_applied_count", "external_jobs_count", "failed_count", "skip_count"]
+
+
+class RateLimiter:
+    """Spaces out job applications evenly across all worker processes"""
+
+    def __init__(self, per_minute: int, ctx=mp):
+        self.interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._next_slot = ctx.Value('d', 0.0)
+
+    def wait(self) -> float:
+        """Block until this process may start its next application, returns the secs waited"""
+        if not self.interval:
+            return 0.0
+        with self._next_slot.get_lock():
+            now = time.time()
+            slot = max(now, self._next_slot.value)
+            self._next_slot.value = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+def _worker(worker_id: int, tasks, results, claims, rate_limiter: RateLimiter, use_new_resume: bool) -> None:
+    """Entry point of a worker process, applies to the search terms it takes from `tasks`"""
+    # Nobody can answer dialogs of a background browser, and `pyautogui` would need a display
+    helpers.show_dialogs = False
+    # Set before the caches are first used, a worker never writes their files
+    from modules.answer_cache import set_answer_sink
+    from modules.skills_cache import set_skills_sink
+    set_answer_sink(lambda question, answer, question_type, source: results.put(("answer", question, answer, question_type, source)))
+    set_skills_sink(lambda key, entry: results.put(("skills", key, entry)))
+    # Imported in the worker process, the bot's globals then belong to this worker alone
+    import runAiBot as bot
+    from modules.open_chrome import driver_factory
+
+    stats = {counter: 0 for counter in COUNTERS}
+    profile_dir = os.path.abspath(os.path.join(worker_profiles_folder, f"worker-{worker_id}"))
+    session = driver_factory.session("worker", profile_dir)
+    try:
+        bot.driver, bot.wait, bot.actions = session.driver, session.wait, session.actions
+    except Exception as e:
+        critical_error_log(f"Worker {worker_id} failed to open Chrome!", e)
+        results.put(("done", worker_id, stats, get_monitor().get_metrics()))
+        return
+
+    def job_gate(job_id: str) -> bool:
+        # First worker to claim a job applies to it, the others skip it
+        if claims.setdefault(job_id, worker_id) != worker_id:
+            return False
+        rate_limiter.wait()
+        return True
+
+    bot.history_sink = lambda path, row: results.put(("row", path, row))
+    bot.job_gate = job_gate
+    bot.pause_before_submit = False
+    bot.pause_at_failed_question = False
+    bot.pause_after_filters = False
+    bot.keep_screen_awake = False
+    bot.useNewResume = use_new_resume
+
+    try:
+        bot.perform_login()
+        if bot.use_AI:
+            bot.aiClient = bot.create_ai_provider(bot.ai_provider, bot.user_information_all)
+        while not bot.dailyEasyApplyLimitReached:
+            try:
+                search_term = tasks.get(timeout=1)
+            except Empty:
+                break
+            print_lg(f'Worker {worker_id} is searching for "{search_term}"')
+            bot.apply_to_jobs([search_term])
+    except Exception as e:
+        critical_error_log(f"In worker {worker_id}", e)
+    finally:
+        stats = {counter: getattr(bot, counter) for counter in COUNTERS}
+        try:
+            if bot.aiClient:
+                bot.aiClient.report()
+                bot.aiClient.close()
+        except Exception as e:
+            print_lg(f"Worker {worker_id} failed to close AI client!", e)
+        try:
+            session.close()
+        except Exception:
+            pass
+        # Last message of the worker, its AI usage is complete once the client is closed
+        results.put(("done", worker_id, stats, get_monitor().get_metrics()))
+
+
+def run_worker_pool(search_terms: List[str], workers: int) -> Dict[str, int]:
+    """
+    Apply to `search_terms` with `workers` parallel browsers and write their results
+
+    Returns:
+        Totals of the workers' counters (easy_applied_count, external_jobs_count, failed_count, skip_count)
+    """
+    make_bot_directories()
+    make_directories([worker_profiles_folder+"/"])
+    search_terms = list(search_terms)
+    if randomize_search_order:
+        shuffle(search_terms)
+    workers = max(1, min(workers, len(search_terms)))
+
+    ctx = mp.get_context("spawn")
+    tasks = ctx.Queue()
+    results = ctx.Queue()
+    for search_term in search_terms:
+        tasks.put(search_term)
+    manager = ctx.Manager()
+    claims = manager.dict()
+    rate_limiter = RateLimiter(max_applications_per_minute, ctx)
+
+    use_new_resume = os.path.exists(default_resume_path)
+    processes = [
+        ctx.Process(target=_worker, args=(worker_id, tasks, results, claims, rate_limiter, use_new_resume), name=f"Worker-{worker_id}")
+        for worker_id in range(1, workers + 1)
+    ]
+    print_lg(f"Starting {workers} parallel browsers for {len(search_terms)} search terms...")
+    started = time.perf_counter()
+    for process in processes:
+        process.start()
+
+    totals = {counter: 0 for counter in COUNTERS}
+    running = len(processes)
+
+    def handle(message) -> None:
+        nonlocal running
+        kind = message[0]
+        if kind == "row":
+            try:
+                append_csv_row(message[1], message[2])
+            except Exception as e:
+                print_lg(f'Failed to update "{message[1]}"!', e)
+        elif kind == "answer":
+            cache_answer(*message[1:])
+        elif kind == "skills":
+            get_skills_cache().add(*message[1:])
+        elif kind == "done":
+            running -= 1
+            for counter, value in message[2].items():
+                totals[counter] += value
+            get_monitor().merge(message[3])
+
+    try:
+        while running:
+            try:
+                message = results.get(timeout=5)
+            except Empty:
+                if not any(process.is_alive() for process in processes):
+                    break
+                continue
+            handle(message)
+    finally:
+        for process in processes:
+            process.join(timeout=30)
+        # Messages of workers that died without saying done (Eg: a crashed browser) can still be queued
+        while True:
+            try:
+                handle(results.get(timeout=1))
+            except Empty:
+                break
+        manager.shutdown()
+
+    print_lg(f"{workers} parallel browsers finished in {time.perf_counter() - started:.0f}s: {totals['easy_applied_count']} easy applied, {totals['external_jobs_count']} external, {totals['failed_count']} failed, {totals['skip_count']} skipped")
+    get_monitor().print_summary()
+    return totals
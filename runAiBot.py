@@ -3,7 +3,6 @@ import os
 import time
 import csv
 import re
-import pyautogui
 
 # Set CSV field size limit to prevent field size errors
 csv.field_size_limit(1000000)  # Set to 1MB instead of default 131KB
@@ -28,18 +27,22 @@ from modules.open_chrome import *
 from modules.helpers import *
 from modules.clickers_and_finders import *
 from modules.validator import validate_config
-from modules.answer_cache import get_cache, cache_answer, get_cached_answer
+from modules.answer_cache import get_cache, cache_answer, get_cached_answer, get_similar_answer
+from modules.keyword_matcher import KeywordMatcher
+from modules.question_rules import get_rule_engine
+from modules.option_index import get_option_set, answer_phrases, DECLINE_PHRASES
+from modules.session_manager import SessionManager, has_valid_session
+from modules.job_prefetcher import JobPrefetcher
+from modules.performance_monitor import get_monitor
 from modules.smart_select_handler import get_best_matching_option, suggest_option_with_fallback
 
 if use_AI:
-    from modules.ai.openaiConnections import ai_create_openai_client, ai_extract_skills, ai_answer_question, ai_close_openai_client
-    from modules.ai.deepseekConnections import deepseek_create_client, deepseek_extract_skills, deepseek_answer_question
-    from modules.ai.geminiConnections import gemini_create_client, gemini_extract_skills, gemini_answer_question
+    from modules.ai.providers import AIProvider, create_ai_provider
 
 from typing import Literal
+from functools import partial
 
 
-pyautogui.FAILSAFE = False
 # if use_resume_generator:    from resume_generator import is_logged_in_GPT, login_GPT, open_resume_chat, create_custom_resume
 
 
@@ -67,6 +70,13 @@ dailyEasyApplyLimitReached = False
 
 re_experience = re.compile(r'[(]?\s*(\d+)\s*[)]?\s*[-to]*\s*\d*[+]*\s*year[s]?', re.IGNORECASE)
 
+# Keyword matchers compiled once from config, each scans a text in a single pass
+bad_words_matcher = KeywordMatcher(bad_words, match_whole_words)
+about_company_bad_words_matcher = KeywordMatcher(about_company_bad_words, match_whole_words)
+about_company_good_words_matcher = KeywordMatcher(about_company_good_words, match_whole_words)
+security_clearance_matcher = KeywordMatcher(['polygraph', 'clearance', 'secret'])
+photo_keywords = KeywordMatcher(['photo', 'photograph', 'image', 'picture', 'headshot'])
+
 desired_salary_lakhs = str(round(desired_salary / 100000, 2))
 desired_salary_monthly = str(round(desired_salary/12, 2))
 desired_salary = str(desired_salary)
@@ -79,7 +89,23 @@ notice_period_months = str(notice_period//30)
 notice_period_weeks = str(notice_period//7)
 notice_period = str(notice_period)
 
-aiClient = None
+question_rules = get_rule_engine()
+rule_answers = {
+    'years_of_experience': years_of_experience, 'gender': gender, 'disability_status': disability_status, 'veteran_status': veteran_status,
+    'us_citizenship': us_citizenship, 'require_visa': require_visa, 'additional_months': additional_months, 'phone_number': phone_number,
+    'street': street, 'state': state, 'zipcode': zipcode, 'country': country, 'full_name': full_name, 'first_name': first_name,
+    'middle_name': middle_name, 'last_name': last_name, 'recent_employer': recent_employer, 'notice_period': notice_period,
+    'notice_period_months': notice_period_months, 'notice_period_weeks': notice_period_weeks, 'current_ctc': current_ctc,
+    'current_ctc_monthly': current_ctc_monthly, 'current_ctc_lakhs': current_ctc_lakhs, 'desired_salary': desired_salary,
+    'desired_salary_monthly': desired_salary_monthly, 'desired_salary_lakhs': desired_salary_lakhs, 'linkedIn': linkedIn, 'website': website,
+    'confidence_level': confidence_level, 'linkedin_headline': linkedin_headline, 'linkedin_summary': linkedin_summary, 'cover_letter': cover_letter,
+}
+
+job_prefetcher = JobPrefetcher()
+
+aiClient: 'AIProvider | None' = None     # The AI provider chosen in `main()`
+history_sink = None     # Set by parallel workers, receives `(csv_path, row)` instead of writing the CSV files
+job_gate = None         # Set by parallel workers, `job_gate(job_id)` returns False if this job must not be applied here
 ##> ------ Dheeraj Deshwal : dheeraj9811 Email:dheeraj20194@iiitd.ac.in/dheerajdeshwal9811@gmail.com - Feature ------
 about_company_for_ai = None # TODO extract about company for AI
 ##<
@@ -175,7 +201,7 @@ def set_search_location() -> None:
             actions.send_keys(Keys.TAB, Keys.TAB).perform()
             actions.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).perform()
             actions.send_keys(search_location.strip()).perform()
-            sleep(2)
+            settle(driver, 2)
             actions.send_keys(Keys.ENTER).perform()
             try_xp(driver, ".//button[@aria-label='Cancel']")
         except Exception as e:
@@ -193,53 +219,58 @@ def apply_filters() -> None:
         recommended_wait = 2 if click_gap < 1 else 1
 
         wait.until(EC.presence_of_element_located((By.XPATH, '//button[normalize-space()="All filters"]'))).click()
-        sleep(2)  # Wait for filter modal to open
+        show_results_xpath = '//button[contains(@aria-label, "Apply current filters to show")]'
+        wait_until(driver, EC.presence_of_element_located((By.XPATH, show_results_xpath)), 2)  # Wait for filter modal to open
 
         wait_span_click(driver, sort_by)
-        sleep(recommended_wait)
+        settle(driver, recommended_wait)
         wait_span_click(driver, date_posted)
-        sleep(recommended_wait)
+        settle(driver, recommended_wait)
 
         multi_sel_noWait(driver, experience_level) 
         multi_sel_noWait(driver, companies, actions)
-        if experience_level or companies: sleep(recommended_wait)
+        if experience_level or companies: settle(driver, recommended_wait)
 
         multi_sel_noWait(driver, job_type)
         multi_sel_noWait(driver, on_site)
-        if job_type or on_site: sleep(recommended_wait)
+        if job_type or on_site: settle(driver, recommended_wait)
 
-        if easy_apply_only: boolean_button_click(driver, actions, "Easy Apply")
-        sleep(1)
+        if easy_apply_only: 
+            boolean_button_click(driver, actions, "Easy Apply")
+            settle(driver, 1)
         
         multi_sel_noWait(driver, location)
         multi_sel_noWait(driver, industry)
-        if location or industry: sleep(recommended_wait)
+        if location or industry: settle(driver, recommended_wait)
 
         multi_sel_noWait(driver, job_function)
         multi_sel_noWait(driver, job_titles)
-        if job_function or job_titles: sleep(recommended_wait)
-
-        if under_10_applicants: boolean_button_click(driver, actions, "Under 10 applicants")
-        sleep(1)
-        if in_your_network: boolean_button_click(driver, actions, "In your network")
-        sleep(1)
-        if fair_chance_employer: boolean_button_click(driver, actions, "Fair Chance Employer")
-        sleep(1)
+        if job_function or job_titles: settle(driver, recommended_wait)
+
+        if under_10_applicants: 
+            boolean_button_click(driver, actions, "Under 10 applicants")
+            settle(driver, 1)
+        if in_your_network: 
+            boolean_button_click(driver, actions, "In your network")
+            settle(driver, 1)
+        if fair_chance_employer: 
+            boolean_button_click(driver, actions, "Fair Chance Employer")
+            settle(driver, 1)
 
         wait_span_click(driver, salary)
-        sleep(recommended_wait)
+        settle(driver, recommended_wait)
         
         multi_sel_noWait(driver, benefits)
         multi_sel_noWait(driver, commitments)
-        if benefits or commitments: sleep(recommended_wait)
+        if benefits or commitments: settle(driver, recommended_wait)
 
-        sleep(2)  # Wait before clicking show results
-        show_results_button: WebElement = driver.find_element(By.XPATH, '//button[contains(@aria-label, "Apply current filters to show")]')
+        # Wait for the results count to update before clicking show results
+        show_results_button: WebElement = wait_until(driver, EC.element_to_be_clickable((By.XPATH, show_results_xpath)), 2) or driver.find_element(By.XPATH, show_results_xpath)
         show_results_button.click()
-        sleep(3)  # Wait for results to load
+        settle(driver, 3)  # Wait for results to load
 
         global pause_after_filters
-        if pause_after_filters and "Turn off Pause after search" == pyautogui.confirm("These are your configured search results and filter. It is safe to change them while this dialog is open, any changes later could result in errors and skipping this search run.", "Please check your results", ["Turn off Pause after search", "Look's good, Continue"]):
+        if pause_after_filters and "Turn off Pause after search" == confirm("These are your configured search results and filter. It is safe to change them while this dialog is open, any changes later could result in errors and skipping this search run.", "Please check your results", ["Turn off Pause after search", "Look's good, Continue"]):
             pause_after_filters = False
 
     except Exception as e:
@@ -265,6 +296,16 @@ def get_page_info() -> tuple[WebElement | None, int | None]:
 
 
 
+def get_job_company(job: WebElement, with_location: bool = False) -> str | tuple[str, str]:
+    '''
+    Returns the company name of the `job` card, and its work location text too if `with_location = True`
+    '''
+    other_details = job.find_element(By.CLASS_NAME, 'artdeco-entity-lockup__subtitle').text
+    index = other_details.find(' · ')
+    company = other_details[:index]
+    return (company, other_details[index+3:]) if with_location else company
+
+
 def get_job_main_details(job: WebElement, blacklisted_companies: set, rejected_jobs: set) -> tuple[str, str, str, str, str, bool]:
     '''
     # Function to get job main details.
@@ -283,10 +324,7 @@ def get_job_main_details(job: WebElement, blacklisted_companies: set, rejected_j
     title = title[:title.find("\n")]
     # company = job.find_element(By.CLASS_NAME, "job-card-container__primary-description").text
     # work_location = job.find_element(By.CLASS_NAME, "job-card-container__metadata-item").text
-    other_details = job.find_element(By.CLASS_NAME, 'artdeco-entity-lockup__subtitle').text
-    index = other_details.find(' · ')
-    company = other_details[:index]
-    work_location = other_details[index+3:]
+    company, work_location = get_job_company(job, with_location=True)
     work_style = work_location[work_location.rfind('(')+1:work_location.rfind(')')]
     work_location = work_location[:work_location.rfind('(')].strip()
     
@@ -310,30 +348,34 @@ def get_job_main_details(job: WebElement, blacklisted_companies: set, rejected_j
         # print_lg(e)
         discard_job()
         job_details_button.click() # To pass the error outside
-    buffer(click_gap)
+    pace()
     return (job_id,title,company,work_location,work_style,skip)
 
 
+# Function to find Blacklisted words in About Company
+def about_company_bad_word(about_company: str) -> str | None:
+    '''
+    Returns the first blacklisted word found in `about_company`, `None` if there is none or if a good word was found
+    '''
+    good_word = about_company_good_words_matcher.first(about_company)
+    if good_word:
+        print_lg(f'Found the word "{good_word}". So, skipped checking for blacklist words.')
+        return None
+    return about_company_bad_words_matcher.first(about_company)
+
+
 # Function to check for Blacklisted words in About Company
 def check_blacklist(rejected_jobs: set, job_id: str, company: str, blacklisted_companies: set) -> tuple[set, set, WebElement] | ValueError:
     jobs_top_card = try_find_by_classes(driver, ["job-details-jobs-unified-top-card__primary-description-container","job-details-jobs-unified-top-card__primary-description","jobs-unified-top-card__primary-description","jobs-details__main-content"])
     about_company_org = find_by_class(driver, "jobs-company__box")
     scroll_to_view(driver, about_company_org)
     about_company_org = about_company_org.text
-    about_company = about_company_org.lower()
-    skip_checking = False
-    for word in about_company_good_words:
-        if word.lower() in about_company:
-            print_lg(f'Found the word "{word}". So, skipped checking for blacklist words.')
-            skip_checking = True
-            break
-    if not skip_checking:
-        for word in about_company_bad_words: 
-            if word.lower() in about_company: 
-                rejected_jobs.add(job_id)
-                blacklisted_companies.add(company)
-                raise ValueError(f'\n"{about_company_org}"\n\nContains "{word}".')
-    buffer(click_gap)
+    bad_word = about_company_bad_word(about_company_org)
+    if bad_word:
+        rejected_jobs.add(job_id)
+        blacklisted_companies.add(company)
+        raise ValueError(f'\n"{about_company_org}"\n\nContains "{bad_word}".')
+    pace()
     scroll_to_view(driver, jobs_top_card)
     return rejected_jobs, blacklisted_companies, jobs_top_card
 
@@ -351,6 +393,7 @@ def extract_years_of_experience(text: str) -> int:
 
 
 def get_job_description(
+    prefetched_description: str | None = None
 ) -> tuple[
     str | Literal['Unknown'],
     int | Literal['Unknown'],
@@ -361,6 +404,7 @@ def get_job_description(
     '''
     # Job Description
     Function to extract job description from About the Job.
+    * Uses `prefetched_description` instead of reading the page if given
     ### Returns:
     - `jobDescription: str | 'Unknown'`
     - `experience_required: int | 'Unknown'`
@@ -374,18 +418,17 @@ def get_job_description(
         ##<
         experience_required = "Unknown"
         found_masters = 0
-        jobDescription = find_by_class(driver, "jobs-box__html-content").text
+        jobDescription = prefetched_description or find_by_class(driver, "jobs-box__html-content").text
         jobDescriptionLow = jobDescription.lower()
         skip = False
         skipReason = None
         skipMessage = None
-        for word in bad_words:
-            if word.lower() in jobDescriptionLow:
-                skipMessage = f'\n{jobDescription}\n\nContains bad word "{word}". Skipping this job!\n'
-                skipReason = "Found a Bad Word in About Job"
-                skip = True
-                break
-        if not skip and security_clearance == False and ('polygraph' in jobDescriptionLow or 'clearance' in jobDescriptionLow or 'secret' in jobDescriptionLow):
+        bad_word = bad_words_matcher.first(jobDescription)
+        if bad_word:
+            skipMessage = f'\n{jobDescription}\n\nContains bad word "{bad_word}". Skipping this job!\n'
+            skipReason = "Found a Bad Word in About Job"
+            skip = True
+        if not skip and security_clearance == False and security_clearance_matcher.search(jobDescription):
             skipMessage = f'\n{jobDescription}\n\nFound "Clearance" or "Polygraph". Skipping this job!\n'
             skipReason = "Asking for Security clearance"
             skip = True
@@ -416,30 +459,83 @@ def upload_resume(modal: WebElement, resume: str) -> tuple[bool, str]:
         return True, os.path.basename(default_resume_path)
     except: return False, "Previous resume"
 
-# Function to answer common questions for Easy Apply
-def answer_common_questions(label: str, answer: str) -> str:
-    label = label.lower()
-    if 'sponsorship' in label or 'visa' in label:
-        answer = require_visa
-    elif 'background check' in label or 'screening' in label:
-        answer = 'Yes'
-    elif 'relocate' in label or 'relocation' in label:
-        answer = 'Yes'
-    elif 'travel' in label:
-        answer = 'Yes'
-    elif 'start' in label and 'now' in label:
-        answer = 'Yes'
-    elif 'authorized' in label and ('work' in label or 'eligible' in label):
-        answer = 'Yes'
-    elif 'overtime' in label:
-        answer = 'Yes'
-    elif 'drug' in label and 'test' in label:
-        answer = 'Yes'
-    elif 'education' in label or 'degree' in label:
-        answer = 'Yes'
-    elif 'additional' in label and ('document' in label or 'attachment' in label or 'information' in label):
-        answer = 'No'
-    return answer
+# Function to answer a question from the rule table
+def rule_answer(label: str, question_type: Literal["select", "radio", "text", "textarea"], answer: str, work_location: str, prev_answer: str | None = None) -> tuple[str, bool]:
+    '''
+    Answers a question using the declarative rules in `modules/question_rules.py`.
+    * Returns `(answer, autocomplete)`, `answer` stays unchanged if no rule applies
+    * `autocomplete` is `True` if the answer must be confirmed from a type-ahead suggestion list
+    '''
+    answers = {**rule_answers, 'prev_answer': prev_answer, 'work_location': work_location, 'city_or_work_location': current_city if current_city else work_location}
+    answer, rule = question_rules.resolve(label, question_type, answers, answer)
+    return answer, bool(rule and rule.autocomplete)
+
+
+def ai_answer_all(questions: list[tuple[str, str, list[str] | None]], job_description: str | None = None) -> list[str | dict | None]:
+    '''
+    Asks the AI all `questions` (`label_org`, `question_type`, `options`) of a page.
+    * Several questions go in one batched request, sending the instructions, user information and job description only once
+    * Questions the batch left unanswered are asked one by one concurrently, taking as long as the slowest answer
+    * Returns the answers in the order of `questions`, `None` where the AI failed
+    '''
+    try:
+        return aiClient.answer_all(questions, job_description)
+    except Exception as e:
+        print_lg("Failed to get AI answers!", e)
+        return [None] * len(questions)
+
+
+# Function to type an answer into a text or textarea question
+def fill_text(text: WebElement, answer: str, do_actions: bool = False) -> None:
+    text.clear()
+    text.send_keys(answer)
+    if do_actions:
+        settle(driver, 2)   # Let the suggestions render
+        actions.send_keys(Keys.ARROW_DOWN)
+        actions.send_keys(Keys.ENTER).perform()
+
+
+def fill_text_question(text: WebElement, label: str, label_org: str, question_type: Literal["text", "textarea"], do_actions: bool, prev_answer: str, questions_list: set, ai_suggested_answer: str | dict | None) -> None:
+    '''
+    Fills a text or textarea question the rules couldn't answer with the AI's answer, else with a fallback answer.
+    '''
+    if ai_suggested_answer and isinstance(ai_suggested_answer, str) and len(ai_suggested_answer) > 0:
+        print_lg(f'AI Answered received for question "{label_org}" \nhere is answer: "{ai_suggested_answer}"')
+        answer = ai_suggested_answer
+        source = "ai"
+    else:
+        randomly_answered_questions.add((label_org, question_type))
+        answer = years_of_experience if question_type == "text" else ""
+        source = "fallback"
+    fill_text(text, answer, do_actions)
+    # CACHE THE ANSWER - OPTIMIZATION (fallbacks are kept for the record, never reused)
+    cache_answer(label_org, answer, question_type, source)
+    questions_list.add((label, text.get_attribute("value"), question_type, prev_answer))
+
+
+def fill_select_question(select: Select, label_org: str, options: str, optionsText: list[str], prev_answer: str, questions_list: set, job_description: str | None, ai_suggested_answer: str | dict | None) -> None:
+    '''
+    Selects an option for a select question the rules couldn't answer, matching the AI's answer, else a smart fallback option.
+    '''
+    # Use smart selection with AI instead of random - OPTIMIZATION
+    if ai_suggested_answer and not isinstance(ai_suggested_answer, str): ai_suggested_answer = None
+    matched_option = get_best_matching_option(label_org, optionsText, ai_suggested_answer, job_description) if ai_suggested_answer else None
+    if matched_option:
+        select.select_by_visible_text(matched_option)
+        answer = matched_option
+        print_lg(f'✓ AI selected "{matched_option}" for "{label_org}"')
+        source = "ai"
+    else:
+        # Use smart fallback
+        fallback_option = suggest_option_with_fallback(label_org, optionsText, "select")
+        select.select_by_visible_text(fallback_option)
+        answer = fallback_option
+        print_lg(f'Using smart fallback "{fallback_option}" for "{label_org}"')
+        source = "fallback"
+    randomly_answered_questions.add((f'{label_org} [ {options} ]',"select"))
+    # CACHE THE ANSWER - OPTIMIZATION (fallbacks are kept for the record, never reused)
+    cache_answer(label_org, answer, "select", source)
+    questions_list.add((f'{label_org} [ {options} ]', answer, "select", prev_answer))
 
 
 # Function to answer the questions for Easy Apply
@@ -452,6 +548,9 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
     # all_single_line_questions = modal.find_elements(By.XPATH, ".//div[@data-test-single-line-text-form-component]")
     # all_questions = all_questions + all_list_questions + all_single_line_questions
 
+    # Questions left for the AI, as `((label_org, question_type, options), fill)`, `fill(ai_answer)` fills them in
+    pending_ai: list[tuple[tuple[str, str, list[str] | None], partial]] = []
+
     for Question in all_questions:
         # Check if it's a select Question
         select = try_xp(Question, ".//select", False)
@@ -463,114 +562,45 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
             except: pass
             answer = 'Yes'
             label = label_org.lower()
-            select = Select(select)
+            select_element = select
+            select = Select(select_element)
             selected_option = select.first_selected_option.text
-            optionsText = []
-            options = '"List of phone country codes"'
-            if label != "phone country code":
-                optionsText = [option.text for option in select.options]
-                options = "".join([f' "{option}",' for option in optionsText])
+            option_count, optionsText = get_select_options(driver, select_element)
+            long_dropdown = optionsText is None
+            options = f'"List of {option_count} options"' if long_dropdown else "".join([f' "{option}",' for option in optionsText])
             prev_answer = selected_option
             if overwrite_previous_answers or selected_option == "Select an option":
-                ##> ------ WINDY_WINDWARD Email:karthik.sarode23@gmail.com - Added fuzzy logic to answer location based questions ------
-                if 'email' in label or 'phone' in label: 
-                    answer = prev_answer
-                elif 'gender' in label or 'sex' in label: 
-                    answer = gender
-                elif 'disability' in label: 
-                    answer = disability_status
-                elif 'experience' in label or 'years' in label:
-                    answer = years_of_experience
-                elif 'proficiency' in label: 
-                    answer = 'Professional'
-                elif any(loc_word in label for loc_word in ['location', 'city', 'state', 'country']):
-                    if 'country' in label:
-                        answer = country 
-                    elif 'state' in label:
-                        answer = state
-                    elif 'city' in label:
-                        answer = current_city if current_city else work_location
+                answer, _ = rule_answer(label, "select", answer, work_location, prev_answer)
+                if long_dropdown:
+                    # Resolve long dropdowns (Eg: phone country codes, countries) inside the browser in one round-trip
+                    matched = select_option_in_browser(driver, select_element, answer, answer_phrases(answer))
+                    foundOption = matched is not None
+                    if foundOption:
+                        select.select_by_index(matched[0])
+                        answer = matched[1]
                     else:
-                        answer = work_location
-                elif 'additional' in label and 'month' in label:
-                    answer = additional_months
-                elif 'experience' in label or 'years' in label:
-                    # Specific handling for "years of experience" to avoid matching "additional months"
-                    if 'additional' not in label and 'month' not in label:
-                        answer = years_of_experience
-                else: 
-                    answer = answer_common_questions(label,answer)
-                try: 
-                    select.select_by_visible_text(answer)
-                except NoSuchElementException as e:
-                    # Define similar phrases for common answers
-                    possible_answer_phrases = []
-                    if answer == 'Decline':
-                        possible_answer_phrases = ["Decline", "not wish", "don't wish", "Prefer not", "not want"]
-                    elif 'yes' in answer.lower():
-                        possible_answer_phrases = ["Yes", "Agree", "I do", "I have"]
-                    elif 'no' in answer.lower():
-                        possible_answer_phrases = ["No", "Disagree", "I don't", "I do not"]
-                    else:
-                        # Try partial matching for any answer
-                        possible_answer_phrases = [answer]
-                        # Add lowercase and uppercase variants
-                        possible_answer_phrases.append(answer.lower())
-                        possible_answer_phrases.append(answer.upper())
-                        # Try without special characters
-                        possible_answer_phrases.append(''.join(c for c in answer if c.isalnum()))
-                    ##<
-                    foundOption = False
-                    for phrase in possible_answer_phrases:
-                        for option in optionsText:
-                            # Improved matching: if answer is numeric, look for numeric match or partial string match
-                            option_digit = ''.join(c for c in option if c.isdigit())
-                            phrase_digit = ''.join(c for c in phrase if c.isdigit())
-                            
-                            if (phrase_digit and option_digit and phrase_digit == option_digit) or \
-                               (phrase.lower().strip() == option.lower().strip()) or \
-                               (phrase.lower() in option.lower()) or \
-                               (option.lower() in phrase.lower()):
-                                select.select_by_visible_text(option)
-                                answer = option
-                                foundOption = True
-                                break
-                        if foundOption: break
-                    if not foundOption:
-                        # Use smart selection with AI instead of random - OPTIMIZATION
-                        ai_suggested_answer = None
-                        if use_AI and aiClient:
-                            try:
-                                if ai_provider.lower() == "openai":
-                                    ai_suggested_answer = ai_answer_question(aiClient, f"{label_org}. Available options: {optionsText}", question_type="select", job_description=job_description, user_information_all=user_information_all)
-                                elif ai_provider.lower() == "deepseek":
-                                    ai_suggested_answer = deepseek_answer_question(aiClient, f"{label_org}. Available options: {optionsText}", options=optionsText, question_type="select", job_description=job_description, user_information_all=user_information_all)
-                                elif ai_provider.lower() == "gemini":
-                                    ai_suggested_answer = gemini_answer_question(aiClient, f"{label_org}. Available options: {optionsText}", options=optionsText, question_type="select", job_description=job_description, user_information_all=user_information_all)
-                            except Exception as e:
-                                print_lg(f"AI selection failed: {e}")
-                        
-                        # Try to match AI answer with actual options
-                        if ai_suggested_answer:
-                            matched_option = get_best_matching_option(label_org, optionsText, ai_suggested_answer, job_description)
-                            if matched_option:
-                                select.select_by_visible_text(matched_option)
-                                answer = matched_option
-                                print_lg(f'✓ AI selected "{matched_option}" for "{label_org}"')
-                            else:
-                                # Use smart fallback
-                                fallback_option = suggest_option_with_fallback(label_org, optionsText, "select")
-                                select.select_by_visible_text(fallback_option)
-                                answer = fallback_option
-                                print_lg(f'Using smart fallback "{fallback_option}" for "{label_org}"')
-                        else:
-                            # Use smart fallback without AI
-                            fallback_option = suggest_option_with_fallback(label_org, optionsText, "select")
-                            select.select_by_visible_text(fallback_option)
-                            answer = fallback_option
-                            print_lg(f'Using smart fallback "{fallback_option}" for "{label_org}"')
-                        
-                        randomly_answered_questions.add((f'{label_org} [ {options} ]',"select"))
+                        optionsText = get_select_options(driver, select_element, option_count)[1]
+                else:
+                    try: 
+                        select.select_by_visible_text(answer)
+                        foundOption = True
+                    except NoSuchElementException as e:
+                        # Match similar phrases against the indexed option list (memoized across jobs)
+                        matched_option = get_option_set(optionsText).match(answer)
+                        foundOption = matched_option is not None
+                        if foundOption:
+                            select.select_by_visible_text(matched_option)
+                            answer = matched_option
+                if not foundOption:
+                    fill = partial(fill_select_question, select, label_org, options, optionsText, prev_answer, questions_list, job_description)
+                    # Answered before, maybe in other words? Reuse that answer without asking the AI
+                    saved_answer = get_similar_answer(label_org, "select", optionsText)
+                    if saved_answer is not None: fill(saved_answer)
+                    elif use_AI and aiClient:
+                        # Asked together with the other unanswered questions of this page, see below
+                        pending_ai.append(((label_org, "select", optionsText), fill))
+                    else: fill(None)
+                    continue
             # CACHE THE ANSWER - OPTIMIZATION
             cache_answer(label_org, answer, "select")
             questions_list.add((f'{label_org} [ {options} ]', answer, "select", prev_answer))
@@ -599,35 +629,19 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
                 label_org += f' {options_labels[-1]},'
 
             if overwrite_previous_answers or prev_answer is None:
-                if 'citizenship' in label or 'employment eligibility' in label: answer = us_citizenship
-                elif 'veteran' in label or 'protected' in label: answer = veteran_status
-                elif 'disability' in label or 'handicapped' in label: 
-                    answer = disability_status
-                elif 'experience' in label or 'years' in label:
-                    if 'additional' not in label and 'month' not in label:
-                        answer = years_of_experience
-                elif 'relocate' in label or 'relocation' in label:
-                    answer = 'Yes'
-                elif 'background check' in label:
-                    answer = 'Yes'
-                elif 'additional' in label and 'month' in label:
-                    answer = additional_months
-                else: answer = answer_common_questions(label,answer)
+                answer, _ = rule_answer(label, "radio", answer, work_location)
                 foundOption = try_xp(radio, f".//label[normalize-space()='{answer}']", False)
                 if foundOption: 
                     actions.move_to_element(foundOption).click().perform()
                 else:    
-                    possible_answer_phrases = ["Decline", "not wish", "don't wish", "Prefer not", "not want"] if answer == 'Decline' else [answer]
+                    possible_answer_phrases = DECLINE_PHRASES if answer == 'Decline' else [answer]
                     ele = options[0]
                     answer = options_labels[0]
-                    for phrase in possible_answer_phrases:
-                        for i, option_label in enumerate(options_labels):
-                            if phrase in option_label:
-                                foundOption = options[i]
-                                ele = foundOption
-                                answer = f'Decline ({option_label})' if len(possible_answer_phrases) > 1 else option_label
-                                break
-                        if foundOption: break
+                    i = get_option_set(options_labels).find_containing(possible_answer_phrases)
+                    if i is not None:
+                        foundOption = options[i]
+                        ele = foundOption
+                        answer = f'Decline ({options_labels[i]})' if len(possible_answer_phrases) > 1 else options_labels[i]
                     # if answer == 'Decline':
                     #     answer = options_labels[0]
                     #     for phrase in ["Prefer not", "not want", "not wish"]:
@@ -655,83 +669,20 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
 
             prev_answer = text.get_attribute("value")
             if not prev_answer or overwrite_previous_answers:
-                if 'experience' in label or 'years' in label: answer = years_of_experience
-                elif 'phone' in label or 'mobile' in label: answer = phone_number
-                elif 'street' in label: answer = street
-                elif 'city' in label or 'location' in label or 'address' in label:
-                    answer = current_city if current_city else work_location
-                    do_actions = True
-                elif 'signature' in label: answer = full_name # 'signature' in label or 'legal name' in label or 'your name' in label or 'full name' in label: answer = full_name     # What if question is 'name of the city or university you attend, name of referral etc?'
-                elif 'name' in label:
-                    if 'full' in label: answer = full_name
-                    elif 'first' in label and 'last' not in label: answer = first_name
-                    elif 'middle' in label and 'last' not in label: answer = middle_name
-                    elif 'last' in label and 'first' not in label: answer = last_name
-                    elif 'employer' in label: answer = recent_employer
-                    else: answer = full_name
-                elif 'notice' in label:
-                    if 'month' in label:
-                        answer = notice_period_months
-                    elif 'week' in label:
-                        answer = notice_period_weeks
-                    else: answer = notice_period
-                elif 'salary' in label or 'compensation' in label or 'ctc' in label or 'pay' in label: 
-                    if 'current' in label or 'present' in label:
-                        if 'month' in label:
-                            answer = current_ctc_monthly
-                        elif 'lakh' in label:
-                            answer = current_ctc_lakhs
-                        else:
-                            answer = current_ctc
-                    else:
-                        if 'month' in label:
-                            answer = desired_salary_monthly
-                        elif 'lakh' in label:
-                            answer = desired_salary_lakhs
-                        else:
-                            answer = desired_salary
-                elif 'linkedin' in label: answer = linkedIn
-                elif 'website' in label or 'blog' in label or 'portfolio' in label or 'link' in label: answer = website
-                elif 'scale of 1-10' in label: answer = confidence_level
-                elif 'headline' in label: answer = linkedin_headline
-                elif ('hear' in label or 'come across' in label) and 'this' in label and ('job' in label or 'position' in label): answer = "https://github.com/omkargutal/linkedin_Job_Easy_Apply"
-                elif 'state' in label or 'province' in label: answer = state
-                elif 'zip' in label or 'postal' in label or 'code' in label: answer = zipcode
-                elif 'country' in label: answer = country
-                elif 'additional' in label and 'month' in label: answer = additional_months
-                else: answer = answer_common_questions(label,answer)
+                answer, do_actions = rule_answer(label, "text", answer, work_location)
                 ##> ------ Yang Li : MARKYangL - Feature ------
                 if answer == "":
-                    if use_AI and aiClient:
-                        try:
-                            if ai_provider.lower() == "openai":
-                                answer = ai_answer_question(aiClient, label_org, question_type="text", job_description=job_description, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "deepseek":
-                                answer = deepseek_answer_question(aiClient, label_org, options=None, question_type="text", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "gemini":
-                                answer = gemini_answer_question(aiClient, label_org, options=None, question_type="text", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            else:
-                                randomly_answered_questions.add((label_org, "text"))
-                                answer = years_of_experience
-                            if answer and isinstance(answer, str) and len(answer) > 0:
-                                print_lg(f'AI Answered received for question "{label_org}" \nhere is answer: "{answer}"')
-                            else:
-                                randomly_answered_questions.add((label_org, "text"))
-                                answer = years_of_experience
-                        except Exception as e:
-                            print_lg("Failed to get AI answer!", e)
-                            randomly_answered_questions.add((label_org, "text"))
-                            answer = years_of_experience
-                    else:
-                        randomly_answered_questions.add((label_org, "text"))
-                        answer = years_of_experience
+                    fill = partial(fill_text_question, text, label, label_org, "text", do_actions, prev_answer, questions_list)
+                    # Answered before, maybe in other words? Reuse that answer without asking the AI
+                    saved_answer = get_similar_answer(label_org, "text")
+                    if saved_answer is not None: fill(saved_answer)
+                    elif use_AI and aiClient:
+                        # Asked together with the other unanswered questions of this page, see below
+                        pending_ai.append(((label_org, "text", None), fill))
+                    else: fill(None)
+                    continue
                 ##<
-                text.clear()
-                text.send_keys(answer)
-                if do_actions:
-                    sleep(2)
-                    actions.send_keys(Keys.ARROW_DOWN)
-                    actions.send_keys(Keys.ENTER).perform()
+                fill_text(text, answer, do_actions)
                 # CACHE THE ANSWER - OPTIMIZATION
                 cache_answer(label_org, answer, "text")
             questions_list.add((label, text.get_attribute("value"), "text", prev_answer))
@@ -744,41 +695,22 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
             label_org = label.text if label else "Unknown"
             label = label_org.lower()
             answer = ""
+            do_actions = False
             prev_answer = text_area.get_attribute("value")
             if not prev_answer or overwrite_previous_answers:
-                if 'summary' in label: answer = linkedin_summary
-                elif 'cover' in label or 'message' in label or 'hiring manager' in label: answer = cover_letter
-                elif 'additional' in label and 'information' in label: answer = "Please see my resume for more details."
+                answer, do_actions = rule_answer(label, "textarea", answer, work_location)
                 if answer == "":
                 ##> ------ Yang Li : MARKYangL - Feature ------
-                    if use_AI and aiClient:
-                        try:
-                            if ai_provider.lower() == "openai":
-                                answer = ai_answer_question(aiClient, label_org, question_type="textarea", job_description=job_description, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "deepseek":
-                                answer = deepseek_answer_question(aiClient, label_org, options=None, question_type="textarea", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "gemini":
-                                answer = gemini_answer_question(aiClient, label_org, options=None, question_type="textarea", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            else:
-                                randomly_answered_questions.add((label_org, "textarea"))
-                                answer = ""
-                            if answer and isinstance(answer, str) and len(answer) > 0:
-                                print_lg(f'AI Answered received for question "{label_org}" \nhere is answer: "{answer}"')
-                            else:
-                                randomly_answered_questions.add((label_org, "textarea"))
-                                answer = ""
-                        except Exception as e:
-                            print_lg("Failed to get AI answer!", e)
-                            randomly_answered_questions.add((label_org, "textarea"))
-                            answer = ""
-                    else:
-                        randomly_answered_questions.add((label_org, "textarea"))
-            text_area.clear()
-            text_area.send_keys(answer)
-            if do_actions:
-                    sleep(2)
-                    actions.send_keys(Keys.ARROW_DOWN)
-                    actions.send_keys(Keys.ENTER).perform()
+                    fill = partial(fill_text_question, text_area, label, label_org, "textarea", do_actions, prev_answer, questions_list)
+                    # Answered before, maybe in other words? Reuse that answer without asking the AI
+                    saved_answer = get_similar_answer(label_org, "textarea")
+                    if saved_answer is not None: fill(saved_answer)
+                    elif use_AI and aiClient:
+                        # Asked together with the other unanswered questions of this page, see below
+                        pending_ai.append(((label_org, "textarea", None), fill))
+                    else: fill(None)
+                    continue
+            fill_text(text_area, answer, do_actions)
             # CACHE THE ANSWER - OPTIMIZATION
             cache_answer(label_org, answer, "textarea")
             questions_list.add((label, text_area.get_attribute("value"), "textarea", prev_answer))
@@ -811,7 +743,7 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
             label = try_xp(Question, ".//label[@for]", False)
             label_org = label.text if label else "Unknown"
             label = label_org.lower()
-            if any(word in label for word in ['photo', 'photograph', 'image', 'picture', 'headshot']):
+            if photo_keywords.search(label):
                 if os.path.exists(photo_path):
                     file_input.send_keys(os.path.abspath(photo_path))
                     print_lg(f"Uploaded photo for: {label_org}")
@@ -820,6 +752,15 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
             continue
 
 
+    # Ask the AI all questions of this page at once, in one batched request where possible
+    if pending_ai:
+        ai_answers = ai_answer_all([question for question, _ in pending_ai], job_description)
+        for (question, fill), suggested_answer in zip(pending_ai, ai_answers):
+            try:
+                fill(suggested_answer)
+            except Exception as e:
+                print_lg(f'Failed to fill the answer of "{question[0]}"!', e)
+
     # Select todays date
     try_xp(driver, "//button[contains(@aria-label, 'This is today')]")
 
@@ -864,10 +805,11 @@ def external_apply(pagination_element: WebElement, job_id: str, job_link: str, r
 
 
 
-def follow_company(modal: WebDriver = driver) -> None:
+def follow_company(modal: WebDriver | None = None) -> None:
     '''
     Function to follow or un-follow easy applied companies based om `follow_companies`
     '''
+    if modal is None: modal = driver
     try:
         follow_checkbox_input = try_xp(modal, ".//input[@id='follow-company-checkbox' and @type='checkbox']", False)
         if follow_checkbox_input and follow_checkbox_input.is_selected() != follow_companies:
@@ -878,20 +820,24 @@ def follow_company(modal: WebDriver = driver) -> None:
 
 
 #< Failed attempts logging
+def record_history(path: str, row: dict) -> None:
+    '''
+    Function to append a row to the applied or failed jobs CSV at `path`
+    * In parallel mode the row is handed to `history_sink`, the process that owns the CSV files
+    '''
+    if history_sink: history_sink(path, row)
+    else: append_csv_row(path, row)
+
+
 def failed_job(job_id: str, job_link: str, resume: str, date_listed, error: str, exception: Exception, application_link: str, screenshot_name: str) -> None:
     '''
     Function to update failed jobs list in excel
     '''
     try:
-        with open(failed_file_name, 'a', newline='', encoding='utf-8') as file:
-            fieldnames = ['Job ID', 'Job Link', 'Resume Tried', 'Date listed', 'Date Tried', 'Assumed Reason', 'Stack Trace', 'External Job link', 'Screenshot Name']
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
-            if file.tell() == 0: writer.writeheader()
-            writer.writerow({'Job ID':truncate_for_csv(job_id), 'Job Link':truncate_for_csv(job_link), 'Resume Tried':truncate_for_csv(resume), 'Date listed':truncate_for_csv(date_listed), 'Date Tried':datetime.now(), 'Assumed Reason':truncate_for_csv(error), 'Stack Trace':truncate_for_csv(exception), 'External Job link':truncate_for_csv(application_link), 'Screenshot Name':truncate_for_csv(screenshot_name)})
-            file.close()
+        record_history(failed_file_name, {'Job ID':truncate_for_csv(job_id), 'Job Link':truncate_for_csv(job_link), 'Resume Tried':truncate_for_csv(resume), 'Date listed':truncate_for_csv(date_listed), 'Date Tried':datetime.now(), 'Assumed Reason':truncate_for_csv(error), 'Stack Trace':truncate_for_csv(exception), 'External Job link':truncate_for_csv(application_link), 'Screenshot Name':truncate_for_csv(screenshot_name)})
     except Exception as e:
         print_lg("Failed to update failed jobs list!", e)
-        pyautogui.alert("Failed to update the excel of failed jobs!\nProbably because of 1 of the following reasons:\n1. The file is currently open or in use by another program\n2. Permission denied to write to the file\n3. Failed to find the file", "Failed Logging")
+        alert("Failed to update the excel of failed jobs!\nProbably because of 1 of the following reasons:\n1. The file is currently open or in use by another program\n2. Permission denied to write to the file\n3. Failed to find the file", "Failed Logging")
 
 
 def screenshot(driver: WebDriver, job_id: str, failedAt: str) -> str:
@@ -917,19 +863,14 @@ def submitted_jobs(job_id: str, title: str, company: str, work_location: str, wo
     Function to create or update the Applied jobs CSV file, once the application is submitted successfully
     '''
     try:
-        with open(file_name, mode='a', newline='', encoding='utf-8') as csv_file:
-            fieldnames = ['Job ID', 'Title', 'Company', 'Work Location', 'Work Style', 'About Job', 'Experience required', 'Skills required', 'HR Name', 'HR Link', 'Resume', 'Re-posted', 'Date Posted', 'Date Applied', 'Job Link', 'External Job link', 'Questions Found', 'Connect Request']
-            writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-            if csv_file.tell() == 0: writer.writeheader()
-            writer.writerow({'Job ID':truncate_for_csv(job_id), 'Title':truncate_for_csv(title), 'Company':truncate_for_csv(company), 'Work Location':truncate_for_csv(work_location), 'Work Style':truncate_for_csv(work_style), 
+        record_history(file_name, {'Job ID':truncate_for_csv(job_id), 'Title':truncate_for_csv(title), 'Company':truncate_for_csv(company), 'Work Location':truncate_for_csv(work_location), 'Work Style':truncate_for_csv(work_style), 
                             'About Job':truncate_for_csv(description), 'Experience required': truncate_for_csv(experience_required), 'Skills required':truncate_for_csv(skills), 
                                 'HR Name':truncate_for_csv(hr_name), 'HR Link':truncate_for_csv(hr_link), 'Resume':truncate_for_csv(resume), 'Re-posted':truncate_for_csv(reposted), 
                                 'Date Posted':truncate_for_csv(date_listed), 'Date Applied':truncate_for_csv(date_applied), 'Job Link':truncate_for_csv(job_link), 
                                 'External Job link':truncate_for_csv(application_link), 'Questions Found':truncate_for_csv(questions_list), 'Connect Request':truncate_for_csv(connect_request)})
-        csv_file.close()
     except Exception as e:
         print_lg("Failed to update submitted jobs list!", e)
-        pyautogui.alert("Failed to update the excel of applied jobs!\nProbably because of 1 of the following reasons:\n1. The file is currently open or in use by another program\n2. Permission denied to write to the file\n3. Failed to find the file", "Failed Logging")
+        alert("Failed to update the excel of applied jobs!\nProbably because of 1 of the following reasons:\n1. The file is currently open or in use by another program\n2. Permission denied to write to the file\n3. Failed to find the file", "Failed Logging")
 
 
 
@@ -939,9 +880,8 @@ def discard_job() -> None:
     for attempt in range(max_retries):
         try:
             actions.send_keys(Keys.ESCAPE).perform()
-            sleep(1)
             wait_span_click(driver, 'Discard', 3)
-            sleep(1)
+            settle(driver, 1)
             return
         except StaleElementReferenceException as e:
             if attempt < max_retries - 1:
@@ -971,6 +911,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
         driver.get(f"https://www.linkedin.com/jobs/search/?keywords={searchTerm}")
         print_lg("\n________________________________________________________________________________________________________________________\n")
         print_lg(f'\n>>>> Now searching for "{searchTerm}" <<<<\n\n')
+        wait_meter.start(searchTerm)
 
         apply_filters()
 
@@ -983,17 +924,41 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                 pagination_element, current_page = get_page_info()
 
                 # Find all job listings in current page
-                buffer(3)
+                settle(driver, 3)
                 job_listings = driver.find_elements(By.XPATH, "//li[@data-occludable-job-id]")  
 
             
-                for job in job_listings:
+                for index, job in enumerate(job_listings):
                     try:
-                        if keep_screen_awake: pyautogui.press('shiftright')
+                        if keep_screen_awake: press_key('shiftright')
                         if current_count >= switch_number: break
                         print_lg("\n-@-\n")
 
+                        # Details of this job may have been fetched in the background while applying to the previous one
+                        job_id = job.get_dom_attribute('data-occludable-job-id')
+                        next_job_id = job_listings[index + 1].get_dom_attribute('data-occludable-job-id') if prefetch_next_job and index + 1 < len(job_listings) else None
+                        prefetched = job_prefetcher.take(driver, job_id) if job_prefetcher.pending(job_id) else None
+                        prefetched_description = None
+                        if prefetched:
+                            bad_word = about_company_bad_word(prefetched["about_company"]) if prefetched.get("about_company") else None
+                            # Kept for when this job is opened, the description is only checked once
+                            prefetched_description = get_job_description(prefetched["description"])
+                            description, experience_required, skip, reason, message = prefetched_description
+                            if bad_word:
+                                skip, reason, message = True, "Found Blacklisted words in About Company", f'\n"{prefetched["about_company"]}"\n\nContains "{bad_word}".'
+                            if skip and job_id not in applied_jobs and job_id not in rejected_jobs:
+                                print_lg(message, 'Skipping this job without opening it!\n')
+                                failed_job(job_id, "https://www.linkedin.com/jobs/view/"+job_id, "Pending", "Unknown", reason, message, "Skipped", "Not Available")
+                                rejected_jobs.add(job_id)
+                                if bad_word: blacklisted_companies.add(get_job_company(job))
+                                skip_count += 1
+                                job_prefetcher.early_skips += 1
+                                job_prefetcher.start(driver, next_job_id)
+                                continue
+
+                        page_load_meter.start(driver)
                         job_id,title,company,work_location,work_style,skip = get_job_main_details(job, blacklisted_companies, rejected_jobs)
+                        job_prefetcher.start(driver, next_job_id)
                         
                         if skip: continue
                         # Redundant fail safe check for applied jobs!
@@ -1004,6 +969,10 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                         except Exception as e:
                             print_lg(f'Trying to Apply to "{title} | {company}" job. Job ID: {job_id}')
 
+                        if job_gate and not job_gate(job_id):
+                            print_lg(f'"{title} | {company}" job is being handled by another browser. Job ID: {job_id}!')
+                            continue
+
                         job_link = "https://www.linkedin.com/jobs/view/"+job_id
                         application_link = "Easy Applied"
                         date_applied = "Pending"
@@ -1070,7 +1039,8 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                             print_lg("Failed to calculate the date posted!",e)
 
 
-                        description, experience_required, skip, reason, message = get_job_description()
+                        description, experience_required, skip, reason, message = prefetched_description or get_job_description()
+                        page_load_meter.stop(driver)
                         if skip:
                             print_lg(message)
                             failed_job(job_id, job_link, resume, date_listed, reason, message, "Skipped", screenshot_name)
@@ -1082,14 +1052,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                         if use_AI and description != "Unknown":
                             ##> ------ Yang Li : MARKYangL - Feature ------
                             try:
-                                if ai_provider.lower() == "openai":
-                                    skills = ai_extract_skills(aiClient, description)
-                                elif ai_provider.lower() == "deepseek":
-                                    skills = deepseek_extract_skills(aiClient, description)
-                                elif ai_provider.lower() == "gemini":
-                                    skills = gemini_extract_skills(aiClient, description)
-                                else:
-                                    skills = "In Development"
+                                skills = aiClient.extract_skills(description) if aiClient else "In Development"
                                 print_lg(f"Extracted skills using {ai_provider} AI")
                             except Exception as e:
                                 print_lg("Failed to extract skills:", e)
@@ -1099,6 +1062,8 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                         uploaded = False
                         # Case 1: Easy Apply Button
                         if try_xp(driver, ".//button[contains(@class,'jobs-apply-button') and contains(@class, 'artdeco-button--3') and contains(@aria-label, 'Easy')]"):
+                            # Answer the questions this job's form likely asks while the form is opened and paged through
+                            if aiClient: aiClient.pre_answer(skills, description)
                             try: 
                                 try:
                                     errored = ""
@@ -1115,7 +1080,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                                         if next_counter >= 15: 
                                             if pause_at_failed_question:
                                                 screenshot(driver, job_id, "Needed manual intervention for failed question")
-                                                pyautogui.alert("Couldn't answer one or more questions.\nPlease click \"Continue\" once done.\nDO NOT CLICK Back, Next or Review button in LinkedIn.\n\n\n\n\nYou can turn off \"Pause at failed question\" setting in config.py", "Help Needed", "Continue")
+                                                alert("Couldn't answer one or more questions.\nPlease click \"Continue\" once done.\nDO NOT CLICK Back, Next or Review button in LinkedIn.\n\n\n\n\nYou can turn off \"Pause at failed question\" setting in config.py", "Help Needed", "Continue")
                                                 next_counter = 1
                                                 continue
                                             if questions_list: print_lg("Stuck for one or some of the following questions...", questions_list)
@@ -1128,7 +1093,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                                         except NoSuchElementException:  next_button = modal.find_element(By.XPATH, './/button[contains(span, "Next")]')
                                         try: next_button.click()
                                         except ElementClickInterceptedException: break    # Happens when it tries to click Next button in About Company photos section
-                                        buffer(click_gap)
+                                        pace()
 
                                 except NoSuchElementException: errored = "nose"
                                 finally:
@@ -1138,7 +1103,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                                     wait_span_click(driver, "Review", 1, scrollTop=True)
                                     cur_pause_before_submit = pause_before_submit
                                     if errored != "stuck" and cur_pause_before_submit:
-                                        decision = pyautogui.confirm('1. Please verify your information.\n2. If you edited something, please return to this final screen.\n3. DO NOT CLICK "Submit Application".\n\n\n\n\nYou can turn off "Pause before submit" setting in config.py\nTo TEMPORARILY disable pausing, click "Disable Pause"', "Confirm your information",["Disable Pause", "Discard Application", "Submit Application"])
+                                        decision = confirm('1. Please verify your information.\n2. If you edited something, please return to this final screen.\n3. DO NOT CLICK "Submit Application".\n\n\n\n\nYou can turn off "Pause before submit" setting in config.py\nTo TEMPORARILY disable pausing, click "Disable Pause"', "Confirm your information",["Disable Pause", "Discard Application", "Submit Application"])
                                         if decision == "Discard Application": raise Exception("Job application discarded by user!")
                                         pause_before_submit = False if "Disable Pause" == decision else True
                                         # try_xp(modal, ".//span[normalize-space(.)='Review']")
@@ -1146,7 +1111,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                                     if wait_span_click(driver, "Submit application", 2, scrollTop=True): 
                                         date_applied = datetime.now()
                                         if not wait_span_click(driver, "Done", 2): actions.send_keys(Keys.ESCAPE).perform()
-                                    elif errored != "stuck" and cur_pause_before_submit and "Yes" in pyautogui.confirm("You submitted the application, didn't you 😒?", "Failed to find Submit Application!", ["Yes", "No"]):
+                                    elif errored != "stuck" and cur_pause_before_submit and "Yes" in confirm("You submitted the application, didn't you 😒?", "Failed to find Submit Application!", ["Yes", "No"]):
                                         date_applied = datetime.now()
                                         wait_span_click(driver, "Done", 2)
                                     else:
@@ -1177,6 +1142,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
 
                         print_lg(f'Successfully saved "{title} | {company}" job. Job ID: {job_id} info')
                         current_count += 1
+                        get_monitor().log_application()
                         if application_link == "Easy Applied": easy_applied_count += 1
                         else:   external_jobs_count += 1
                         applied_jobs.add(job_id)
@@ -1216,6 +1182,8 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                 print_lg(f"Failed to get page source, browser might have crashed. {page_source_error}")
             # print_lg(e)
 
+        wait_meter.report()
+
         
 def run(total_runs: int) -> int:
     if dailyEasyApplyLimitReached:
@@ -1239,6 +1207,22 @@ def run(total_runs: int) -> int:
 chatGPT_tab = False
 linkedIn_tab = False
 
+# Login to LinkedIn
+def perform_login() -> None:
+    '''
+    Function to make sure the browser is logged in to LinkedIn
+    * Skips loading the login page if the browser already holds a valid LinkedIn session cookie
+    '''
+    global linkedIn_tab, tabs_count
+    tabs_count = len(driver.window_handles)
+    if has_valid_session(driver):
+        print_lg("Found a valid LinkedIn session, skipping login!")
+    else:
+        driver.get("https://www.linkedin.com/login")
+        if not is_logged_in_LN(): login_LN()
+    linkedIn_tab = driver.current_window_handle
+
+
 def wait_until_next_schedule():
     if not use_scheduling or not scheduled_times:
         return
@@ -1260,13 +1244,13 @@ def wait_until_next_schedule():
 
 def main() -> None:
     try:
-        global linkedIn_tab, tabs_count, useNewResume, aiClient
+        global linkedIn_tab, tabs_count, useNewResume, aiClient, easy_applied_count, external_jobs_count, failed_count, skip_count
         alert_title = "Error Occurred. Closing Browser!"
         total_runs = 1        
         validate_config()
         
         global use_scheduling
-        mode = pyautogui.confirm("Select Bot Mode:", "LinkedIn Job Bot", ["Manual (Run Now)", "Scheduled (Timer)"])
+        mode = confirm("Select Bot Mode:", "LinkedIn Job Bot", ["Manual (Run Now)", "Scheduled (Timer)"])
         if mode == "Scheduled (Timer)":
             use_scheduling = True
             print_lg("Selected Scheduled mode. Bot will wait for specified times.")
@@ -1275,17 +1259,9 @@ def main() -> None:
             print_lg("Selected Manual mode. Bot will start applying immediately.")
 
         if not os.path.exists(default_resume_path):
-            pyautogui.alert(text='Your default resume "{}" is missing! Please update it\'s folder path "default_resume_path" in config.py\n\nOR\n\nAdd a resume with exact name and path (check for spelling mistakes including cases).\n\n\nFor now the bot will continue using your previous upload from LinkedIn!'.format(default_resume_path), title="Missing Resume", button="OK")
+            alert(text='Your default resume "{}" is missing! Please update it\'s folder path "default_resume_path" in config.py\n\nOR\n\nAdd a resume with exact name and path (check for spelling mistakes including cases).\n\n\nFor now the bot will continue using your previous upload from LinkedIn!'.format(default_resume_path), title="Missing Resume", button="OK")
             useNewResume = False
         
-        # Login to LinkedIn
-        def perform_login():
-            global linkedIn_tab, tabs_count
-            tabs_count = len(driver.window_handles)
-            driver.get("https://www.linkedin.com/login")
-            if not is_logged_in_LN(): login_LN()
-            linkedIn_tab = driver.current_window_handle
-
         # # Login to ChatGPT in a new tab for resume customization
         # if use_resume_generator:
         #     try:
@@ -1297,16 +1273,21 @@ def main() -> None:
         #         chatGPT_tab = driver.current_window_handle
         #     except Exception as e:
         #         print_lg("Opening OpenAI chatGPT tab failed!")
+        if parallel_workers > 1:
+            from modules.worker_pool import run_worker_pool
+            while True:
+                wait_until_next_schedule()
+                totals = run_worker_pool(search_terms, parallel_workers)
+                easy_applied_count += totals["easy_applied_count"]
+                external_jobs_count += totals["external_jobs_count"]
+                failed_count += totals["failed_count"]
+                skip_count += totals["skip_count"]
+                if not use_scheduling: break
+                time.sleep(61) # Skip the current minute to avoid double run
+            return
+
         if use_AI:
-            if ai_provider == "openai":
-                aiClient = ai_create_openai_client()
-            ##> ------ Yang Li : MARKYangL - Feature ------
-            # Create DeepSeek client
-            elif ai_provider == "deepseek":
-                aiClient = deepseek_create_client()
-            elif ai_provider == "gemini":
-                aiClient = gemini_create_client()
-            ##<
+            aiClient = create_ai_provider(ai_provider, user_information_all)
 
             try:
                 about_company_for_ai = " ".join([word for word in (first_name+" "+last_name).split() if len(word) > 3])
@@ -1316,12 +1297,16 @@ def main() -> None:
         
         # Start applying to jobs
         if use_scheduling:
+            # Log in once now, each cycle then only checks the session cookie of the warm browser
+            session_manager = SessionManager([default_session], lambda session: perform_login())
+            session_manager.warm_up()
             print_lg("Bot is now waiting for scheduled times...")
             while True:
                 wait_until_next_schedule()
-                perform_login()
+                session = session_manager.acquire()
                 driver.switch_to.window(linkedIn_tab)
                 total_runs = run(total_runs)
+                session_manager.release(session)
                 if dailyEasyApplyLimitReached or (easy_applied_count + external_jobs_count) >= 40: break
                 time.sleep(61) # Skip the current minute to avoid double run
         else:
@@ -1347,7 +1332,7 @@ def main() -> None:
         print_lg("Browser window closed or session is invalid. Exiting.", e)
     except Exception as e:
         critical_error_log("In Applier Main", e)
-        pyautogui.alert(e,alert_title)
+        alert(e,alert_title)
     finally:
         print_lg("\n\nTotal runs:                     {}".format(total_runs))
         print_lg("Jobs Easy Applied:              {}".format(easy_applied_count))
@@ -1356,6 +1341,11 @@ def main() -> None:
         print_lg("Total applied or collected:     {}".format(easy_applied_count + external_jobs_count))
         print_lg("\nFailed jobs:                    {}".format(failed_count))
         print_lg("Irrelevant jobs skipped:        {}\n".format(skip_count))
+        locator_cache.report()
+        page_load_meter.report()
+        job_prefetcher.report()
+        pacer.report()
+        get_cache().report()
         if randomly_answered_questions: print_lg("\n\nQuestions randomly answered:\n  {}  \n\n".format(";\n".join(str(question) for question in randomly_answered_questions)))
         quote = choice([
             "You're one step closer than before.", 
@@ -1372,28 +1362,24 @@ def main() -> None:
             "The only limit to our realization of tomorrow will be our doubts of today. - Franklin D. Roosevelt"
             ])
         msg = f"\n{quote}\n\n\nBest regards,\nOmkar Santosh Gutal\nhttps://www.linkedin.com/in/omkar-gutal-a25935249/\n\n"
-        pyautogui.alert(msg, "Exiting..")
+        alert(msg, "Exiting..")
         print_lg(msg,"Closing the browser...")
         if tabs_count >= 10:
             msg = "NOTE: IF YOU HAVE MORE THAN 10 TABS OPENED, PLEASE CLOSE OR BOOKMARK THEM!\n\nOr it's highly likely that application will just open browser and not do anything next time!" 
-            pyautogui.alert(msg,"Info")
+            alert(msg,"Info")
             print_lg("\n"+msg)
         ##> ------ Yang Li : MARKYangL - Feature ------
         if use_AI and aiClient:
             try:
-                if ai_provider.lower() == "openai":
-                    ai_close_openai_client(aiClient)
-                elif ai_provider.lower() == "deepseek":
-                    ai_close_openai_client(aiClient)
-                elif ai_provider.lower() == "gemini":
-                    pass # Gemini client does not need to be closed
+                aiClient.report()
+                get_monitor().print_summary()
+                aiClient.close()
                 print_lg(f"Closed {ai_provider} AI client.")
             except Exception as e:
                 print_lg("Failed to close AI client:", e)
         ##<
         try:
-            if driver:
-                driver.quit()
+            default_session.close()
         except WebDriverException as e:
             print_lg("Browser already closed.", e)
         except Exception as e: 
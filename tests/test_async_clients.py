@@ -0,0 +1,166 @@
+"""
+Tests of the shared AI event loop and the pooled async OpenAI-compatible client,
+against a local mock `/chat/completions` endpoint
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("openai")
+
+from modules.ai import asyncClients
+from modules.ai.asyncClients import EventLoopThread, async_openai_completion, create_async_openai_client
+
+
+RESPONSE_DELAY = 0.3        # Secs the mock endpoint takes per request
+
+
+class MockOpenAIServer(ThreadingHTTPServer):
+    """Answers every chat completion with "Yes", counting connections and concurrent requests"""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), MockOpenAIHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+
+class MockOpenAIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"       # Keep-alive, so pooled connections can be reused
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        time.sleep(RESPONSE_DELAY)
+        with self.server.lock:
+            self.server.in_flight -= 1
+        body = json.dumps({
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": "test-model",
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": "Yes"}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 5, "completion_tokens": 1, "total_tokens": 6},
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = MockOpenAIServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def loop_thread():
+    loop_thread = EventLoopThread()
+    yield loop_thread
+    loop_thread.stop()
+
+
+def make_client(loop_thread: EventLoopThread, server: MockOpenAIServer, monkeypatch, max_connections: int):
+    monkeypatch.setattr(asyncClients, "llm_api_url", server.url)
+    monkeypatch.setattr(asyncClients, "llm_api_key", "test-key")
+
+    async def create():
+        return create_async_openai_client(timeout=10, max_connections=max_connections)
+    return loop_thread.run(create())
+
+
+def ask_all(loop_thread: EventLoopThread, client, count: int) -> list:
+    messages = [{"role": "user", "content": "Are you willing to relocate?"}]
+    return loop_thread.gather(async_openai_completion(client, messages, spec="openai-like") for _ in range(count))
+
+
+def test_requests_run_concurrently(server, loop_thread, monkeypatch):
+    client = make_client(loop_thread, server, monkeypatch, max_connections=4)
+    started = time.perf_counter()
+    answers = ask_all(loop_thread, client, 4)
+    elapsed = time.perf_counter() - started
+
+    assert answers == ["Yes"] * 4
+    assert server.max_in_flight == 4
+    assert elapsed < 3 * RESPONSE_DELAY
+    loop_thread.run(client.close())
+
+
+def test_concurrency_is_capped_by_the_pool(server, loop_thread, monkeypatch):
+    client = make_client(loop_thread, server, monkeypatch, max_connections=2)
+    answers = ask_all(loop_thread, client, 6)
+
+    assert answers == ["Yes"] * 6
+    assert server.max_in_flight <= 2
+    loop_thread.run(client.close())
+
+
+def test_connections_are_reused(server, loop_thread, monkeypatch):
+    client = make_client(loop_thread, server, monkeypatch, max_connections=3)
+    ask_all(loop_thread, client, 3)
+    ask_all(loop_thread, client, 3)
+    ask_all(loop_thread, client, 3)
+
+    assert server.requests == 9
+    assert server.connections <= 3
+    loop_thread.run(client.close())
+
+
+def test_usage_is_reported(server, loop_thread, monkeypatch):
+    client = make_client(loop_thread, server, monkeypatch, max_connections=1)
+    usage = {}
+    messages = [{"role": "user", "content": "Are you willing to relocate?"}]
+    answer = loop_thread.run(async_openai_completion(client, messages, spec="openai-like", usage=usage))
+
+    assert answer == "Yes"
+    assert usage == {"prompt_tokens": 5, "completion_tokens": 1}
+    loop_thread.run(client.close())
+
+
+def test_close_stops_the_loop_thread(server, loop_thread, monkeypatch):
+    client = make_client(loop_thread, server, monkeypatch, max_connections=2)
+    ask_all(loop_thread, client, 2)
+    loop = loop_thread.loop
+    thread = loop_thread._thread
+    loop_thread.run(client.close())
+    loop_thread.stop()
+
+    assert loop.is_closed()
+    assert not thread.is_alive()
+    # Stopping twice is harmless, and the next request starts a new loop
+    loop_thread.stop()
+
+    async def answer():
+        return 42
+    assert loop_thread.run(answer()) == 42
+    assert loop_thread.loop is not loop